@@ -10,6 +10,7 @@ from app.core.database.base import Base
 from app.module.user import user as user_models
 from app.module.admin import admin as admin_models
 from app.module.gpt import gpt as gpt_setting_models
+from app.module.auth import auth as auth_models
 
 config = context.config
 if config.config_file_name is not None:
@@ -23,10 +23,112 @@ class RawEnv(BaseSettings):
 
     # API keys
     openai_api_key: Optional[str] = None
+    # OpenAI 호환 서버 주소 (테스트용 가짜 서버 등, 없으면 기본 api.openai.com)
+    openai_base_url: Optional[str] = None
+    openai_timeout: float = 60.0
 
     jwt_secret: str
     hash_key: str
 
+    # Google OAuth
+    google_client_id: Optional[str] = None
+    google_client_secret: Optional[str] = None
+    google_redirect_uri: Optional[str] = None
+
+    # CORS 허용 origin (쉼표로 구분)
+    cors_origins: str = "http://localhost:3000,http://127.0.0.1:3000"
+
+    # 응답 압축 (이보다 작은 본문은 압축하지 않음(바이트) / zlib 압축 레벨 1~9)
+    compression_min_size: int = 500
+    compression_level: int = 6
+
+    # /media 작은 파일 메모리 캐시 (전체 바이트 / 캐시할 파일 최대 크기 바이트)
+    media_cache_max_bytes: int = 32 * 1024 * 1024
+    media_cache_file_max_size: int = 256 * 1024
+
+    # 응답에 Server-Timing 헤더 추가 / /metrics 접근 토큰 (없으면 로컬은 공개, 운영은 /metrics 비활성)
+    server_timing_enabled: bool = True
+    metrics_token: Optional[str] = None
+
+    # 로그 (기본 레벨 / 모듈별 레벨 "app.module.gpt=DEBUG,sqlalchemy.engine=WARNING" / 큐 길이 / 한 번에 쓰는 개수)
+    log_level: str = "INFO"
+    log_levels: str = ""
+    log_queue_size: int = 10000
+    log_batch_size: int = 256
+
+    # 외부 API 호출용 공유 HTTP 클라이언트 (커넥션 수, keep-alive 유지 초, 타임아웃 초)
+    http_max_connections: int = 50
+    http_max_keepalive_connections: int = 20
+    http_keepalive_expiry: float = 30.0
+    http_timeout: float = 10.0
+    http_connect_timeout: float = 5.0
+
+    # 검증된 access_token 캐시 크기 (개)
+    jwt_verify_cache_size: int = 1024
+
+    # 토큰 재발급용 유저/관리자 정보 캐시 (초 / 개)
+    auth_principal_cache_ttl: float = 60.0
+    auth_principal_cache_size: int = 10000
+
+    # refresh token 폐기 목록 동기화 주기 / 만료분 정리 주기 (초)
+    auth_revocation_sync_interval: float = 2.0
+    auth_revocation_prune_interval: float = 3600.0
+
+    # 비밀번호 해시 (Argon2 비용 파라미터, memory_cost 는 KiB / 해시 전용 스레드 수)
+    argon2_time_cost: int = 3
+    argon2_memory_cost: int = 65536
+    argon2_parallelism: int = 4
+    password_hash_workers: int = 2
+
+    # GPT 설정 캐시 (초)
+    gpt_setting_cache_ttl: float = 30.0
+
+    # GPT 답변 캐시 (초 / 바이트)
+    gpt_answer_cache_ttl: float = 3600.0
+    gpt_answer_cache_max_bytes: int = 16 * 1024 * 1024
+
+    # OpenAI 파일 업로드 / 삭제 동시 실행 수
+    openai_upload_concurrency: int = 5
+    openai_delete_concurrency: int = 10
+
+    # OpenAI 호출 수락 제어 (전체 동시 실행 수, 분당 요청/토큰, 대기열 길이, 대기 제한 초)
+    openai_max_concurrency: int = 8
+    openai_requests_per_minute: int = 500
+    openai_tokens_per_minute: int = 200000
+    openai_queue_size: int = 100
+    openai_queue_timeout: float = 10.0
+    # 답변 토큰 수 추정치 (토큰 버킷 예약용)
+    openai_estimated_output_tokens: int = 800
+
+    # OpenAI 호출 재시도 (최대 시도 횟수, 첫 대기 초, 최대 대기 초 - 지터 포함 지수 백오프)
+    openai_retry_attempts: int = 3
+    openai_retry_base: float = 0.5
+    openai_retry_max_delay: float = 8.0
+
+    # 조회성 호출 헤징 (지연이 p95 를 넘으면 같은 요청을 한 번 더 보냄, 최소 대기 초)
+    openai_hedge_enabled: bool = True
+    openai_hedge_min_delay: float = 0.2
+
+    # 서킷 브레이커 (집계 구간 초, 최소 호출 수, 오류율, 열린 뒤 대기 초)
+    openai_breaker_window: float = 30.0
+    openai_breaker_min_calls: int = 10
+    openai_breaker_error_rate: float = 0.5
+    openai_breaker_cooldown: float = 15.0
+
+    # 학습 파일 업로드 크기 제한 (바이트) / 요청당 파일 수
+    gpt_upload_max_file_size: int = 100 * 1024 * 1024
+    gpt_upload_max_request_size: int = 300 * 1024 * 1024
+    gpt_upload_max_files: int = 20
+
+    # 벡터 스토어 인덱싱 백그라운드 작업
+    gpt_job_workers: int = 2
+    gpt_job_poll_interval: float = 2.0
+    gpt_job_stale_after: float = 300.0
+
+    # 파일 정리 작업 재시도 (최대 횟수, 첫 대기 초 - 이후 2배씩)
+    gpt_cleanup_max_attempts: int = 5
+    gpt_cleanup_retry_base: float = 30.0
+
     class Config:
         env_file = os.path.join(os.path.dirname(__file__), "..", "..", "..", ".env")
         env_file_encoding = "utf-8"
@@ -39,6 +141,7 @@ class Settings:
         self.BASE_DIR = Path(__file__).resolve().parent.parent.parent.parent
         self.APP_DIR = self.BASE_DIR / "app"
         self.MEDIA_ROOT = self.BASE_DIR / "media"                       
+        self.GPT_STAGING_ROOT = self.BASE_DIR / "storage" / "gpt_jobs"
 
     def _detect_env(self) -> str:
         """호스트명으로 로컬/운영 환경 구분"""
@@ -80,6 +183,14 @@ class Settings:
     @property
     def openai_api_key(self) -> Optional[str]:
         return self.raw.openai_api_key
+
+    @property
+    def openai_base_url(self) -> Optional[str]:
+        return self.raw.openai_base_url
+
+    @property
+    def openai_timeout(self) -> float:
+        return self.raw.openai_timeout
     
     @property
     def jwt_secret(self) -> str:
@@ -89,6 +200,241 @@ class Settings:
     def hash_key(self) -> str:
         return self.raw.hash_key
 
+    # ✅ Google OAuth
+    @property
+    def google_client_id(self) -> Optional[str]:
+        return self.raw.google_client_id
+
+    @property
+    def google_client_secret(self) -> Optional[str]:
+        return self.raw.google_client_secret
+
+    @property
+    def google_redirect_uri(self) -> Optional[str]:
+        return self.raw.google_redirect_uri
+
+    # ✅ CORS
+    @property
+    def cors_origins(self) -> List[str]:
+        return [origin.strip().rstrip("/") for origin in self.raw.cors_origins.split(",") if origin.strip()]
+
+    # ✅ 응답 압축
+    @property
+    def compression_min_size(self) -> int:
+        return max(0, self.raw.compression_min_size)
+
+    @property
+    def compression_level(self) -> int:
+        return min(9, max(1, self.raw.compression_level))
+
+    # ✅ /media 서빙
+    @property
+    def media_cache_max_bytes(self) -> int:
+        return max(0, self.raw.media_cache_max_bytes)
+
+    @property
+    def media_cache_file_max_size(self) -> int:
+        return max(0, self.raw.media_cache_file_max_size)
+
+    # ✅ 지표
+    @property
+    def server_timing_enabled(self) -> bool:
+        return self.raw.server_timing_enabled
+
+    @property
+    def metrics_token(self) -> Optional[str]:
+        return self.raw.metrics_token
+
+    # ✅ 로그
+    @property
+    def log_level(self) -> str:
+        return self.raw.log_level.upper()
+
+    @property
+    def log_levels(self) -> str:
+        return self.raw.log_levels
+
+    @property
+    def log_queue_size(self) -> int:
+        return max(1, self.raw.log_queue_size)
+
+    @property
+    def log_batch_size(self) -> int:
+        return max(1, self.raw.log_batch_size)
+
+    # ✅ 외부 HTTP 클라이언트
+    @property
+    def http_max_connections(self) -> int:
+        return max(1, self.raw.http_max_connections)
+
+    @property
+    def http_max_keepalive_connections(self) -> int:
+        return max(0, self.raw.http_max_keepalive_connections)
+
+    @property
+    def http_keepalive_expiry(self) -> float:
+        return self.raw.http_keepalive_expiry
+
+    @property
+    def http_timeout(self) -> float:
+        return self.raw.http_timeout
+
+    @property
+    def http_connect_timeout(self) -> float:
+        return self.raw.http_connect_timeout
+
+    @property
+    def jwt_verify_cache_size(self) -> int:
+        return max(0, self.raw.jwt_verify_cache_size)
+
+    @property
+    def auth_principal_cache_ttl(self) -> float:
+        return self.raw.auth_principal_cache_ttl
+
+    @property
+    def auth_principal_cache_size(self) -> int:
+        return max(0, self.raw.auth_principal_cache_size)
+
+    @property
+    def auth_revocation_sync_interval(self) -> float:
+        return self.raw.auth_revocation_sync_interval
+
+    @property
+    def auth_revocation_prune_interval(self) -> float:
+        return self.raw.auth_revocation_prune_interval
+
+    @property
+    def argon2_time_cost(self) -> int:
+        return self.raw.argon2_time_cost
+
+    @property
+    def argon2_memory_cost(self) -> int:
+        return self.raw.argon2_memory_cost
+
+    @property
+    def argon2_parallelism(self) -> int:
+        return self.raw.argon2_parallelism
+
+    @property
+    def password_hash_workers(self) -> int:
+        return max(1, self.raw.password_hash_workers)
+
+    # ✅ 캐시 설정
+    @property
+    def gpt_setting_cache_ttl(self) -> float:
+        return self.raw.gpt_setting_cache_ttl
+
+    @property
+    def gpt_answer_cache_ttl(self) -> float:
+        return self.raw.gpt_answer_cache_ttl
+
+    @property
+    def gpt_answer_cache_max_bytes(self) -> int:
+        return self.raw.gpt_answer_cache_max_bytes
+
+    # ✅ OpenAI 설정
+    @property
+    def openai_upload_concurrency(self) -> int:
+        return max(1, self.raw.openai_upload_concurrency)
+
+    @property
+    def openai_delete_concurrency(self) -> int:
+        return max(1, self.raw.openai_delete_concurrency)
+
+    @property
+    def openai_max_concurrency(self) -> int:
+        return max(1, self.raw.openai_max_concurrency)
+
+    @property
+    def openai_requests_per_minute(self) -> int:
+        return max(1, self.raw.openai_requests_per_minute)
+
+    @property
+    def openai_tokens_per_minute(self) -> int:
+        return max(1, self.raw.openai_tokens_per_minute)
+
+    @property
+    def openai_queue_size(self) -> int:
+        return max(0, self.raw.openai_queue_size)
+
+    @property
+    def openai_queue_timeout(self) -> float:
+        return self.raw.openai_queue_timeout
+
+    @property
+    def openai_estimated_output_tokens(self) -> int:
+        return self.raw.openai_estimated_output_tokens
+
+    @property
+    def openai_retry_attempts(self) -> int:
+        return max(1, self.raw.openai_retry_attempts)
+
+    @property
+    def openai_retry_base(self) -> float:
+        return self.raw.openai_retry_base
+
+    @property
+    def openai_retry_max_delay(self) -> float:
+        return self.raw.openai_retry_max_delay
+
+    @property
+    def openai_hedge_enabled(self) -> bool:
+        return self.raw.openai_hedge_enabled
+
+    @property
+    def openai_hedge_min_delay(self) -> float:
+        return self.raw.openai_hedge_min_delay
+
+    @property
+    def openai_breaker_window(self) -> float:
+        return self.raw.openai_breaker_window
+
+    @property
+    def openai_breaker_min_calls(self) -> int:
+        return max(1, self.raw.openai_breaker_min_calls)
+
+    @property
+    def openai_breaker_error_rate(self) -> float:
+        return self.raw.openai_breaker_error_rate
+
+    @property
+    def openai_breaker_cooldown(self) -> float:
+        return self.raw.openai_breaker_cooldown
+
+    # ✅ 업로드 제한
+    @property
+    def gpt_upload_max_file_size(self) -> int:
+        return self.raw.gpt_upload_max_file_size
+
+    @property
+    def gpt_upload_max_request_size(self) -> int:
+        return self.raw.gpt_upload_max_request_size
+
+    @property
+    def gpt_upload_max_files(self) -> int:
+        return max(1, self.raw.gpt_upload_max_files)
+
+    # ✅ 백그라운드 작업
+    @property
+    def gpt_job_workers(self) -> int:
+        return max(1, self.raw.gpt_job_workers)
+
+    @property
+    def gpt_job_poll_interval(self) -> float:
+        return self.raw.gpt_job_poll_interval
+
+    @property
+    def gpt_job_stale_after(self) -> float:
+        return self.raw.gpt_job_stale_after
+
+    @property
+    def gpt_cleanup_max_attempts(self) -> int:
+        return max(1, self.raw.gpt_cleanup_max_attempts)
+
+    @property
+    def gpt_cleanup_retry_base(self) -> float:
+        return self.raw.gpt_cleanup_retry_base
+
 # 전역 인스턴스
 settings = Settings()
 DATABASE_URL = settings.database_url
@@ -6,11 +6,14 @@ from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
 
 from app.core.config.settings import DATABASE_URL
+from app.core.metrics.database import TimedQueuePool, instrument_engine
 
 KST = pytz.timezone("Asia/Seoul")
 
 # --- ✅ DB 엔진/세션 설정 ---
-engine = create_async_engine(DATABASE_URL, echo=False, pool_pre_ping=True)
+# 풀 대기 시간 / 쿼리 실행 시간은 /metrics 와 Server-Timing 헤더로 집계
+engine = create_async_engine(DATABASE_URL, echo=False, pool_pre_ping=True, poolclass=TimedQueuePool)
+instrument_engine(engine)
 
 SessionLocal = sessionmaker(
     autocommit=False,
@@ -0,0 +1,38 @@
+# app/core/http/client.py
+# 역할: 외부 API(구글 OAuth 등) 호출용 앱 수명 동안 공유하는 httpx 클라이언트
+
+import httpx
+
+from app.core.config.settings import settings
+
+
+class SharedHttpClient:
+    """커넥션 풀을 재사용하는 httpx.AsyncClient 하나를 앱 전체에서 공유
+
+    - 요청마다 클라이언트를 만들면 매번 TCP/TLS 핸드셰이크를 새로 함 -> keep-alive 로 재사용
+    - 처음 쓸 때 만들고, 앱 종료(lifespan) 시 close()
+    """
+
+    def __init__(self):
+        self._client: httpx.AsyncClient | None = None
+
+    def get(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=settings.http_max_connections,
+                    max_keepalive_connections=settings.http_max_keepalive_connections,
+                    keepalive_expiry=settings.http_keepalive_expiry,
+                ),
+                timeout=httpx.Timeout(settings.http_timeout, connect=settings.http_connect_timeout),
+            )
+        return self._client
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+# 전역 인스턴스 (워커 프로세스마다 하나)
+http_client = SharedHttpClient()
@@ -0,0 +1,59 @@
+# app/core/http/etag.py
+# 역할: 조건부 GET(ETag / If-None-Match) 처리용 헬퍼
+
+import hashlib
+
+from fastapi import Request, Response
+from fastapi.responses import JSONResponse
+
+# 인증된 응답이므로 공유 캐시 X, 브라우저는 매번 재검증
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts) -> str:
+    """값들의 repr 을 해시해서 strong ETag 생성"""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(repr(part).encode("utf-8"))
+        digest.update(b"\x1f")
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+def row_etag(row) -> str:
+    """ORM 행의 id, created_at, 전체 컬럼 값으로 ETag 생성 (JSON 직렬화 없이)"""
+    values = tuple(getattr(row, column.key) for column in row.__table__.columns)
+    return make_etag(row.id, getattr(row, "created_at", None), values)
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """If-None-Match 헤더가 etag 와 일치하는지 확인"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL})
+
+
+def conditional_json(request: Request, etag: str, build_content) -> Response:
+    """etag 가 맞으면 304, 아니면 build_content() 결과를 JSON 으로 응답
+
+    build_content 는 304 경로에서 호출되지 않으므로 직렬화 비용을 건너뜀
+    """
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    return JSONResponse(
+        status_code=200,
+        content=build_content(),
+        headers={"ETag": etag, "Cache-Control": CACHE_CONTROL},
+    )
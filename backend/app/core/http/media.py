@@ -0,0 +1,346 @@
+# app/core/http/media.py
+# 역할: /media 정적 파일 서빙 (캐시 헤더, 조건부 GET 304, Range, gzip 변형, 작은 파일 메모리 캐시, zero-copy 전송)
+
+import mimetypes
+import os
+import re
+import stat
+import zlib
+from collections import OrderedDict
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+
+import anyio
+
+from app.core.config.settings import settings
+from app.core.middleware.compression import WBITS, is_compressible, negotiate
+
+# 파일명에 내용 해시가 들어간 경우 (app.3f2a9c1b.js, logo-5d41402abc4b.png) -> 내용이 바뀌면 이름도 바뀜
+# 소문자 hex 이면서 a-f 가 하나 이상 있어야 함 - report-20240101.pdf, profile-1700000000.png 처럼
+# 날짜/타임스탬프가 붙은 이름은 같은 이름으로 덮어쓸 수 있으므로 immutable 로 두지 않음
+# (숫자로만 된 해시는 재검증 캐시로 처리될 뿐이라 안전한 쪽으로 틀림)
+HASHED_NAME = re.compile(r"[.-](?=[0-9a-f]*[a-f])[0-9a-f]{8,}\.[A-Za-z0-9]+$")
+IMMUTABLE_CACHE_CONTROL = b"public, max-age=31536000, immutable"
+# 해시 없는 파일은 캐시하되 매번 ETag 로 재검증
+REVALIDATE_CACHE_CONTROL = b"public, no-cache"
+
+CHUNK_SIZE = 64 * 1024
+
+
+class MediaCache:
+    """작은 파일 내용 LRU 캐시 (전체 크기 max_bytes 제한)
+
+    키는 (경로, 인코딩) - 원본 바이트는 인코딩 None, 메모리에서 압축한 변형은 인코딩별로 따로 저장
+    항목은 (mtime_ns, size, inode) 스탬프와 같이 저장 -> stat 결과가 다르면 다시 읽음
+    """
+
+    def __init__(self, max_bytes: int, file_max_size: int):
+        self.max_bytes = max_bytes
+        self.file_max_size = min(file_max_size, max_bytes)
+        self._entries: OrderedDict = OrderedDict()  # (path, encoding) -> (stamp, data)
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: tuple, stamp: tuple) -> bytes | None:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] != stamp:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key: tuple, stamp: tuple, data: bytes):
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.bytes -= len(old[1])
+        self._entries[key] = (stamp, data)
+        self.bytes += len(data)
+        while self.bytes > self.max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self.bytes -= len(evicted)
+            self.evictions += 1
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "entries": len(self._entries),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            "evictions": self.evictions,
+        }
+
+
+def _route_path(scope) -> str:
+    """Mount 아래에서의 경로 (root_path 제외)"""
+    path, root_path = scope["path"], scope.get("root_path", "")
+    if root_path and path.startswith(root_path):
+        return path[len(root_path):]
+    return path
+
+
+def _parse_range(header: bytes, size: int) -> tuple[int, int] | None | bool:
+    """단일 범위 bytes=a-b / a- / -n -> (start, end 포함)
+
+    여러 범위나 해석할 수 없는 값은 None (전체 응답), 만족할 수 없는 범위는 False (416)
+    """
+    unit, _, spec = header.decode("latin-1").partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    first, _, last = spec.strip().partition("-")
+    try:
+        if not first:
+            length = int(last)
+            if length <= 0:
+                return False
+            return max(0, size - length), size - 1
+        start = int(first)
+        end = int(last) if last else size - 1
+    except ValueError:
+        return None
+    if start >= size or end < start:
+        return False
+    return start, min(end, size - 1)
+
+
+def _etag(st: os.stat_result, encoding: str | None = None) -> bytes:
+    """파일 stat 기반 strong ETag - 압축 변형은 인코딩을 붙여서 원본과 구분"""
+    suffix = f"-{encoding}" if encoding else ""
+    return f'"{st.st_mtime_ns:x}-{st.st_size:x}{suffix}"'.encode("latin-1")
+
+
+def _stamp(st: os.stat_result) -> tuple:
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
+
+class MediaFiles:
+    """StaticFiles 대신 쓰는 /media ASGI 앱
+
+    - 해시가 들어간 파일명은 1년 immutable, 나머지는 no-cache + ETag/Last-Modified 재검증
+    - If-None-Match / If-Modified-Since 가 맞으면 304 (본문을 읽지 않음)
+    - 단일 Range 요청은 206 (If-Range 가 안 맞으면 전체), 만족할 수 없으면 416
+    - 압축되는 형식은 Accept-Encoding 에 맞는 변형으로 응답 (Range 요청은 항상 원본)
+      옆에 원본보다 오래되지 않은 .gz 가 있으면 그 파일을, 없으면 작은 파일은 메모리에서 압축해서
+      인코딩별로 캐시 -> 변형마다 ETag 가 따로 있어서 304 / 캐시 헤더가 원본과 같게 동작
+    - file_max_size 이하 파일은 MediaCache 에서 바로 응답, 큰 파일은 서버가 지원하면
+      http.response.zerocopy / pathsend 확장으로 커널에 넘기고 아니면 청크 단위로 읽어서 전송
+      (큰 파일의 압축은 CompressionMiddleware 가 스트리밍으로 처리)
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        cache_max_bytes: int,
+        cache_file_max_size: int,
+        compress_min_size: int = 500,
+        compress_level: int = 6,
+    ):
+        self.directory = Path(directory).resolve()
+        self.cache = MediaCache(cache_max_bytes, cache_file_max_size)
+        self.compress_min_size = compress_min_size
+        self.compress_level = compress_level
+
+    async def __call__(self, scope, receive, send):
+        method = scope["method"]
+        if method not in ("GET", "HEAD"):
+            await self._plain(send, 405, b"Method Not Allowed", [(b"allow", b"GET, HEAD")])
+            return
+
+        path = self._resolve(_route_path(scope))
+        try:
+            st = os.stat(path) if path else None
+        except OSError:
+            st = None
+        if st is None or not stat.S_ISREG(st.st_mode):
+            await self._plain(send, 404, b"Not Found")
+            return
+
+        request_headers = {}
+        for name, value in scope["headers"]:
+            if name in (b"if-none-match", b"if-modified-since", b"range", b"if-range", b"accept-encoding"):
+                request_headers[name] = value
+
+        media_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+        if media_type.startswith("text/") or media_type == "application/javascript":
+            media_type += "; charset=utf-8"
+        content_type = media_type.encode("latin-1")
+        compressible = is_compressible(content_type)
+
+        # 보낼 변형: 파일 경로 / 그 파일의 stat / 메모리에서 압축할 인코딩 / Content-Encoding
+        serve_path, serve_st, encode_with, content_encoding = path, st, None, None
+        accept_encoding = request_headers.get(b"accept-encoding")
+        if compressible and accept_encoding and b"range" not in request_headers:
+            encoding = negotiate(accept_encoding)
+            precompressed = self._precompressed(path, st) if encoding == "gzip" else None
+            if precompressed is not None:
+                (serve_path, serve_st), content_encoding = precompressed, "gzip"
+            elif encoding and self.compress_min_size <= st.st_size <= self.cache.file_max_size:
+                encode_with = content_encoding = encoding
+
+        etag = _etag(serve_st, content_encoding)
+        last_modified = formatdate(serve_st.st_mtime, usegmt=True).encode("latin-1")
+        cache_control = IMMUTABLE_CACHE_CONTROL if HASHED_NAME.search(path) else REVALIDATE_CACHE_CONTROL
+        headers = [
+            (b"etag", etag),
+            (b"last-modified", last_modified),
+            (b"cache-control", cache_control),
+        ]
+        if content_encoding is None:
+            headers.append((b"accept-ranges", b"bytes"))
+        if compressible:
+            headers.append((b"vary", b"Accept-Encoding"))
+
+        if self._not_modified(request_headers, etag, serve_st.st_mtime):
+            await send({"type": "http.response.start", "status": 304, "headers": headers})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        headers.append((b"content-type", content_type))
+        if content_encoding is not None:
+            headers.append((b"content-encoding", content_encoding.encode("latin-1")))
+
+        if encode_with is not None:
+            data = await self._encoded(path, st, encode_with)
+            headers.append((b"content-length", str(len(data)).encode("latin-1")))
+            await send({"type": "http.response.start", "status": 200, "headers": headers})
+            await send({"type": "http.response.body", "body": b"" if method == "HEAD" else data})
+            return
+
+        size = serve_st.st_size
+        start, end, status = 0, size - 1, 200
+        http_range = request_headers.get(b"range")
+        if http_range is not None and self._range_applies(request_headers.get(b"if-range"), etag, last_modified):
+            parsed = _parse_range(http_range, size)
+            if parsed is False:
+                await self._plain(send, 416, b"", [(b"content-range", f"bytes */{size}".encode("latin-1"))])
+                return
+            if parsed is not None:
+                start, end = parsed
+                status = 206
+                headers.append((b"content-range", f"bytes {start}-{end}/{size}".encode("latin-1")))
+        length = end - start + 1 if size else 0
+        headers.append((b"content-length", str(length).encode("latin-1")))
+
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        if method == "HEAD" or not length:
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        if size <= self.cache.file_max_size:
+            key, stamp = (serve_path, None), _stamp(serve_st)
+            data = self.cache.get(key, stamp)
+            if data is None:
+                data = await anyio.to_thread.run_sync(Path(serve_path).read_bytes)
+                # stat 이후에 파일이 바뀌었으면 캐시하지 않음
+                if len(data) == size:
+                    self.cache.set(key, stamp, data)
+            await send({"type": "http.response.body", "body": data[start:end + 1]})
+            return
+
+        extensions = scope.get("extensions") or {}
+        if "http.response.zerocopy" in extensions:
+            with open(serve_path, "rb") as file:
+                await send({"type": "http.response.zerocopy", "file": file, "offset": start, "count": length})
+            return
+        if status == 200 and "http.response.pathsend" in extensions:
+            await send({"type": "http.response.pathsend", "path": serve_path})
+            return
+        await self._send_chunks(send, serve_path, start, length)
+
+    def _precompressed(self, path: str, st: os.stat_result) -> tuple[str, os.stat_result] | None:
+        """옆에 미리 만들어 둔 path.gz 의 (경로, stat) - 없거나 원본보다 오래됐으면 None"""
+        gz_path = self._resolve(os.path.relpath(path, self.directory) + ".gz")
+        try:
+            gz_st = os.stat(gz_path) if gz_path else None
+        except OSError:
+            return None
+        if gz_st is None or not stat.S_ISREG(gz_st.st_mode) or gz_st.st_mtime_ns < st.st_mtime_ns:
+            return None
+        return gz_path, gz_st
+
+    async def _encoded(self, path: str, st: os.stat_result, encoding: str) -> bytes:
+        """메모리에서 압축한 변형 - 원본 stamp 가 같으면 캐시에서 (압축은 파일당 한 번)"""
+        key, stamp = (path, encoding), _stamp(st)
+        data = self.cache.get(key, stamp)
+        if data is None:
+            size, data = await anyio.to_thread.run_sync(self._compress_file, path, encoding, self.compress_level)
+            # stat 이후에 파일이 바뀌었으면 캐시하지 않음
+            if size == st.st_size:
+                self.cache.set(key, stamp, data)
+        return data
+
+    @staticmethod
+    def _compress_file(path: str, encoding: str, level: int) -> tuple[int, bytes]:
+        raw = Path(path).read_bytes()
+        compressor = zlib.compressobj(level, zlib.DEFLATED, WBITS[encoding])
+        return len(raw), compressor.compress(raw) + compressor.flush()
+
+    def _resolve(self, route_path: str) -> str | None:
+        """media 디렉터리 밖을 가리키는 경로(.. 등)는 None"""
+        target = os.path.realpath(os.path.join(self.directory, route_path.lstrip("/")))
+        if not target.startswith(str(self.directory) + os.sep):
+            return None
+        return target
+
+    @staticmethod
+    def _not_modified(request_headers: dict, etag: bytes, mtime: float) -> bool:
+        if_none_match = request_headers.get(b"if-none-match")
+        if if_none_match is not None:
+            # If-None-Match 가 있으면 If-Modified-Since 는 무시 (RFC 9110)
+            if if_none_match.strip() == b"*":
+                return True
+            return any(
+                candidate.strip().removeprefix(b"W/") == etag for candidate in if_none_match.split(b",")
+            )
+        if_modified_since = request_headers.get(b"if-modified-since")
+        if if_modified_since is not None:
+            try:
+                since = parsedate_to_datetime(if_modified_since.decode("latin-1")).timestamp()
+            except (TypeError, ValueError):
+                return False
+            return int(mtime) <= since
+        return False
+
+    @staticmethod
+    def _range_applies(if_range: bytes | None, etag: bytes, last_modified: bytes) -> bool:
+        return if_range is None or if_range == etag or if_range == last_modified
+
+    @staticmethod
+    async def _send_chunks(send, path: str, start: int, length: int):
+        async with await anyio.open_file(path, "rb") as file:
+            await file.seek(start)
+            remaining = length
+            while remaining > 0:
+                chunk = await file.read(min(CHUNK_SIZE, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                await send({"type": "http.response.body", "body": chunk, "more_body": remaining > 0})
+            if remaining > 0:
+                # 전송 중 파일이 줄어든 경우에도 응답은 끝냄
+                await send({"type": "http.response.body", "body": b""})
+
+    @staticmethod
+    async def _plain(send, status: int, body: bytes, headers: list | None = None):
+        headers = [
+            *(headers or []),
+            (b"content-type", b"text/plain; charset=utf-8"),
+            (b"content-length", str(len(body)).encode("latin-1")),
+        ]
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
+
+
+# 전역 인스턴스 (워커 프로세스마다 하나)
+media_files = MediaFiles(
+    settings.MEDIA_ROOT,
+    cache_max_bytes=settings.media_cache_max_bytes,
+    cache_file_max_size=settings.media_cache_file_max_size,
+    compress_min_size=settings.compression_min_size,
+    compress_level=settings.compression_level,
+)
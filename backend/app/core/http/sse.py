@@ -0,0 +1,25 @@
+# app/core/http/sse.py
+# 역할: Server-Sent Events 응답 헬퍼
+
+import json
+
+from fastapi.responses import StreamingResponse
+
+# 프록시(nginx) 버퍼링을 끄고 캐시하지 않도록
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no",
+}
+
+
+def sse_event(data, event: str | None = None) -> str:
+    """SSE 이벤트 한 개 직렬화 (data 는 JSON 으로 인코딩)"""
+    payload = json.dumps(data, ensure_ascii=False)
+    if event:
+        return f"event: {event}\ndata: {payload}\n\n"
+    return f"data: {payload}\n\n"
+
+
+def sse_response(events) -> StreamingResponse:
+    """events: sse_event() 문자열을 내보내는 async iterator"""
+    return StreamingResponse(events, media_type="text/event-stream", headers=SSE_HEADERS)
@@ -0,0 +1,184 @@
+# app/core/log/logger.py
+# 역할: JSON 구조화 로그 - 기록 시점에 한 줄로 포맷해서 큐에 넣고, 별도 스레드가 묶어서 출력 (이벤트 루프는 I/O 를 기다리지 않음)
+
+import json
+import logging
+import queue
+import re
+import sys
+import threading
+import time
+import traceback
+from contextvars import ContextVar
+
+from app.core.config.settings import settings
+
+# 요청 단위 상관관계 id (RequestIdMiddleware 가 설정)
+request_id_var: ContextVar[str | None] = ContextVar("request_id", default=None)
+
+# 값을 가릴 필드 이름 (extra={...} 의 키를 snake_case 로 바꾼 뒤 이름 전체 또는 "_" 뒤 접미사로 일치)
+# password, access_token, set_cookie 는 가리고 tokens, max_tokens, sha256 같은 값은 그대로 남김
+SECRET_KEYS = re.compile(
+    r"(?:^|_)(?:pass(?:word|wd)?|secrets?|token|api_?key|hash_key|secret_key|private_key"
+    r"|authorization|cookies?|hash|credentials?)$"
+)
+# 메시지 안에 섞여 들어온 비밀 값
+SECRET_PATTERNS = (
+    re.compile(r"(?i)\bbearer\s+[\w.~+/-]+=*"),
+    re.compile(r"\beyJ[\w-]+\.[\w-]+\.[\w-]+"),  # JWT
+    re.compile(r"\bsk-[\w-]{16,}"),  # OpenAI API key
+    re.compile(r"\$argon2[\w$=,+/.-]+"),  # 비밀번호 해시
+    re.compile(r"(?i)\b(password|secret|token|api_key|client_secret)=[^\s&,;]+"),
+)
+REDACTED = "[REDACTED]"
+
+# LogRecord 기본 속성 - 이 외의 속성은 extra 로 넘어온 필드로 보고 JSON 에 포함
+_RECORD_ATTRS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "request_id"}
+_STOP = object()
+
+
+def redact_text(text: str) -> str:
+    for pattern in SECRET_PATTERNS:
+        text = pattern.sub(REDACTED, text)
+    return text
+
+
+def is_secret_key(key: str) -> bool:
+    """accessToken / Set-Cookie / API_KEY 같은 표기도 snake_case 로 맞춰서 비교"""
+    key = re.sub(r"(?<=[a-z0-9])(?=[A-Z])", "_", key).lower().replace("-", "_")
+    return SECRET_KEYS.search(key) is not None
+
+
+def redact_value(key: str, value):
+    if is_secret_key(key):
+        return REDACTED
+    if isinstance(value, str):
+        return redact_text(value)
+    if isinstance(value, dict):
+        return {k: redact_value(str(k), v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [redact_value(key, v) for v in value]
+    return value
+
+
+class JsonFormatter(logging.Formatter):
+    """한 줄 JSON: ts, level, logger, msg, request_id, extra 필드, exc (비밀 값은 가림)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "ts": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(record.created)) + f".{int(record.msecs):03d}",
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": redact_text(record.getMessage()),
+        }
+        request_id = getattr(record, "request_id", None)
+        if request_id:
+            data["request_id"] = request_id
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS:
+                data[key] = redact_value(key, value)
+        if record.exc_info:
+            data["exc"] = redact_text("".join(traceback.format_exception(*record.exc_info)).rstrip())
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+
+class AsyncQueueHandler(logging.Handler):
+    """emit 은 레코드를 한 줄로 포맷해서 큐에 넣기만 함 - 쓰기는 writer 스레드에서 배치로
+
+    - 포맷(extra 필드, exc_info 트레이스백 포함)은 기록한 쪽에서 바로 함
+      (logging.handlers.QueueHandler.prepare 와 같은 이유 - 나중에 바뀌는 extra 객체나
+      다른 스레드에서 트레이스백 프레임을 읽는 문제 없이 기록 시점의 값이 남음)
+    - 큐가 가득 차면 기다리지 않고 버린 뒤 개수를 세고, 다음 배치에 경고 한 줄 남김
+    """
+
+    def __init__(self, stream=None, queue_size: int = 10000, batch_size: int = 256):
+        super().__init__()
+        self.stream = stream or sys.stdout
+        self.batch_size = batch_size
+        self.queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self.dropped = 0
+        self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self._thread.start()
+
+    def emit(self, record: logging.LogRecord):
+        # handle() 이 self.lock 을 잡은 상태로 호출 - dropped 는 writer 스레드도 같은 락으로 읽고 비움
+        try:
+            record.request_id = request_id_var.get()
+            self.queue.put_nowait(self.format(record))
+        except queue.Full:
+            self.dropped += 1
+        except Exception:
+            self.handleError(record)
+
+    def _run(self):
+        while True:
+            batch = [self.queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = _STOP in batch
+            lines = [item for item in batch if item is not _STOP]
+            with self.lock:
+                dropped, self.dropped = self.dropped, 0
+            if dropped:
+                lines.append(json.dumps({"level": "WARNING", "logger": __name__, "msg": f"dropped {dropped} log records (queue full)"}))
+            if lines:
+                try:
+                    self.stream.write("\n".join(lines) + "\n")
+                    self.stream.flush()
+                except Exception:
+                    pass
+            if stop:
+                return
+
+    def close(self):
+        """남은 레코드를 모두 쓰고 writer 스레드 종료"""
+        if self._thread.is_alive():
+            self.queue.put(_STOP)
+            self._thread.join(timeout=5)
+        super().close()
+
+
+def parse_levels(spec: str) -> dict[str, str]:
+    """"app.module.gpt=DEBUG,sqlalchemy.engine=WARNING" -> {logger 이름: 레벨}"""
+    levels = {}
+    for part in spec.split(","):
+        name, _, level = part.partition("=")
+        if name.strip() and level.strip():
+            levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+_handler: AsyncQueueHandler | None = None
+
+
+def setup_logging():
+    """루트 로거를 JSON 큐 핸들러 하나로 구성 (여러 번 불러도 한 번만)
+
+    uvicorn 로거도 자체 핸들러를 떼고 루트로 올려서 같은 형식/같은 스레드로 출력
+    """
+    global _handler
+    if _handler is not None:
+        return
+    _handler = AsyncQueueHandler(queue_size=settings.log_queue_size, batch_size=settings.log_batch_size)
+    _handler.setFormatter(JsonFormatter())
+
+    root = logging.getLogger()
+    root.handlers = [_handler]
+    root.setLevel(settings.log_level)
+    for name in ("uvicorn", "uvicorn.error", "uvicorn.access"):
+        uvicorn_logger = logging.getLogger(name)
+        uvicorn_logger.handlers = []
+        uvicorn_logger.propagate = True
+    for name, level in parse_levels(settings.log_levels).items():
+        logging.getLogger(name).setLevel(level)
+
+
+def shutdown_logging():
+    global _handler
+    if _handler is not None:
+        logging.getLogger().removeHandler(_handler)
+        _handler.close()
+        _handler = None
@@ -0,0 +1,45 @@
+# app/core/metrics/database.py
+# 역할: SQLAlchemy 엔진 계측 - 쿼리 실행 시간 / 커넥션 풀 대기 시간
+
+import time
+
+from sqlalchemy import event
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.core.metrics.timing import record_db_query, record_pool_wait
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """풀에서 커넥션을 꺼내는 데 걸린 시간을 기록하는 풀 (새 커넥션 연결 시간 포함)"""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            record_pool_wait(time.perf_counter() - started)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info.get("query_started")
+    if started:
+        record_db_query(time.perf_counter() - started.pop())
+
+
+def _handle_error(exception_context):
+    # 실패한 쿼리는 after_cursor_execute 가 불리지 않으므로 시작 시각만 정리
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_started"):
+        conn.info["query_started"].pop()
+
+
+def instrument_engine(engine):
+    """async 엔진의 sync_engine 에 커서 실행 이벤트 등록"""
+    sync_engine = getattr(engine, "sync_engine", engine)
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "handle_error", _handle_error)
@@ -0,0 +1,27 @@
+# app/core/metrics/metrics_router.py
+# 역할: Prometheus 수집용 /metrics 엔드포인트
+
+import hmac
+
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import PlainTextResponse
+
+from app.core.config.settings import settings
+from app.core.metrics.registry import metrics
+
+router = APIRouter()
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get("/metrics", include_in_schema=False)
+async def get_metrics(request: Request):
+    # METRICS_TOKEN 이 설정돼 있으면 Authorization: Bearer <토큰> 필요
+    # 운영에서 토큰이 없으면 라우트/지표가 외부에 노출되지 않도록 없는 경로처럼 응답
+    if settings.env == "prod" and not settings.metrics_token:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if settings.metrics_token:
+        expected = f"Bearer {settings.metrics_token}"
+        if not hmac.compare_digest(request.headers.get("authorization", ""), expected):
+            raise HTTPException(status_code=401, detail="invalid metrics token")
+    return PlainTextResponse(metrics.render(), media_type=PROMETHEUS_CONTENT_TYPE)
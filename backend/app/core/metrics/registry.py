@@ -0,0 +1,169 @@
+# app/core/metrics/registry.py
+# 역할: 프로세스 로컬 지표(카운터/히스토그램) 보관 및 Prometheus 텍스트 형식 출력
+
+import bisect
+
+# 요청/쿼리/upstream 지연 히스토그램 기본 구간 (초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+INF_LABEL = 'le="+Inf"'
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: tuple, values: tuple, extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """라벨 값 조합별로 누적되는 카운터"""
+
+    type = "counter"
+
+    def __init__(self, name: str, help: str, labels: tuple = ()):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self._values: dict[tuple, float] = {}
+
+    def inc(self, *label_values, amount: float = 1):
+        self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def render(self) -> list[str]:
+        return [
+            f"{self.name}{_labels(self.labels, values)} {_number(value)}"
+            for values, value in self._values.items()
+        ]
+
+
+class Histogram:
+    """라벨 값 조합별 누적 구간 히스토그램 (구간 개수 고정, 관측은 O(log 구간 수))"""
+
+    type = "histogram"
+
+    def __init__(self, name: str, help: str, labels: tuple = (), buckets: tuple = DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.buckets = tuple(sorted(buckets))
+        self._series: dict[tuple, list] = {}  # label values -> [구간별 개수..., 합, 개수]
+
+    def observe(self, value: float, *label_values):
+        series = self._series.get(label_values)
+        if series is None:
+            series = self._series[label_values] = [0] * (len(self.buckets) + 2)
+        index = bisect.bisect_left(self.buckets, value)
+        if index < len(self.buckets):
+            series[index] += 1
+        series[-2] += value
+        series[-1] += 1
+
+    def render(self) -> list[str]:
+        lines = []
+        for values, series in self._series.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets, series):
+                cumulative += count
+                le = f'le="{_number(float(bound))}"'
+                lines.append(f"{self.name}_bucket{_labels(self.labels, values, le)} {cumulative}")
+            lines.append(f"{self.name}_bucket{_labels(self.labels, values, INF_LABEL)} {series[-1]}")
+            lines.append(f"{self.name}_sum{_labels(self.labels, values)} {_number(float(series[-2]))}")
+            lines.append(f"{self.name}_count{_labels(self.labels, values)} {series[-1]}")
+        return lines
+
+
+class MetricsRegistry:
+    """지표 목록 + 조회 시점에 값을 읽어 오는 게이지(stats 함수)
+
+    register_stats(component, fn): fn() 이 돌려주는 dict 의 숫자 값을
+    app_stat{component="...",field="..."} 게이지로 출력 (캐시/대기열 stats() 재사용)
+    """
+
+    def __init__(self):
+        self._metrics: list = []
+        self._stats: dict = {}
+        self._gauges: dict[str, tuple] = {}  # name -> (help, fn -> [(labels dict, value)])
+
+    def counter(self, name: str, help: str, labels: tuple = ()) -> Counter:
+        metric = Counter(name, help, labels)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(self, name: str, help: str, labels: tuple = (), buckets: tuple = DEFAULT_BUCKETS) -> Histogram:
+        metric = Histogram(name, help, labels, buckets)
+        self._metrics.append(metric)
+        return metric
+
+    def gauge(self, name: str, help: str, fn):
+        """fn() -> [(라벨 dict, 값)] 을 조회 시점에 읽는 게이지"""
+        self._gauges[name] = (help, fn)
+
+    def register_stats(self, component: str, fn):
+        self._stats[component] = fn
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            lines.extend(metric.render())
+
+        for name, (help, fn) in self._gauges.items():
+            lines.append(f"# HELP {name} {help}")
+            lines.append(f"# TYPE {name} gauge")
+            for labels, value in fn():
+                lines.append(f"{name}{_labels(tuple(labels), tuple(labels.values()))} {_number(value)}")
+
+        if self._stats:
+            lines.append("# HELP app_stat Component stats (caches, queues, circuit breaker)")
+            lines.append("# TYPE app_stat gauge")
+            for component, fn in self._stats.items():
+                for field, value in _flatten(fn()):
+                    labels = _labels(("component", "field"), (component, field))
+                    lines.append(f"app_stat{labels} {_number(value)}")
+        return "\n".join(lines) + "\n"
+
+
+def _flatten(stats: dict, prefix: str = ""):
+    """중첩 dict 의 숫자 값만 (a_b, 값) 으로 펼침 (bool 은 0/1, 문자열은 건너뜀)"""
+    for key, value in stats.items():
+        field = f"{prefix}{key}"
+        if isinstance(value, dict):
+            yield from _flatten(value, f"{field}_")
+        elif isinstance(value, bool):
+            yield field, int(value)
+        elif isinstance(value, (int, float)):
+            yield field, value
+
+
+# 전역 인스턴스 (워커 프로세스마다 하나)
+metrics = MetricsRegistry()
+
+http_requests = metrics.counter(
+    "http_requests_total", "HTTP requests by route and status", ("method", "route", "status")
+)
+http_request_duration = metrics.histogram(
+    "http_request_duration_seconds", "Time until the response body finished, per route", ("method", "route")
+)
+http_request_db_queries = metrics.counter(
+    "http_request_db_queries_total", "DB queries issued while handling requests, per route", ("method", "route")
+)
+db_query_duration = metrics.histogram("db_query_duration_seconds", "DB cursor execute time")
+db_pool_wait = metrics.histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a pooled DB connection",
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0),
+)
+upstream_duration = metrics.histogram(
+    "openai_request_duration_seconds", "OpenAI API call time per attempt", ("op", "outcome")
+)
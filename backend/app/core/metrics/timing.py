@@ -0,0 +1,83 @@
+# app/core/metrics/timing.py
+# 역할: 요청 하나가 DB / OpenAI 에서 쓴 시간을 모으는 컨텍스트 (Server-Timing 헤더 + 지표 집계용)
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from app.core.metrics.registry import db_pool_wait, db_query_duration, upstream_duration
+
+
+class RequestTiming:
+    """요청 처리 중 누적된 시간(초)과 횟수
+
+    TimingMiddleware 가 요청마다 만들어서 current_timing 에 넣음
+    - 같은 요청에서 만든 태스크(스트리밍 생성 등)는 컨텍스트를 복사하므로 같은 객체에 누적
+    - 요청 밖(백그라운드 작업)에서는 current_timing 이 None -> 전역 지표에만 반영
+    """
+
+    __slots__ = ("started", "db", "db_count", "pool_wait", "upstream", "upstream_count")
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.db = 0.0
+        self.db_count = 0
+        self.pool_wait = 0.0
+        self.upstream = 0.0
+        self.upstream_count = 0
+
+    def server_timing(self) -> bytes:
+        """Server-Timing 헤더 값 (ms) - app 은 전체 시간에서 db/upstream 을 뺀 나머지"""
+        total = time.perf_counter() - self.started
+        app = max(0.0, total - self.db - self.pool_wait - self.upstream)
+        return (
+            f'db;dur={self.db * 1000:.1f};desc="{self.db_count} queries", '
+            f"pool;dur={self.pool_wait * 1000:.1f}, "
+            f'upstream;dur={self.upstream * 1000:.1f};desc="{self.upstream_count} calls", '
+            f"app;dur={app * 1000:.1f}"
+        ).encode("latin-1")
+
+
+current_timing: ContextVar[RequestTiming | None] = ContextVar("request_timing", default=None)
+
+
+def record_db_query(elapsed: float):
+    db_query_duration.observe(elapsed)
+    timing = current_timing.get()
+    if timing is not None:
+        timing.db += elapsed
+        timing.db_count += 1
+
+
+def record_pool_wait(elapsed: float):
+    db_pool_wait.observe(elapsed)
+    timing = current_timing.get()
+    if timing is not None:
+        timing.pool_wait += elapsed
+
+
+@contextmanager
+def track_upstream(op: str):
+    """OpenAI 호출 한 번(재시도/헤징 시도 하나)의 시간을 op / 성공 여부별로 기록"""
+    started = time.perf_counter()
+    outcome = "error"
+    try:
+        yield
+        outcome = "ok"
+    finally:
+        elapsed = time.perf_counter() - started
+        upstream_duration.observe(elapsed, op, outcome)
+        timing = current_timing.get()
+        if timing is not None:
+            timing.upstream += elapsed
+            timing.upstream_count += 1
+
+
+def timed(op: str, fn):
+    """async 함수 fn 을 호출할 때마다 track_upstream(op) 으로 감싸는 함수로 변환"""
+
+    async def call(*args, **kwargs):
+        with track_upstream(op):
+            return await fn(*args, **kwargs)
+
+    return call
@@ -0,0 +1,200 @@
+# 역할: 응답 본문 gzip/deflate 압축 미들웨어 (스트리밍 응답은 조각마다 압축 후 flush)
+
+import zlib
+from functools import lru_cache
+
+from fastapi import FastAPI
+
+from app.core.config.settings import settings
+
+# 이미 압축된 형식 - 다시 압축해도 크기는 그대로이고 CPU 만 씀
+COMPRESSED_TYPES = (
+    "image/",
+    "video/",
+    "audio/",
+    "font/woff",
+    "application/zip",
+    "application/gzip",
+    "application/x-gzip",
+    "application/x-7z-compressed",
+    "application/x-rar-compressed",
+    "application/pdf",
+    "application/octet-stream",
+)
+# image/ 중 텍스트 형식이라 압축되는 것
+COMPRESSIBLE_IMAGES = ("image/svg+xml",)
+
+# 인코딩별 zlib wbits (gzip 헤더 / zlib 헤더)
+WBITS = {"gzip": 16 + zlib.MAX_WBITS, "deflate": zlib.MAX_WBITS}
+
+SKIP_STATUS = frozenset({204, 206, 304})
+
+
+@lru_cache(maxsize=64)
+def negotiate(accept_encoding: bytes) -> str | None:
+    """Accept-Encoding 헤더 -> 사용할 인코딩 (gzip 우선, q=0 은 거부로 처리)"""
+    accepted = {}
+    for part in accept_encoding.decode("latin-1").lower().split(","):
+        coding, _, params = part.partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[coding.strip()] = quality
+    wildcard = accepted.get("*", 0.0)
+    best, best_quality = None, 0.0
+    for coding in ("gzip", "deflate"):
+        quality = accepted.get(coding, wildcard)
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+def is_compressible(content_type: bytes) -> bool:
+    content_type = content_type.decode("latin-1").lower()
+    if content_type.startswith(COMPRESSIBLE_IMAGES):
+        return True
+    return not content_type.startswith(COMPRESSED_TYPES)
+
+
+class _CompressingSend:
+    """send 를 감싸서 응답 시작 메시지를 잠시 보류하고, 첫 본문 조각을 보고 압축 여부 결정
+
+    - 본문이 한 번에 오면 min_size 미만은 그대로, 이상이면 통째로 압축 (Content-Length 갱신)
+    - 여러 조각으로 오면(스트리밍) 조각마다 압축 후 Z_SYNC_FLUSH -> SSE 이벤트가 바로 클라이언트에 도착
+    """
+
+    def __init__(self, send, encoding: str, min_size: int, level: int):
+        self.send = send
+        self.encoding = encoding
+        self.min_size = min_size
+        self.level = level
+        self.start = None
+        self.content_length = None
+        self.compressor = None
+
+    def _should_compress(self, message) -> bool:
+        if message["status"] < 200 or message["status"] in SKIP_STATUS:
+            return False
+        content_type = None
+        for name, value in message.get("headers") or []:
+            name = name.lower()
+            if name == b"content-encoding":
+                return False
+            if name == b"content-type":
+                content_type = value
+            elif name == b"content-length":
+                self.content_length = int(value)
+            elif name == b"cache-control" and b"no-transform" in value.lower():
+                return False
+        return content_type is not None and is_compressible(content_type)
+
+    def _compressed_start(self, start, content_length: int | None):
+        headers = []
+        varies = False
+        for name, value in start.get("headers") or []:
+            lowered = name.lower()
+            if lowered == b"content-length":
+                continue
+            # 압축하면 본문 바이트가 달라지므로 strong ETag 는 weak 으로
+            if lowered == b"etag" and not value.startswith(b"W/"):
+                value = b"W/" + value
+            elif lowered == b"vary" and b"accept-encoding" in value.lower():
+                varies = True
+            headers.append((name, value))
+        headers.append((b"content-encoding", self.encoding.encode("latin-1")))
+        if not varies:
+            headers.append((b"vary", b"Accept-Encoding"))
+        if content_length is not None:
+            headers.append((b"content-length", str(content_length).encode("latin-1")))
+        return {**start, "headers": headers}
+
+    async def __call__(self, message):
+        kind = message["type"]
+        if kind == "http.response.start":
+            if self._should_compress(message):
+                self.start = message
+                return
+            await self.send(message)
+            return
+
+        if self.compressor is not None and kind == "http.response.body":
+            body = self.compressor.compress(message.get("body", b""))
+            if message.get("more_body", False):
+                body += self.compressor.flush(zlib.Z_SYNC_FLUSH)
+            else:
+                body += self.compressor.flush()
+            await self.send({**message, "body": body})
+            return
+
+        if self.start is None:
+            await self.send(message)
+            return
+
+        start, self.start = self.start, None
+        if kind != "http.response.body":
+            await self.send(start)
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if more_body:
+            too_small = self.content_length is not None and self.content_length < self.min_size
+        else:
+            too_small = len(body) < self.min_size
+        if too_small:
+            await self.send(start)
+            await self.send(message)
+            return
+
+        compressor = zlib.compressobj(self.level, zlib.DEFLATED, WBITS[self.encoding])
+        if more_body:
+            self.compressor = compressor
+            body = compressor.compress(body) + compressor.flush(zlib.Z_SYNC_FLUSH)
+            start = self._compressed_start(start, None)
+        else:
+            body = compressor.compress(body) + compressor.flush()
+            start = self._compressed_start(start, len(body))
+        await self.send(start)
+        await self.send({**message, "body": body})
+
+
+class CompressionMiddleware:
+    """Accept-Encoding 에 따라 응답을 gzip/deflate 로 압축하는 순수 ASGI 미들웨어
+
+    이미 Content-Encoding 이 있는 응답(/media 의 .gz / 캐시된 압축 변형 등)은 그대로 통과
+    """
+
+    def __init__(self, app, min_size: int, level: int):
+        self.app = app
+        self.min_size = min_size
+        self.level = level
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+
+        accept_encoding = None
+        for name, value in scope["headers"]:
+            if name == b"accept-encoding":
+                accept_encoding = value
+                break
+        encoding = negotiate(accept_encoding) if accept_encoding else None
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        await self.app(scope, receive, _CompressingSend(send, encoding, self.min_size, self.level))
+
+
+# FastAPI 앱에 응답 압축 미들웨어를 추가
+def add_compression(app: FastAPI):
+    app.add_middleware(
+        CompressionMiddleware,
+        min_size=settings.compression_min_size,
+        level=settings.compression_level,
+    )
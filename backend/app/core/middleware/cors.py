@@ -1,18 +1,88 @@
 # 역할: CORS 설정을 FastAPI 애플리케이션에 적용하는 모듈
- 
+
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+
+from app.core.config.settings import settings
+
+# allow_methods=["*"] 일 때 preflight 에 알려주는 메서드 목록
+ALLOW_METHODS = b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"
+PREFLIGHT_MAX_AGE = b"600"
+
+
+# 허용 origin 을 frozenset / dict 로 미리 만들어 두고 헤더를 바로 붙이는 순수 ASGI CORS 미들웨어
+# - 기존 설정(allow_credentials=True, 모든 메서드/헤더 허용)과 같은 응답 헤더
+# - origin 헤더가 없는 요청(같은 출처, 서버 간 호출)은 아무것도 하지 않고 통과
+class CORSMiddleware:
+    def __init__(self, app, origins: list[str]):
+        self.app = app
+        self.origins = frozenset(origins)
+        # origin(bytes) -> 일반 응답에 붙일 헤더
+        self._simple_headers = {
+            origin.encode("latin-1"): [
+                (b"access-control-allow-origin", origin.encode("latin-1")),
+                (b"access-control-allow-credentials", b"true"),
+                (b"vary", b"Origin"),
+            ]
+            for origin in self.origins
+        }
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = request_method = request_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        allowed = self._simple_headers.get(origin)
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            await self._preflight(allowed, request_headers, send)
+            return
+
+        if allowed is None:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [*(message.get("headers") or []), *allowed]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+    @staticmethod
+    async def _preflight(allowed, request_headers, send):
+        if allowed is None:
+            status, body = 400, b"Disallowed CORS origin"
+            headers = [(b"vary", b"Origin")]
+        else:
+            status, body = 200, b"OK"
+            headers = [
+                *allowed,
+                (b"access-control-allow-methods", ALLOW_METHODS),
+                (b"access-control-max-age", PREFLIGHT_MAX_AGE),
+            ]
+            # allow_headers=["*"] -> 요청한 헤더를 그대로 허용
+            if request_headers:
+                headers.append((b"access-control-allow-headers", request_headers))
+        headers += [
+            (b"content-type", b"text/plain; charset=utf-8"),
+            (b"content-length", str(len(body)).encode("latin-1")),
+        ]
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
 
 
 # FastAPI 앱에 CORS 설정 미들웨어를 추가
 def add_cors(app: FastAPI):
-    origins = ["http://localhost:3000", "http://127.0.0.1:3000"]   
-    app.add_middleware(
-        CORSMiddleware,
-        # allow_origins=settings.cors_origins,
-        allow_origins=origins,
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
-    )
- 
\ No newline at end of file
+    app.add_middleware(CORSMiddleware, origins=settings.cors_origins)
@@ -1,12 +1,18 @@
-# 역할: FastAPI 앱에 모든 공통 미들웨어(CORS, 보안 등)를 일괄 등록
+# 역할: FastAPI 앱에 모든 공통 미들웨어(압축, CORS, 보안, 시간 측정, 요청 id 등)를 일괄 등록
 
 from fastapi import FastAPI
 
+from .compression import add_compression
 from .cors import add_cors
+from .request_id_middleware import add_request_id
 from .secure_headers_middleware import add_secure_headers
+from .timing_middleware import add_timing
 
 
-# CORS와 보안 헤더 미들웨어를 FastAPI 앱에 등록
+# 압축, CORS, 보안 헤더, 시간 측정, 요청 id 미들웨어를 FastAPI 앱에 등록 (나중에 등록한 것이 바깥쪽)
 def register_middlewares(app: FastAPI):
+    add_compression(app)
     add_cors(app)
     add_secure_headers(app)
+    add_timing(app)
+    add_request_id(app)
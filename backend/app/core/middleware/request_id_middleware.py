@@ -0,0 +1,48 @@
+# 역할: 요청마다 상관관계 id 를 정해서 로그에 남기고 응답 헤더(X-Request-ID)로 돌려주는 미들웨어
+
+import re
+import uuid
+
+from fastapi import FastAPI
+
+from app.core.log.logger import request_id_var
+
+# 프록시/클라이언트가 보낸 id 는 안전한 문자와 길이일 때만 그대로 사용
+VALID_REQUEST_ID = re.compile(rb"[A-Za-z0-9._-]{1,128}")
+
+
+# 순수 ASGI 미들웨어 - request_id_var 를 요청 처리 동안 설정
+class RequestIdMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        for name, value in scope["headers"]:
+            if name == b"x-request-id":
+                if VALID_REQUEST_ID.fullmatch(value):
+                    request_id = value.decode("latin-1")
+                break
+        if request_id is None:
+            request_id = uuid.uuid4().hex
+        header = (b"x-request-id", request_id.encode("latin-1"))
+
+        async def send_with_request_id(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [*(message.get("headers") or []), header]
+            await send(message)
+
+        token = request_id_var.set(request_id)
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            request_id_var.reset(token)
+
+
+# FastAPI 앱에 요청 id 미들웨어를 추가
+def add_request_id(app: FastAPI):
+    app.add_middleware(RequestIdMiddleware)
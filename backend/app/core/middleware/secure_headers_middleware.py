@@ -1,21 +1,40 @@
 # 역할: 보안 헤더 삽입 미들웨어 정의 및 FastAPI에 적용하는 함수 제공
 
-from fastapi import FastAPI, Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import FastAPI
 
+# 모든 응답에 붙는 보안 헤더 (ASGI raw 헤더 형태로 미리 만들어 둠)
+SECURE_HEADERS = [
+    (b"x-content-type-options", b"nosniff"),
+    (b"x-frame-options", b"DENY"),
+    (b"x-xss-protection", b"1; mode=block"),
+    (b"strict-transport-security", b"max-age=31536000; includeSubDomains"),
+]
+SECURE_HEADER_NAMES = frozenset(name for name, _ in SECURE_HEADERS)
 
-# HTTP 응답에 보안 헤더를 삽입하는 커스텀 미들웨어
-class SecureHeadersMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        response = await call_next(request)
 
-        # 보안 헤더 삽입
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
+# HTTP 응답에 보안 헤더를 삽입하는 순수 ASGI 미들웨어
+# - http.response.start 메시지의 헤더에만 미리 만든 헤더 목록을 덧붙이고 본문은 그대로 통과
+#   -> 요청마다 태스크/스트림을 만들지 않고, SSE 나 큰 파일 응답도 버퍼링 없이 흘려보냄
+class SecureHeadersMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_headers(message):
+            if message["type"] == "http.response.start":
+                headers = message.get("headers") or []
+                # 핸들러가 같은 헤더를 이미 넣었으면 덮어씀 (기존 동작과 동일)
+                if any(name.lower() in SECURE_HEADER_NAMES for name, _ in headers):
+                    headers = [(name, value) for name, value in headers if name.lower() not in SECURE_HEADER_NAMES]
+                message["headers"] = [*headers, *SECURE_HEADERS]
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
 
-        return response
 
 # FastAPI 앱에 보안 헤더 미들웨어를 추가
 def add_secure_headers(app: FastAPI):
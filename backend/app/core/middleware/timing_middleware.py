@@ -0,0 +1,66 @@
+# 역할: 요청 처리 시간 측정 미들웨어 - Server-Timing 헤더 + 라우트별 지표 집계
+
+import time
+
+from fastapi import FastAPI
+
+from app.core.config.settings import settings
+from app.core.metrics.registry import http_request_db_queries, http_request_duration, http_requests
+from app.core.metrics.timing import RequestTiming, current_timing
+
+
+def route_label(scope, root_path: str = "") -> str:
+    """지표 라벨용 라우트 경로 - 실제 경로 대신 템플릿(/api/gpt/jobs/{job_id})을 써서 라벨 수를 고정
+
+    라우터가 매칭 결과를 같은 scope 에 채워 넣으므로 요청이 끝난 뒤에 읽음
+    """
+    route = scope.get("route")
+    if route is not None:
+        return route.path
+    # Mount(/media 등)는 route 대신 root_path 에 접두사를 붙임
+    mounted = scope.get("root_path", "")
+    if mounted != root_path:
+        return mounted[len(root_path):]
+    return "unmatched"
+
+
+# 순수 ASGI 미들웨어 - 요청마다 RequestTiming 을 컨텍스트에 넣고
+# 응답 시작 시 Server-Timing 헤더를 붙이고, 응답이 끝나면 라우트별 히스토그램/카운터에 반영
+class TimingMiddleware:
+    def __init__(self, app, server_timing: bool = True):
+        self.app = app
+        self.server_timing = server_timing
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timing = RequestTiming()
+        token = current_timing.set(timing)
+        status = 500
+
+        async def send_with_timing(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if self.server_timing:
+                    message["headers"] = [*(message.get("headers") or []), (b"server-timing", timing.server_timing())]
+            await send(message)
+
+        root_path = scope.get("root_path", "")
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            current_timing.reset(token)
+            method = scope["method"]
+            route = route_label(scope, root_path)
+            http_requests.inc(method, route, str(status))
+            http_request_duration.observe(time.perf_counter() - timing.started, method, route)
+            if timing.db_count:
+                http_request_db_queries.inc(method, route, amount=timing.db_count)
+
+
+# FastAPI 앱에 요청 시간 측정 미들웨어를 추가 (가장 바깥쪽에 등록해야 전체 시간을 잼)
+def add_timing(app: FastAPI):
+    app.add_middleware(TimingMiddleware, server_timing=settings.server_timing_enabled)
@@ -0,0 +1,48 @@
+# app/core/provider/container.py
+# 역할: 앱 시작 시 한 번 구성하는 의존성 컨테이너 (싱글턴 + 요청 단위 객체의 생성자)
+
+
+class Container:
+    """앱 시작 시 wire() 로 한 번만 구성
+
+    - 상태 없는 AuthToken 은 앱 싱글턴 (비밀번호 해시 / OpenAI / HTTP 클라이언트는 각 모듈의 전역 인스턴스를 씀)
+    - DB 세션에 묶이는 repo 와 그 repo 를 쓰는 service 는 요청마다 만들되,
+      클래스는 여기서 미리 import 해 두고 ServiceProvider 는 생성만 함
+    """
+
+    def __init__(self):
+        self.wired = False
+
+    def wire(self):
+        if self.wired:
+            return
+
+        # 순환 참조 방지를 위해 여기서 import (모든 모듈이 로드된 뒤 호출)
+        from app.module.admin.admin_repository import AdminRepository
+        from app.module.admin.admin_service import AdminService
+        from app.module.auth.auth_repository import AuthRepository
+        from app.module.auth.auth_service import AuthService
+        from app.module.auth.auth_token import AuthToken
+        from app.module.gpt.gpt_repository import GptRepository
+        from app.module.gpt.gpt_service import GptService
+        from app.module.user.user_repository import UserRepository
+        from app.module.user.user_service import UserService
+
+        # 요청 단위 (세션 종속)
+        self.user_repository = UserRepository
+        self.admin_repository = AdminRepository
+        self.gpt_repository = GptRepository
+        self.auth_repository = AuthRepository
+        self.user_service = UserService
+        self.auth_service = AuthService
+        self.admin_service = AdminService
+        self.gpt_service = GptService
+
+        # 앱 싱글턴
+        self.token_util = AuthToken()
+
+        self.wired = True
+
+
+# 전역 인스턴스
+container = Container()
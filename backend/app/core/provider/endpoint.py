@@ -1,11 +1,31 @@
 # app/core/provider/endpoint.py
 
+import inspect
+from functools import wraps
+
 from fastapi import Depends
 
 from app.core.provider.service import get_provider
 
 def with_provider(func):
-    """라우터에 Depends(get_provider)를 자동 주입하는 데코레이터"""
-    async def wrapper(p = Depends(get_provider)):
-        return await func(p)
+    """라우터에 Depends(get_provider)를 자동 주입하는 데코레이터
+
+    첫 인자 p 에만 Depends(get_provider) 를 채우고 나머지 파라미터(경로/쿼리/바디)는
+    원래 시그니처 그대로 FastAPI 에 노출 -> 타입 검증과 OpenAPI 문서가 유지됨
+    """
+    signature = inspect.signature(func)
+    # FastAPI 는 키워드 인자로만 호출하므로 keyword-only 로 바꿔서 기본값 순서 제약을 피함
+    parameters = [
+        param.replace(
+            kind=inspect.Parameter.KEYWORD_ONLY,
+            default=Depends(get_provider) if name == "p" else param.default,
+        )
+        for name, param in signature.parameters.items()
+    ]
+
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await func(*args, **kwargs)
+
+    wrapper.__signature__ = signature.replace(parameters=parameters)
     return wrapper
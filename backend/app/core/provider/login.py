@@ -4,16 +4,17 @@ from functools import wraps
 
 from fastapi import HTTPException
 
-from app.module.auth.auth_token import AuthToken
+from app.module.auth.auth_token import access_token_verifier
 
 def login(func):
-    """로그인 필수 라우트용 데코레이터"""
+    """로그인 필수 라우트용 데코레이터
+
+    access_token JWT 를 전역 검증기로 검증하고 sub 를 request.user_id 로 설정 (DB 조회 없음)
+    """
     @wraps(func)
     async def wrapper(p, *args, **kwargs):
-        token_util = AuthToken()
         try:
-            user_id = await token_util.get_token_info(p.request)
-            p.request.user_id = user_id 
+            p.request.user_id = access_token_verifier.verify_request(p.request)
         except HTTPException:
             raise HTTPException(status_code=401, detail="Unauthorized")
         return await func(p, *args, **kwargs)
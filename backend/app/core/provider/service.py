@@ -1,75 +1,103 @@
 # app/core/provider/service.py
 
-from fastapi import Depends, Request
+from fastapi import Request
 
-from app.core.database.base import get_session
+from app.core.database.base import SessionLocal
+from app.core.provider.container import container
 
-# repo & service import는 나중에
-# -> 순환 참조 방지를 위해 내부에서 import
 
 class ServiceProvider:
-    def __init__(self, request: Request, db):
+    """요청 단위 repo / service 묶음
+
+    - 생성자와 싱글턴은 앱 시작 시 구성된 container 에서 가져오고, 여기서는 처음 쓸 때 한 번만 만듦
+    - DB 세션은 repo 를 처음 쓸 때 열고 요청이 끝나면 close() 로 닫음
+      -> DB 를 쓰지 않는 엔드포인트(로그아웃 등)는 세션도, 풀 커넥션도 잡지 않음
+    """
+
+    def __init__(self, request: Request, db=None):
         self.request = request
-        self.db = db
+        self._db = db
+        self._owns_db = db is None
         self._user_repo = None
         self._admin_repo = None
         self._gpt_repo = None
+        self._auth_repo = None
         self._user_service = None
         self._auth_service = None
         self._admin_service = None
         self._gpt_service = None
+        if not container.wired:
+            container.wire()
+
+    @property
+    def db(self):
+        if self._db is None:
+            self._db = SessionLocal()
+        return self._db
+
+    async def close(self):
+        if self._owns_db and self._db is not None:
+            await self._db.close()
+            self._db = None
 
+    # ✅ 앱 싱글턴
+    @property
+    def token_util(self):
+        return container.token_util
+
+    # ✅ 요청 단위 repo
     @property
     def user_repo(self):
-        if not self._user_repo:
-            from app.module.user.user_repository import UserRepository
-            self._user_repo = UserRepository(self.db)
+        if self._user_repo is None:
+            self._user_repo = container.user_repository(self.db)
         return self._user_repo
 
     @property
     def admin_repo(self):
-        if not self._admin_repo:
-            from app.module.admin.admin_repository import AdminRepository
-            self._admin_repo = AdminRepository(self.db)
+        if self._admin_repo is None:
+            self._admin_repo = container.admin_repository(self.db)
         return self._admin_repo
 
     @property
     def gpt_repo(self):
-        if not self._gpt_repo:
-            from app.module.gpt.gpt_repository import GptRepository
-            self._gpt_repo = GptRepository(self.db)
+        if self._gpt_repo is None:
+            self._gpt_repo = container.gpt_repository(self.db)
         return self._gpt_repo
 
+    @property
+    def auth_repo(self):
+        if self._auth_repo is None:
+            self._auth_repo = container.auth_repository(self.db)
+        return self._auth_repo
+
+    # ✅ 요청 단위 service
     @property
     def user_service(self):
-        if not self._user_service:
-            from app.module.user.user_service import UserService
-            self._user_service = UserService(self.user_repo)
+        if self._user_service is None:
+            self._user_service = container.user_service(self.user_repo)
         return self._user_service
 
     @property
     def auth_service(self):
-        if not self._auth_service:
-            from app.module.auth.auth_service import AuthService
-            self._auth_service = AuthService(self.user_repo)
+        if self._auth_service is None:
+            self._auth_service = container.auth_service(self.user_repo, self.auth_repo, self.token_util)
         return self._auth_service
 
     @property
     def admin_service(self):
-        if not self._admin_service:
-            from app.module.admin.admin_service import AdminService
-            self._admin_service = AdminService(self.admin_repo)
+        if self._admin_service is None:
+            self._admin_service = container.admin_service(self.admin_repo)
         return self._admin_service
 
     @property
     def gpt_service(self):
-        if not self._gpt_service:
-            from app.module.gpt.gpt_service import GptService
-            self._gpt_service = GptService(self.gpt_repo)
+        if self._gpt_service is None:
+            self._gpt_service = container.gpt_service(self.gpt_repo)
         return self._gpt_service
 
-async def get_provider(
-    request: Request,
-    db=Depends(get_session),
-):
-    return ServiceProvider(request, db)
+async def get_provider(request: Request):
+    provider = ServiceProvider(request)
+    try:
+        yield provider
+    finally:
+        await provider.close()
@@ -0,0 +1,63 @@
+# app/core/security/password.py
+# 역할: Argon2 비밀번호 해시/검증을 이벤트 루프 밖 전용 스레드 풀에서 실행
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from passlib.context import CryptContext
+
+from app.core.config.settings import settings
+
+
+class PasswordService:
+    """Argon2 해시/검증 서비스 (프로세스 전역)
+
+    - argon2-cffi 는 C 호출 동안 GIL 을 놓으므로 스레드 풀로도 다른 요청을 막지 않음
+    - 풀 크기만큼만 동시에 실행하고 나머지는 이벤트 루프에서 대기 (CPU 를 다 쓰지 않도록)
+    - 비용 파라미터(time/memory/parallelism)가 바뀌면 verify_and_update 가 새 해시를 돌려줘서
+      로그인할 때 저장된 해시를 새 파라미터로 교체
+    """
+
+    def __init__(self, workers: int, time_cost: int, memory_cost: int, parallelism: int):
+        self.workers = workers
+        self.context = CryptContext(
+            schemes=["argon2"],
+            deprecated="auto",
+            argon2__time_cost=time_cost,
+            argon2__memory_cost=memory_cost,
+            argon2__parallelism=parallelism,
+        )
+        self._executor: ThreadPoolExecutor | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+
+    async def _run(self, fn, *args):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="argon2")
+            self._semaphore = asyncio.Semaphore(self.workers)
+        async with self._semaphore:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+
+    async def hash(self, password: str) -> str:
+        return await self._run(self.context.hash, password)
+
+    async def verify(self, password: str, hashed: str) -> bool:
+        return await self._run(self.context.verify, password, hashed)
+
+    async def verify_and_update(self, password: str, hashed: str) -> tuple[bool, str | None]:
+        """(일치 여부, 새 해시) - 파라미터가 그대로면 새 해시는 None"""
+        return await self._run(self.context.verify_and_update, password, hashed)
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            self._semaphore = None
+
+
+# 전역 인스턴스 (워커 프로세스마다 하나)
+password_service = PasswordService(
+    workers=settings.password_hash_workers,
+    time_cost=settings.argon2_time_cost,
+    memory_cost=settings.argon2_memory_cost,
+    parallelism=settings.argon2_parallelism,
+)
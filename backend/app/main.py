@@ -1,25 +1,83 @@
 # 역할: FastAPI 앱 진입점 / 앱 생성, 미들웨어 등록, DB 초기화, 라우터 연결 등
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
-from fastapi.staticfiles import StaticFiles
 
 from app.core.config.settings import settings  # 글로벌 설정 인스턴스
+from app.core.http.client import http_client
+from app.core.database.base import engine
+from app.core.http.media import media_files
+from app.core.log.logger import setup_logging, shutdown_logging
+from app.core.metrics import metrics_router
+from app.core.metrics.registry import metrics
 from app.core.middleware import register
+from app.core.provider.container import container
+from app.core.security.password import password_service
 from app.module import *
 from app.module.auth import auth_router
+from app.module.auth.auth_cache import principal_cache
+from app.module.auth.auth_revocation import revocation_store
+from app.module.gpt.gpt_admission import gpt_admission
+from app.module.gpt.gpt_cache import gpt_answer_cache, gpt_setting_cache
+from app.module.gpt.gpt_flight import gpt_flight
+from app.module.gpt.gpt_job import gpt_job_runner
+from app.module.gpt.gpt_resilience import gpt_resilience
+
+
+# 앱 시작/종료 시 백그라운드 워커 실행/정리
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await gpt_job_runner.start()
+    await revocation_store.start()
+    yield
+    await revocation_store.stop()
+    await gpt_job_runner.stop()
+    password_service.close()
+    await http_client.close()
+    # 큐에 남은 로그를 모두 쓴 뒤 writer 스레드 종료
+    shutdown_logging()
+
+
+# /metrics 에 캐시/대기열/커넥션 풀 상태 노출 (조회 시점에 stats() 를 읽음)
+def register_metrics(app: FastAPI):
+    metrics.register_stats("gpt_setting_cache", gpt_setting_cache.stats)
+    metrics.register_stats("gpt_answer_cache", gpt_answer_cache.stats)
+    metrics.register_stats("gpt_flight", gpt_flight.stats)
+    metrics.register_stats("gpt_admission", gpt_admission.stats)
+    metrics.register_stats("gpt_resilience", gpt_resilience.stats)
+    metrics.register_stats("auth_principal_cache", principal_cache.stats)
+    metrics.register_stats("auth_revocation", revocation_store.stats)
+    metrics.register_stats("media_cache", media_files.cache.stats)
+    metrics.gauge(
+        "db_pool_connections",
+        "DB pool connections by state",
+        lambda: [
+            ({"state": "checked_out"}, engine.pool.checkedout()),
+            ({"state": "idle"}, engine.pool.checkedin()),
+        ],
+    )
+    app.include_router(metrics_router.router)
 
 
 # FastAPI 앱을 생성하고 필요한 설정을 적용하는 팩토리 함수
 def create_app() -> FastAPI:
-    app = FastAPI()
+    # 로그는 큐 + writer 스레드로 (이벤트 루프에서 stdout 쓰기 X)
+    setup_logging()
+
+    app = FastAPI(lifespan=lifespan)
+
+    # 싱글턴 / 요청 단위 객체 생성자 구성 (한 번만)
+    container.wire()
 
-    # CORS 및 보안 헤더 미들웨어 등록
+    # 압축, CORS 및 보안 헤더 미들웨어 등록
     register.register_middlewares(app)
 
     # 라우터 등록 
     register_routers(app)
+    register_metrics(app)
 
     return app
 
 # FastAPI 실행 인스턴스
 app = create_app()
-app.mount("/media", StaticFiles(directory=settings.MEDIA_ROOT), name="media")
+app.mount("/media", media_files, name="media")
@@ -25,4 +25,10 @@ class AdminRepository:
     async def get_admin_by_email(self, admin_email: str) -> Admin | None:
         stmt = select(Admin).where(Admin.admin_email == admin_email)
         result = await self.db.execute(stmt)
-        return result.scalar_one_or_none()
\ No newline at end of file
+        return result.scalar_one_or_none()
+
+    async def update_admin_password(self, admin: Admin, hashed_password: str):
+        admin.admin_password = hashed_password
+        await self.db.commit()
+        # 커밋 후 만료된 속성을 다시 채워서 호출한 쪽이 그대로 쓸 수 있게
+        await self.db.refresh(admin)
@@ -12,19 +12,16 @@ router = APIRouter()
 @router.post("/login")
 @with_provider
 async def admin_login(p: ServiceProvider):
-    print(p.request)
     admin = await p.admin_service.admin_login(p.request)
     response = JSONResponse(status_code=200, content={"message": "admin login successful"})
     admin.user_nickname = "admin"
-    await p.auth_service.token_util.create_jwt_token(admin, response, "admin")
+    await p.token_util.create_jwt_token(admin, response, "admin")
     return response
 
 @router.post("/logout")
 @with_provider
 async def admin_logout(p: ServiceProvider):
     response = JSONResponse(status_code=200, content={"message": "admin logout successful"})
-    response.delete_cookie("access_token")
-    response.delete_cookie("refresh_token")
-    response.delete_cookie("user_info")
-    response.delete_cookie("refresh_exp")
+    # refresh token 폐기 후 쿠키 삭제
+    await p.auth_service.logout(p.request, response)
     return response
\ No newline at end of file
@@ -1,18 +1,10 @@
 # app/module/auth/auth_service.py
 
 from fastapi import HTTPException
-from passlib.context import CryptContext
 
+from app.core.security.password import password_service
 from app.module.admin.admin_repository import AdminRepository
 
-pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
-
-def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
-
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
-
 class AdminService:
     def __init__(self, admin_repo: AdminRepository):
         self.admin_repo = admin_repo
@@ -32,9 +24,12 @@ class AdminService:
         if not admin:
             raise HTTPException(status_code=401, detail="invalid credentials")
 
-        print("hashed_password", hash_password(admin_password))
-
-        if not verify_password(admin_password, admin.admin_password):
+        # 해시 검증은 전용 스레드 풀에서 (이벤트 루프를 막지 않음)
+        ok, new_hash = await password_service.verify_and_update(admin_password, admin.admin_password)
+        if not ok:
             raise HTTPException(status_code=401, detail="invalid credentials")
+        # Argon2 비용 파라미터가 바뀌었으면 새 파라미터로 다시 해시해서 저장
+        if new_hash:
+            await self.admin_repo.update_admin_password(admin, new_hash)
         return admin
         
\ No newline at end of file
@@ -0,0 +1,15 @@
+# app/module/auth/auth.py
+from sqlalchemy import Column, DateTime, Integer, String
+
+from app.core.database.base import now_kst, register_base
+
+Base = register_base() 
+
+class RevokedToken(Base):
+    """폐기된 refresh token (jti) - 재사용/로그아웃된 토큰 거절용"""
+    __tablename__ = "tb_revoked_tokens"
+
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
+    jti = Column(String(64), unique=True, nullable=False)
+    expires_at = Column(DateTime, nullable=False, index=True)
+    revoked_at = Column(DateTime, default=now_kst, index=True)
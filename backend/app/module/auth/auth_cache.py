@@ -0,0 +1,102 @@
+# app/module/auth/auth_cache.py
+# 역할: 토큰 재발급용 유저/관리자 정보 TTL 캐시
+
+import time
+from collections import OrderedDict
+from typing import NamedTuple
+
+from sqlalchemy import event
+
+from app.core.config.settings import settings
+from app.module.admin.admin import Admin
+from app.module.user.user import User
+
+
+class Principal(NamedTuple):
+    """create_jwt_token 이 쓰는 최소 정보만 담은 투영"""
+
+    id: int
+    user_nickname: str | None
+    created_at: object
+    active: bool
+
+
+class PrincipalCache:
+    """(유형, id) -> Principal 의 크기 제한 TTL 캐시
+
+    - refresh_token 재발급마다 PK 조회를 하지 않도록 TTL 동안 재사용
+    - 이 워커에서 행이 바뀌면(ORM flush / upsert) 바로 무효화, 다른 워커는 최대 TTL 만큼 늦게 반영
+    - active 도 같이 캐시해서 비활성 사용자는 DB 조회 없이 거절
+    """
+
+    def __init__(self, ttl: float, max_size: int):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: OrderedDict = OrderedDict()  # (kind, id) -> (principal, expires_at)
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, kind: str, principal_id: int, loader) -> Principal | None:
+        """캐시에 없거나 만료됐으면 loader(principal_id) 로 행을 읽어서 채움"""
+        key = (kind, principal_id)
+        entry = self._entries.get(key)
+        if entry is not None and entry[1] > time.monotonic():
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+        self.misses += 1
+        row = await loader(principal_id)
+        if row is None:
+            self._entries.pop(key, None)
+            return None
+        principal = Principal(
+            id=row.id,
+            user_nickname=getattr(row, "user_nickname", None),
+            created_at=row.created_at,
+            active=getattr(row, "active", True) is not False,
+        )
+        if self.max_size:
+            self._entries[key] = (principal, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return principal
+
+    def invalidate(self, kind: str, principal_id: int | None = None):
+        """principal_id 가 없으면 해당 유형 전체 무효화 (id 를 모르는 일괄 변경용)"""
+        if principal_id is not None:
+            self._entries.pop((kind, principal_id), None)
+            return
+        for key in [key for key in self._entries if key[0] == kind]:
+            del self._entries[key]
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "entries": len(self._entries),
+            "ttl": self.ttl,
+        }
+
+
+# 전역 인스턴스 (워커 프로세스마다 하나)
+principal_cache = PrincipalCache(
+    ttl=settings.auth_principal_cache_ttl,
+    max_size=settings.auth_principal_cache_size,
+)
+
+
+# ORM 으로 행이 수정/삭제되면 무효화
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_user(mapper, connection, target):
+    principal_cache.invalidate("user", target.id)
+
+
+@event.listens_for(Admin, "after_update")
+@event.listens_for(Admin, "after_delete")
+def _invalidate_admin(mapper, connection, target):
+    principal_cache.invalidate("admin", target.id)
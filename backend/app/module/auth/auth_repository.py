@@ -0,0 +1,40 @@
+# app/module/auth/auth_repository.py
+from datetime import datetime
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.module.auth.auth import RevokedToken
+
+
+class AuthRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def revoke_token(self, jti: str, expires_at: datetime) -> bool:
+        """jti 폐기 기록 - 이미 폐기된 jti 면 False (unique 제약으로 동시 재사용도 한 번만 성공)"""
+        try:
+            await self.db.execute(insert(RevokedToken).values(jti=jti, expires_at=expires_at))
+            await self.db.commit()
+            return True
+        except IntegrityError:
+            await self.db.rollback()
+            return False
+
+    async def get_revoked_since(self, since: datetime) -> list[tuple[str, datetime]]:
+        result = await self.db.execute(
+            select(RevokedToken.jti, RevokedToken.expires_at).where(RevokedToken.revoked_at >= since)
+        )
+        return [tuple(row) for row in result.all()]
+
+    async def get_unexpired_revoked(self, now: datetime) -> list[tuple[str, datetime]]:
+        result = await self.db.execute(
+            select(RevokedToken.jti, RevokedToken.expires_at).where(RevokedToken.expires_at > now)
+        )
+        return [tuple(row) for row in result.all()]
+
+    async def delete_expired_revoked(self, now: datetime) -> int:
+        result = await self.db.execute(delete(RevokedToken).where(RevokedToken.expires_at <= now))
+        await self.db.commit()
+        return result.rowcount
@@ -0,0 +1,103 @@
+# app/module/auth/auth_revocation.py
+# 역할: 폐기된 refresh token(jti) 의 메모리 미러 - "폐기 안 됨" 확인을 DB 조회 없이 처리
+
+import asyncio
+import logging
+import time
+from datetime import datetime
+
+from app.core.config.settings import settings
+from app.core.database.base import KST, SessionLocal, now_kst
+from app.module.auth.auth_repository import AuthRepository
+
+logger = logging.getLogger(__name__)
+
+
+def to_db_time(epoch: float) -> datetime:
+    """JWT exp(epoch) -> DB 저장용 KST naive datetime (다른 DateTime 컬럼과 같은 기준)"""
+    return datetime.fromtimestamp(epoch, KST).replace(tzinfo=None)
+
+
+def from_db_time(value: datetime) -> float:
+    if value.tzinfo is None:
+        value = KST.localize(value)
+    return value.timestamp()
+
+
+class RevocationStore:
+    """tb_revoked_tokens 의 프로세스 로컬 미러 (jti -> exp)
+
+    - is_revoked() 는 dict 조회 한 번 (DB 조회 없음)
+    - 이 워커에서 폐기한 jti 는 바로 반영하고, 다른 워커가 폐기한 jti 는 sync_interval 마다
+      최근 폐기분만 가져와서 반영 (id 커서 대신 revoked_at 구간을 겹쳐 읽어서
+      늦게 커밋된 행도 놓치지 않음)
+    - 만료된 jti 는 어차피 JWT 검증에서 거절되므로 메모리/DB 에서 주기적으로 정리
+    - 미러는 빠른 거절용이고, 재사용 여부의 최종 판단은 폐기 insert 의 unique 제약
+    """
+
+    # 다른 워커의 커밋 지연/시계 차이를 덮을 만큼 겹쳐 읽는 구간 (초)
+    SYNC_OVERLAP = 30.0
+
+    def __init__(self, sync_interval: float, prune_interval: float):
+        self.sync_interval = sync_interval
+        self.prune_interval = prune_interval
+        self._revoked: dict[str, float] = {}
+        self._synced_at: float | None = None
+        self._pruned_at = 0.0
+        self._task: asyncio.Task | None = None
+
+    def is_revoked(self, jti: str) -> bool:
+        return jti in self._revoked
+
+    def add(self, jti: str, exp: float):
+        self._revoked[jti] = exp
+
+    async def start(self):
+        try:
+            await self.sync()
+        except Exception:
+            logger.exception("revocation sync failed")
+        self._task = asyncio.create_task(self._loop())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def sync(self):
+        started = time.time()
+        async with SessionLocal() as session:
+            repo = AuthRepository(session)
+            if self._synced_at is None:
+                # 처음에는 아직 만료되지 않은 폐기 목록 전체
+                rows = await repo.get_unexpired_revoked(now_kst().replace(tzinfo=None))
+            else:
+                since = to_db_time(self._synced_at - self.SYNC_OVERLAP)
+                rows = await repo.get_revoked_since(since)
+            for jti, expires_at in rows:
+                self._revoked[jti] = from_db_time(expires_at)
+
+            if started - self._pruned_at >= self.prune_interval:
+                self._pruned_at = started
+                self._revoked = {jti: exp for jti, exp in self._revoked.items() if exp > started}
+                await repo.delete_expired_revoked(to_db_time(started))
+        self._synced_at = started
+
+    async def _loop(self):
+        while True:
+            await asyncio.sleep(self.sync_interval)
+            try:
+                await self.sync()
+            except Exception:
+                logger.exception("revocation sync failed")
+
+    def stats(self) -> dict:
+        return {"revoked": len(self._revoked), "synced_at": self._synced_at}
+
+
+# 전역 인스턴스 (워커 프로세스마다 하나)
+revocation_store = RevocationStore(
+    sync_interval=settings.auth_revocation_sync_interval,
+    prune_interval=settings.auth_revocation_prune_interval,
+)
@@ -6,6 +6,7 @@ from fastapi.responses import JSONResponse
 from app.core.provider.endpoint import with_provider
 from app.core.provider.login import login
 from app.core.provider.service import ServiceProvider
+from app.module.auth.auth_cache import principal_cache
 
 router = APIRouter()
 
@@ -15,22 +16,29 @@ async def google_login(p: ServiceProvider):
     user = await p.auth_service.google_login(p.request)
     response = JSONResponse(status_code=200, content={"message": "user login successful"})
 
-    await p.auth_service.token_util.create_jwt_token(user, response, "user")
+    await p.token_util.create_jwt_token(user, response, "user")
     return response
 
 @router.post("/refresh_token")
 @with_provider
 async def refresh_token(p: ServiceProvider):
-    user_id, type = await p.auth_service.token_util.verify_refresh(p.request)
+    user_id, type, jti, exp = await p.token_util.verify_refresh(p.request)
+    # 쿠키 재발급에 필요한 정보만 TTL 캐시에서 (없을 때만 PK 조회)
+    user = None
     if type == "user":
-        user = await p.auth_service.get_user_by_id(user_id)
+        user = await principal_cache.get("user", int(user_id), p.auth_service.get_user_by_id)
     elif type == "admin":
-        user = await p.admin_service.get_admin_by_id(user_id)
+        user = await principal_cache.get("admin", int(user_id), p.admin_service.get_admin_by_id)
     if not user:
         raise HTTPException(status_code=404, detail="user not found")
+    if not user.active:
+        raise HTTPException(status_code=403, detail="inactive user")
+
+    # 쓰인 refresh token 은 폐기하고 새 jti 로 다시 발급 (회전)
+    await p.auth_service.rotate_refresh_token(jti, exp)
 
     response = JSONResponse(status_code=200, content={"message": "user login successful"})
-    await p.auth_service.token_util.create_jwt_token(user, response, type)
+    await p.token_util.create_jwt_token(user, response, type)
     return response
 
 @router.post("/logout")
@@ -38,6 +46,6 @@ async def refresh_token(p: ServiceProvider):
 @login
 async def logout(p:ServiceProvider):
     response = JSONResponse(status_code=200, content={"message": "user logout successful"})
-    await p.auth_service.token_util.delete_token(response)
+    await p.auth_service.logout(p.request, response)
 
     return response
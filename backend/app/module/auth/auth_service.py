@@ -1,17 +1,25 @@
 # app/module/auth/auth_service.py
 
+import logging
+
 import httpx
 from fastapi import HTTPException
 
 from app.core.config.settings import settings
+from app.core.http.client import http_client
+from app.module.auth.auth_repository import AuthRepository
+from app.module.auth.auth_revocation import revocation_store, to_db_time
 from app.module.auth.auth_token import AuthToken
 from app.module.user.user_repository import UserRepository
 
+logger = logging.getLogger(__name__)
+
 
 class AuthService:
-    def __init__(self, repo: UserRepository):
+    def __init__(self, repo: UserRepository, auth_repo: AuthRepository, token_util: AuthToken | None = None):
         self.repo = repo
-        self.token_util = AuthToken()
+        self.auth_repo = auth_repo
+        self.token_util = token_util or AuthToken()
 
     async def google_login(self, request):
         GOOGLE_TOKEN_URL = "https://oauth2.googleapis.com/token"
@@ -28,40 +36,64 @@ class AuthService:
             "grant_type": "authorization_code",
         }
 
-        async with httpx.AsyncClient() as client:
+        # 앱 전체에서 공유하는 커넥션 풀 사용 (keep-alive 로 핸드셰이크 재사용)
+        client = http_client.get()
+        try:
             token_resp = await client.post(GOOGLE_TOKEN_URL, data=token_data)
-            token_resp.raise_for_status()
-        
             try:
                 token_resp.raise_for_status()
             except httpx.HTTPStatusError as e:
-                # 상태 코드와 응답 본문 출력
-                print("Status Code:", e.response.status_code)
-                print("Response Text:", e.response.text)
+                # 상태 코드와 응답 본문 기록 (비밀 값은 로그 포맷터에서 가림)
+                logger.warning(
+                    "google token request failed",
+                    extra={"status_code": e.response.status_code, "response": e.response.text},
+                )
                 raise HTTPException(status_code=401, detail=f"google token request failed: {e.response.text}")
-            
-                
+
             access_token = token_resp.json().get("access_token")
 
             if not access_token:
                 raise HTTPException(status_code=500, detail="access token missing")
-            
+
             userinfo_resp = await client.get(
                 GOOGLE_USERINFO_URL,
                 headers={"Authorization": f"Bearer {access_token}"}
             )
-            userinfo_resp.raise_for_status()
-            userinfo = userinfo_resp.json()
+            try:
+                userinfo_resp.raise_for_status()
+            except httpx.HTTPStatusError as e:
+                raise HTTPException(status_code=401, detail=f"google userinfo request failed: {e.response.status_code}")
+        except httpx.TransportError as e:
+            raise HTTPException(status_code=502, detail=f"google request failed: {e.__class__.__name__}")
+
+        userinfo = userinfo_resp.json()
+        email = userinfo.get("email")
+        name = userinfo.get("name")
+        picture = userinfo.get("picture", "")
+
+        if not email:
+            raise HTTPException(status_code=401, detail="google account has no email")
 
-            email = userinfo.get("email")
-            name = userinfo.get("name")
-            picture = userinfo.get("picture", "")
-        
         user = await self.repo.get_or_create_user(email, name, picture)
-        
-        return user 
+
+        return user
 
     async def get_user_by_id(self, user_id):
         return await self.repo.get_user_by_id(user_id)
-        
-        
+
+    async def revoke_refresh_token(self, jti: str, exp: float) -> bool:
+        """refresh token 폐기 - 이미 폐기된(재사용된) 토큰이면 False"""
+        revoked = await self.auth_repo.revoke_token(jti, to_db_time(exp))
+        revocation_store.add(jti, exp)
+        return revoked
+
+    async def rotate_refresh_token(self, jti: str, exp: float):
+        """재발급 전에 기존 refresh token 을 폐기 - 동시에 두 번 쓰이면 한 쪽만 통과"""
+        if not await self.revoke_refresh_token(jti, exp):
+            raise HTTPException(status_code=401, detail="refresh token revoked")
+
+    async def logout(self, request, response):
+        claims = self.token_util.read_refresh_claims(request)
+        if claims:
+            await self.revoke_refresh_token(*claims)
+        await self.token_util.delete_token(response)
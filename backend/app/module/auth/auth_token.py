@@ -2,7 +2,9 @@
 
 import base64
 import json
+import time
 import uuid
+from collections import OrderedDict
 from datetime import timedelta
 
 import jwt
@@ -10,6 +12,76 @@ from fastapi import HTTPException
 
 from app.core.config.settings import settings
 from app.core.database.base import now_kst
+from app.module.auth.auth_revocation import revocation_store
+
+
+class AccessTokenVerifier:
+    """access_token 검증기 (프로세스 전역, 키/알고리즘은 생성 시 고정)
+
+    - 서명 검증 + exp 확인 + type == "access" 확인 후 sub 를 user_id 로 반환
+    - 검증에 성공한 토큰은 토큰 문자열 전체를 키로 작은 LRU 에 (user_id, exp) 로 보관해서
+      같은 토큰으로 들어오는 다음 요청은 다시 검증하지 않음 (exp 가 지나면 캐시에서도 만료)
+    - 서명만 키로 쓰면 서명은 그대로 두고 header/payload 를 바꾼 토큰이 캐시에 걸려
+      검증 없이 통과하므로, 반드시 토큰 전체가 일치해야 캐시를 씀
+    """
+
+    def __init__(self, secret: str, algorithms=("HS256",), cache_size: int = 1024):
+        self._secret = secret
+        self._algorithms = list(algorithms)
+        self.cache_size = cache_size
+        self._cache: OrderedDict = OrderedDict()  # token -> (user_id, exp)
+        self.hits = 0
+        self.misses = 0
+
+    def verify(self, token: str) -> int:
+        if not token:
+            raise HTTPException(status_code=401, detail="access token not found")
+
+        entry = self._cache.get(token)
+        if entry is not None:
+            user_id, exp = entry
+            if exp > time.time():
+                self._cache.move_to_end(token)
+                self.hits += 1
+                return user_id
+            del self._cache[token]
+
+        self.misses += 1
+        try:
+            payload = jwt.decode(
+                token,
+                self._secret,
+                algorithms=self._algorithms,
+                options={"require": ["exp", "sub"]},
+            )
+        except jwt.ExpiredSignatureError:
+            raise HTTPException(status_code=401, detail="access token expired")
+        except jwt.InvalidTokenError as e:
+            raise HTTPException(status_code=401, detail=f"invalid access token: {str(e)}")
+
+        if payload.get("type") != "access":
+            raise HTTPException(status_code=401, detail="invalid token type")
+        try:
+            user_id = int(payload["sub"])
+        except (TypeError, ValueError):
+            raise HTTPException(status_code=401, detail="invalid access payload")
+
+        if self.cache_size:
+            self._cache[token] = (user_id, payload["exp"])
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return user_id
+
+    def verify_request(self, request) -> int:
+        return self.verify(request.cookies.get("access_token"))
+
+
+# 전역 인스턴스 (워커 프로세스마다 하나)
+access_token_verifier = AccessTokenVerifier(
+    settings.jwt_secret,
+    algorithms=("HS256",),
+    cache_size=settings.jwt_verify_cache_size,
+)
 
 
 class AuthToken:
@@ -27,18 +99,11 @@ class AuthToken:
         self.secure = True if self.env == "prod" else False
     
     async def get_token_info(self, request):
-        """유저 아이디 토큰에서 파싱"""
-        try:
-            user_info = request.cookies.get("user_info")
-            access_token = request.cookies.get("access_token")
-            decoded = base64.b64decode(user_info).decode("utf-8")
-            data = json.loads(decoded)
-            user_id = data.get("id")
-            if not user_id or not access_token:
-                raise HTTPException(status_code=401, detail="invalid token data")
-            return user_id
-        except Exception as e:
-            raise HTTPException(status_code=401, detail=str(e))
+        """access_token 을 검증하고 sub(유저 아이디) 반환
+
+        user_info 쿠키는 프론트 표시용이라 클라이언트가 바꿀 수 있으므로 인증에 쓰지 않음
+        """
+        return access_token_verifier.verify_request(request)
     
     async def check_token_info(self, request):
         """유저 아이디 토큰이 있나 확인"""
@@ -64,10 +129,12 @@ class AuthToken:
             "exp": now_kr + timedelta(hours=1),
         }
 
+        # jti: 재발급(회전)/로그아웃 때 이 refresh token 을 폐기하기 위한 고유 id
         refresh_payload = {
             "sub": str(user.id),
             "user": type,
             "type": "refresh",
+            "jti": uuid.uuid4().hex,
             "exp": now_kr + timedelta(hours=6),
         }
 
@@ -135,7 +202,10 @@ class AuthToken:
         )
 
     async def verify_refresh(self, request):
-        """refresh_token 검증 및 user_id 반환"""
+        """refresh_token 검증 후 (user_id, 유형, jti, exp) 반환
+
+        폐기 여부는 메모리 미러로만 확인 (DB 조회 없음)
+        """
         try:
             refresh_token = request.cookies.get("refresh_token")
             if not refresh_token:
@@ -144,7 +214,6 @@ class AuthToken:
             # JWT 디코드
             payload = jwt.decode(refresh_token, self.jwt_secret, algorithms=[self.algorithm])
 
-            print("payload", payload)
             if payload.get("type") != "refresh":
                 raise HTTPException(status_code=401, detail="invalid token type")
 
@@ -152,15 +221,34 @@ class AuthToken:
             if not user_id:
                 raise HTTPException(status_code=401, detail="invalid refresh payload")
 
+            jti = payload.get("jti")
+            if not jti:
+                raise HTTPException(status_code=401, detail="invalid refresh payload")
+            if revocation_store.is_revoked(jti):
+                raise HTTPException(status_code=401, detail="refresh token revoked")
+
             type = payload.get("user")
 
-            return user_id, type
+            return user_id, type, jti, payload["exp"]
 
         except jwt.ExpiredSignatureError:
             raise HTTPException(status_code=401, detail="refresh token expired")
         except jwt.InvalidTokenError as e:
             raise HTTPException(status_code=401, detail=f"invalid refresh token: {str(e)}")
 
+    def read_refresh_claims(self, request):
+        """로그아웃용 - 서명이 맞는 refresh_token 의 (jti, exp), 없거나 만료/위조면 None"""
+        refresh_token = request.cookies.get("refresh_token")
+        if not refresh_token:
+            return None
+        try:
+            payload = jwt.decode(refresh_token, self.jwt_secret, algorithms=[self.algorithm])
+        except jwt.InvalidTokenError:
+            return None
+        if payload.get("type") != "refresh" or not payload.get("jti"):
+            return None
+        return payload["jti"], payload["exp"]
+
     async def delete_token(self, response):
         """토큰 삭제 및 로그아웃 처리"""
         cookie_common = {
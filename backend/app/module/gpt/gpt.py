@@ -19,7 +19,46 @@ class GptSetting(Base):
     vc_file_ids = Column(JSON, nullable=True)
     vc_file_names = Column(JSON, nullable=True)
     created_at = Column(DateTime, default=now_kst)
+    updated_at = Column(DateTime, default=now_kst, onupdate=now_kst)
+    # 저장할 때마다 1 씩 증가 - 캐시 재검증 스탬프 (DATETIME 은 초 단위라 같은 초의 저장을 구분 못 함)
+    revision = Column(Integer, nullable=False, default=1, server_default="1")
 
 
+class GptJob(Base):
+    __tablename__ = "tb_gpt_jobs"
 
-    
\ No newline at end of file
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
+    kind = Column(String(20), nullable=False, default="ingest")
+    # pending / running / done / failed
+    status = Column(String(20), nullable=False, default="pending", index=True)
+    # queued / create_vc / upload / index / save / done
+    stage = Column(String(20), nullable=False, default="queued")
+    total_files = Column(Integer, default=0)
+    uploaded_files = Column(Integer, default=0)
+    indexed_files = Column(Integer, default=0)
+    # 저장할 설정 값 + 스테이징된 파일 목록
+    payload = Column(JSON, nullable=True)
+    vc_id = Column(String(100), nullable=True)
+    # payload 파일과 같은 순서, 아직 업로드 안 된 파일은 null
+    vc_file_ids = Column(JSON, nullable=True)
+    gpt_setting_id = Column(Integer, nullable=True)
+    # 정리(cleanup) 작업의 파일별 결과
+    result = Column(JSON, nullable=True)
+    error = Column(String(500), nullable=True)
+    # 재시도 횟수 / 다음 실행 가능 시각 (백오프)
+    attempts = Column(Integer, default=0)
+    run_after = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, default=now_kst)
+    updated_at = Column(DateTime, default=now_kst, onupdate=now_kst)
+
+
+class GptFile(Base):
+    """내용 해시(SHA-256) -> OpenAI 파일 id 인덱스 (같은 파일은 한 번만 업로드)"""
+    __tablename__ = "tb_gpt_files"
+
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
+    sha256 = Column(String(64), unique=True, nullable=False)
+    file_id = Column(String(100), unique=True, nullable=False)
+    file_name = Column(String(255), nullable=True)
+    size = Column(Integer, nullable=True)
+    created_at = Column(DateTime, default=now_kst)
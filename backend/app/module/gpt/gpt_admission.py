@@ -0,0 +1,204 @@
+# app/module/gpt/gpt_admission.py
+# 역할: OpenAI 호출 수락 제어 - 동시 실행 수 / 분당 요청·토큰 제한 / 대기열 / 사용자별 공정성
+
+import asyncio
+import math
+import time
+from collections import OrderedDict, deque
+
+from app.core.config.settings import settings
+
+# 백그라운드 작업(인덱싱, 파일 정리)이 쓰는 대기열 이름
+BACKGROUND = "background"
+
+
+class AdmissionRejected(Exception):
+    """대기열이 가득 찼거나 대기 시간이 지나서 거절됨 (retry_after 초 뒤 재시도 권장)"""
+
+    def __init__(self, reason: str, retry_after: int):
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    """capacity 만큼 모였다가 초당 rate 씩 채워지는 버킷"""
+
+    def __init__(self, per_minute: int):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def delay(self, amount: float) -> float:
+        """amount 를 꺼낼 수 있을 때까지 남은 초 (0 이면 바로 가능)"""
+        self._refill()
+        amount = min(amount, self.capacity)
+        return max(0.0, (amount - self.tokens) / self.rate)
+
+    def take(self, amount: float):
+        self._refill()
+        self.tokens -= min(amount, self.capacity)
+
+
+class Ticket:
+    """수락된 호출 하나 - release() 는 여러 번 불러도 한 번만 반영"""
+
+    def __init__(self, controller: "AdmissionController"):
+        self._controller = controller
+        self._released = False
+
+    def release(self):
+        if not self._released:
+            self._released = True
+            self._controller._release()
+
+
+class AdmissionController:
+    """프로세스 전역 OpenAI 호출 수락 제어
+
+    - 동시에 실행 중인 호출은 max_concurrency 개까지
+    - 요청 수 / 추정 토큰 수 토큰 버킷이 비면 채워질 때까지 대기
+    - 대기 중인 호출은 사용자(user)별 큐에 넣고 사용자 간 라운드 로빈으로 꺼냄
+      -> 한 사용자가 몰아서 보내도 다른 사용자의 요청이 뒤로 밀리지 않음
+    - 대기열이 가득 차거나 timeout 이 지나면 AdmissionRejected (API 에서는 503 + Retry-After)
+    - timeout=None 인 호출(백그라운드 작업)은 대기열 길이 제한 없이 끝까지 기다림
+    """
+
+    def __init__(self, max_concurrency: int, requests_per_minute: int, tokens_per_minute: int,
+                 queue_size: int, queue_timeout: float):
+        self.max_concurrency = max_concurrency
+        self.queue_size = queue_size
+        self.queue_timeout = queue_timeout
+        self._requests = TokenBucket(requests_per_minute)
+        self._tokens = TokenBucket(tokens_per_minute)
+        self._active = 0
+        self._queues: OrderedDict = OrderedDict()  # user -> deque[(future, tokens, queued_at)]
+        self._waiting = 0
+        self._timer: asyncio.TimerHandle | None = None
+        # 지표
+        self.admitted = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self.max_queue_depth = 0
+        self._wait_times: deque = deque(maxlen=1000)
+
+    def _ready_in(self, tokens: int) -> float:
+        return max(self._requests.delay(1), self._tokens.delay(tokens))
+
+    def _admit(self, tokens: int, waited: float) -> Ticket:
+        self._active += 1
+        self._requests.take(1)
+        self._tokens.take(tokens)
+        self.admitted += 1
+        self._wait_times.append(waited)
+        return Ticket(self)
+
+    def _retry_after(self) -> int:
+        # 대기 중인 호출이 모두 빠질 때까지 걸릴 대략적인 시간 (요청 버킷 기준)
+        drain = (self._waiting + 1) / self._requests.rate
+        return max(1, math.ceil(min(drain, self.queue_timeout or drain)))
+
+    async def acquire(self, user=BACKGROUND, tokens: int = 0, timeout: float | None = None) -> Ticket:
+        if not self._waiting and self._active < self.max_concurrency and self._ready_in(tokens) == 0:
+            return self._admit(tokens, 0.0)
+
+        if timeout is not None and self._waiting >= self.queue_size:
+            self.rejected += 1
+            raise AdmissionRejected("openai queue is full", self._retry_after())
+
+        loop = asyncio.get_running_loop()
+        waiter = (loop.create_future(), tokens, time.monotonic())
+        self._queues.setdefault(user, deque()).append(waiter)
+        self._waiting += 1
+        self.max_queue_depth = max(self.max_queue_depth, self._waiting)
+        self._dispatch()
+        try:
+            return await asyncio.wait_for(asyncio.shield(waiter[0]), timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if waiter[0].done():
+                # 포기한 순간 이미 수락됐으면 자리를 돌려줌
+                if not waiter[0].cancelled():
+                    waiter[0].result().release()
+            else:
+                waiter[0].cancel()
+                self._discard(user, waiter)
+            if isinstance(e, asyncio.TimeoutError):
+                self.timed_out += 1
+                raise AdmissionRejected("openai queue wait timed out", self._retry_after())
+            raise
+
+    def _discard(self, user, waiter):
+        queue = self._queues.get(user)
+        if queue is not None and waiter in queue:
+            queue.remove(waiter)
+            self._waiting -= 1
+            if not queue:
+                del self._queues[user]
+        self._dispatch()
+
+    def _dispatch(self):
+        """대기 중인 호출을 사용자 순서대로 하나씩 수락 (자리/버킷이 없으면 중단)"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        while self._queues and self._active < self.max_concurrency:
+            user, queue = next(iter(self._queues.items()))
+            future, tokens, queued_at = queue[0]
+            delay = self._ready_in(tokens)
+            if delay > 0:
+                # 버킷이 채워질 시점에 다시 시도
+                self._timer = asyncio.get_running_loop().call_later(delay, self._dispatch)
+                return
+            queue.popleft()
+            self._waiting -= 1
+            # 이 사용자는 맨 뒤로 (라운드 로빈)
+            del self._queues[user]
+            if queue:
+                self._queues[user] = queue
+            future.set_result(self._admit(tokens, time.monotonic() - queued_at))
+
+    def _release(self):
+        self._active -= 1
+        if self._queues:
+            self._dispatch()
+
+    async def call(self, fn, *args, user=BACKGROUND, tokens: int = 0, timeout: float | None = None, **kwargs):
+        """수락된 뒤 fn(*args, **kwargs) 실행, 끝나면 자리 반환"""
+        ticket = await self.acquire(user, tokens, timeout)
+        try:
+            return await fn(*args, **kwargs)
+        finally:
+            ticket.release()
+
+    def stats(self) -> dict:
+        waits = sorted(self._wait_times)
+        return {
+            "active": self._active,
+            "max_concurrency": self.max_concurrency,
+            "queue_depth": self._waiting,
+            "max_queue_depth": self.max_queue_depth,
+            "queue_size": self.queue_size,
+            "waiting_users": len(self._queues),
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+            "wait_avg": round(sum(waits) / len(waits), 4) if waits else 0.0,
+            "wait_p95": round(waits[min(len(waits) - 1, int(len(waits) * 0.95))], 4) if waits else 0.0,
+            "wait_max": round(waits[-1], 4) if waits else 0.0,
+        }
+
+
+# 전역 인스턴스 (워커 프로세스마다 하나)
+gpt_admission = AdmissionController(
+    max_concurrency=settings.openai_max_concurrency,
+    requests_per_minute=settings.openai_requests_per_minute,
+    tokens_per_minute=settings.openai_tokens_per_minute,
+    queue_size=settings.openai_queue_size,
+    queue_timeout=settings.openai_queue_timeout,
+)
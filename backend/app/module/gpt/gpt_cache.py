@@ -0,0 +1,162 @@
+# app/module/gpt/gpt_cache.py
+import asyncio
+import time
+from collections import OrderedDict
+
+from app.core.config.settings import settings
+from app.core.http.etag import make_etag, row_etag
+
+
+class GptSettingCache:
+    """활성 GptSetting 의 프로세스 로컬 read-through 캐시
+
+    - TTL 이내면 DB 조회 없이 캐시된 값을 그대로 반환
+    - TTL 이 지나면 (id, revision) 스탬프만 조회해서 바뀌지 않았으면 연장,
+      바뀌었으면 전체 행을 다시 읽음 -> 워커가 여러 개여도 최대 TTL 만큼만 stale
+    - 저장 시 invalidate() 로 현재 워커의 캐시는 즉시 비움
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._lock = asyncio.Lock()
+        self._entry = None  # (stamp, data, etag, checked_at)
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.invalidations = 0
+
+    def _fresh(self) -> bool:
+        return self._entry is not None and time.monotonic() - self._entry[3] < self.ttl
+
+    async def get(self, repo, encode):
+        """캐시된 (설정 데이터, ETag) 반환. 없거나 만료되면 repo 로 다시 채움
+
+        encode 는 ORM 객체 -> 응답용 dict 변환 함수 (캐시에는 변환된 값만 저장)
+        """
+        if self._fresh():
+            self.hits += 1
+            return self._entry[1], self._entry[2]
+
+        async with self._lock:
+            # 락 대기 중 다른 요청이 이미 채웠을 수 있음
+            if self._fresh():
+                self.hits += 1
+                return self._entry[1], self._entry[2]
+
+            entry = self._entry
+            generation = self._generation
+            if entry is not None:
+                stamp = await repo.get_gpt_setting_stamp()
+                if stamp == entry[0] and generation == self._generation:
+                    self.revalidations += 1
+                    self._entry = (stamp, entry[1], entry[2], time.monotonic())
+                    return entry[1], entry[2]
+
+            self.misses += 1
+            generation = self._generation
+            result = await repo.get_gpt_setting()
+            stamp = (result.id, result.revision) if result else None
+            data = encode(result) if result else None
+            etag = row_etag(result) if result else make_etag(None)
+            # 조회 도중 invalidate 됐으면 옛 값을 캐시에 남기지 않음
+            if generation == self._generation:
+                self._entry = (stamp, data, etag, time.monotonic())
+            return data, etag
+
+    def invalidate(self):
+        self.invalidations += 1
+        self._generation += 1
+        self._entry = None
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses + self.revalidations
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+            "invalidations": self.invalidations,
+            "hit_ratio": round((self.hits + self.revalidations) / lookups, 4) if lookups else 0.0,
+            "ttl": self.ttl,
+        }
+
+
+class GptAnswerCache:
+    """(설정 id, 설정 revision, 정규화된 질문) -> 답변 LRU 캐시
+
+    - 전체 크기(바이트)가 max_bytes 를 넘으면 오래 안 쓴 항목부터 제거
+    - 항목마다 TTL, 만료된 항목은 조회 시 제거
+    - 설정이 바뀌면 키가 달라지므로 다른 워커도 설정 캐시 TTL 안에 새 답변을 씀
+    """
+
+    # 키/튜플 등 문자열 외 항목당 대략적인 오버헤드
+    ENTRY_OVERHEAD = 200
+
+    def __init__(self, ttl: float, max_bytes: int):
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict = OrderedDict()  # key -> (answer, size, expires_at)
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(setting: dict, question: str) -> tuple:
+        return (setting.get("id"), setting.get("revision"), question)
+
+    def get(self, key) -> str | None:
+        entry = self._entries.get(key)
+        if entry is None or entry[2] < time.monotonic():
+            if entry is not None:
+                self._remove(key)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def set(self, key, answer: str):
+        size = len(answer.encode("utf-8")) + len(str(key[2]).encode("utf-8")) + self.ENTRY_OVERHEAD
+        if size > self.max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (answer, size, time.monotonic() + self.ttl)
+        self.bytes += size
+        while self.bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def _remove(self, key):
+        _, size, _ = self._entries.pop(key)
+        self.bytes -= size
+
+    def clear(self):
+        self._entries.clear()
+        self.bytes = 0
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "entries": len(self._entries),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            "evictions": self.evictions,
+            "ttl": self.ttl,
+        }
+
+
+# 전역 인스턴스 (워커 프로세스마다 하나)
+gpt_setting_cache = GptSettingCache(ttl=settings.gpt_setting_cache_ttl)
+gpt_answer_cache = GptAnswerCache(ttl=settings.gpt_answer_cache_ttl, max_bytes=settings.gpt_answer_cache_max_bytes)
+
+
+def invalidate_gpt_caches():
+    """설정 저장 후 호출 - 설정 캐시와 이전 설정으로 만든 답변 캐시를 같이 비움"""
+    gpt_setting_cache.invalidate()
+    gpt_answer_cache.clear()
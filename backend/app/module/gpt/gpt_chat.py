@@ -0,0 +1,52 @@
+# app/module/gpt/gpt_chat.py
+# 역할: 저장된 GptSetting 으로 OpenAI Responses API 요청 구성
+
+import unicodedata
+
+from app.core.config.settings import settings
+
+
+def normalize_model(version: str) -> str:
+    """관리자 화면의 버전 표기("gpt-5 mini")를 모델 id("gpt-5-mini")로 변환"""
+    return "-".join((version or "").strip().lower().split())
+
+
+def normalize_question(question: str) -> str:
+    """캐시 키용 질문 정규화 - 유니코드 정규화, 대소문자, 공백, 끝 문장부호 차이 무시"""
+    question = unicodedata.normalize("NFKC", question).casefold()
+    return " ".join(question.split()).rstrip("?!.。？！ ")
+
+
+def build_chat_request(setting: dict, question: str) -> dict:
+    """활성 설정(dict) + 질문 -> client.responses.create 인자
+
+    - data_type == "file": vc_id 벡터 스토어를 file_search 도구로 연결
+    - data_type == "text": learning_text 를 지침 뒤에 참고 자료로 붙임
+    - fall_back_type 이 False 면 자료에 없는 질문엔 fall_back_text 로만 답하도록 지시
+    """
+    instructions = [setting.get("instruction") or ""]
+
+    if setting.get("data_type") == "text" and setting.get("learning_text"):
+        instructions.append(f"참고 자료:\n{setting['learning_text']}")
+
+    if not setting.get("fall_back_type"):
+        fall_back_text = setting.get("fall_back_text") or ""
+        instructions.append(
+            "제공된 자료에 근거해서만 답하세요. "
+            f"자료에서 답을 찾을 수 없으면 다음 문장만 그대로 답하세요: {fall_back_text}"
+        )
+
+    request = {
+        "model": normalize_model(setting.get("version")),
+        "instructions": "\n\n".join(part for part in instructions if part),
+        "input": question,
+    }
+    if setting.get("data_type") == "file" and setting.get("vc_id"):
+        request["tools"] = [{"type": "file_search", "vector_store_ids": [setting["vc_id"]]}]
+    return request
+
+
+def estimate_tokens(request: dict) -> int:
+    """토큰 버킷 예약용 대략적인 토큰 수 (한글/영문 섞인 기준 2자당 1토큰 + 답변 추정치)"""
+    chars = len(request.get("instructions") or "") + len(request.get("input") or "")
+    return chars // 2 + settings.openai_estimated_output_tokens
@@ -0,0 +1,121 @@
+# app/module/gpt/gpt_flight.py
+# 역할: 같은 키로 동시에 들어온 OpenAI 호출을 하나로 합쳐서 결과를 공유 (single-flight)
+
+import asyncio
+
+
+class _Broadcast:
+    """스트리밍 호출 하나의 결과를 여러 구독자에게 나눠 주는 버퍼
+
+    늦게 합류한 구독자도 처음부터 받은 항목을 모두 재생한 뒤 이어서 받음
+    """
+
+    def __init__(self):
+        self.items: list = []
+        self.done = False
+        self.error: BaseException | None = None
+        self.task: asyncio.Task | None = None
+        self._event = asyncio.Event()
+
+    def _notify(self):
+        event, self._event = self._event, asyncio.Event()
+        event.set()
+
+    def push(self, item):
+        self.items.append(item)
+        self._notify()
+
+    def finish(self, error: BaseException | None = None):
+        self.done = True
+        self.error = error
+        self._notify()
+
+    async def subscribe(self):
+        index = 0
+        while True:
+            while index < len(self.items):
+                yield self.items[index]
+                index += 1
+            if self.done:
+                if self.error is not None:
+                    raise self.error
+                return
+            # 구독자가 취소돼도 Event.wait 만 취소되고 upstream 작업은 계속 진행
+            await self._event.wait()
+
+
+class SingleFlight:
+    """키별로 진행 중인 upstream 호출을 하나만 유지
+
+    - do(): 코루틴 호출. 같은 키가 진행 중이면 그 작업의 결과를 같이 기다림
+    - stream(): 스트리밍 호출. 같은 키가 진행 중이면 같은 스트림을 구독
+    - 실제 호출은 별도 태스크에서 돌고 호출자는 shield 로 기다리므로
+      한 호출자가 취소(클라이언트 연결 끊김 등)돼도 다른 호출자의 결과는 그대로 받음
+    - 호출이 끝나면 키를 지움 (결과 캐시는 하지 않음)
+    """
+
+    def __init__(self):
+        self._calls: dict = {}
+        self._streams: dict = {}
+        self.started = 0
+        self.shared = 0
+
+    async def do(self, key, factory):
+        task = self._calls.get(key)
+        if task is None:
+            self.started += 1
+            task = asyncio.ensure_future(factory())
+            self._calls[key] = task
+            task.add_done_callback(lambda t: self._forget_call(key, t))
+        else:
+            self.shared += 1
+        return await asyncio.shield(task)
+
+    def _forget_call(self, key, task: asyncio.Task):
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # 기다리던 호출자가 모두 취소된 경우에도 예외 미회수 경고가 남지 않도록
+        if not task.cancelled():
+            task.exception()
+
+    def streaming(self, key) -> bool:
+        return key in self._streams
+
+    def stream(self, key, factory):
+        """factory() 는 항목을 yield 하는 async iterator 를 반환"""
+        broadcast = self._streams.get(key)
+        if broadcast is None:
+            self.started += 1
+            broadcast = _Broadcast()
+            self._streams[key] = broadcast
+            broadcast.task = asyncio.ensure_future(self._pump(key, broadcast, factory))
+        else:
+            self.shared += 1
+        return broadcast.subscribe()
+
+    async def _pump(self, key, broadcast: _Broadcast, factory):
+        try:
+            async for item in factory():
+                broadcast.push(item)
+        except asyncio.CancelledError:
+            # 종료 시 취소되면 구독자에게는 일반 오류로 전달
+            broadcast.finish(RuntimeError("upstream stream cancelled"))
+            raise
+        except Exception as e:
+            broadcast.finish(e)
+        else:
+            broadcast.finish()
+        finally:
+            if self._streams.get(key) is broadcast:
+                del self._streams[key]
+
+    def stats(self) -> dict:
+        return {
+            "started": self.started,
+            "shared": self.shared,
+            "in_flight": len(self._calls) + len(self._streams),
+        }
+
+
+# 전역 인스턴스 (워커 프로세스마다 하나)
+gpt_flight = SingleFlight()
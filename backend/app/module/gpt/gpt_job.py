@@ -0,0 +1,96 @@
+# app/module/gpt/gpt_job.py
+# 역할: 벡터 스토어 인덱싱 같은 오래 걸리는 작업을 요청 밖에서 실행하는 in-process 워커 풀
+
+import asyncio
+import logging
+from datetime import timedelta
+
+from app.core.config.settings import settings
+from app.core.database.base import SessionLocal, now_kst
+from app.module.gpt.gpt_repository import GptRepository
+
+logger = logging.getLogger(__name__)
+
+
+class GptJobRunner:
+    """asyncio 큐 + 워커 태스크로 GptJob 실행
+
+    - 작업 상태는 tb_gpt_jobs 에 저장되고, 실행 전 claim 으로 선점하므로
+      uvicorn 워커가 여러 개여도 같은 작업을 두 번 돌리지 않음
+    - 시작 시, 그리고 주기적으로 pending / 하트비트 끊긴 running 작업을 다시 큐에 넣어서
+      재시작이나 워커 프로세스가 죽은 경우에도 이어서 실행
+    """
+
+    def __init__(self, workers: int):
+        self.workers = workers
+        self._queue: asyncio.Queue | None = None
+        self._tasks: list[asyncio.Task] = []
+
+    async def start(self):
+        self._queue = asyncio.Queue()
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+        self._tasks.append(asyncio.create_task(self._sweeper()))
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queue = None
+
+    def enqueue(self, job_id: int):
+        if self._queue is not None:
+            self._queue.put_nowait(job_id)
+
+    def enqueue_later(self, job_id: int, delay: float):
+        """재시도 백오프용 - delay 초 뒤에 큐에 넣음 (그 전에 재시작되면 sweeper 가 run_after 이후 다시 넣음)"""
+        if self._queue is not None:
+            asyncio.get_running_loop().call_later(delay, self.enqueue, job_id)
+
+    def _stale_before(self):
+        return now_kst() - timedelta(seconds=settings.gpt_job_stale_after)
+
+    async def _sweeper(self):
+        while True:
+            try:
+                async with SessionLocal() as session:
+                    job_ids = await GptRepository(session).get_resumable_gpt_job_ids(self._stale_before())
+                for job_id in job_ids:
+                    self.enqueue(job_id)
+            except Exception:
+                logger.exception("gpt job sweep failed")
+            await asyncio.sleep(settings.gpt_job_stale_after)
+
+    async def _heartbeat(self, job_id: int):
+        """업로드처럼 진행 갱신이 뜸한 단계에서도 다른 워커가 선점하지 않도록 updated_at 갱신"""
+        while True:
+            await asyncio.sleep(settings.gpt_job_stale_after / 3)
+            try:
+                async with SessionLocal() as session:
+                    await GptRepository(session).touch_gpt_job(job_id)
+            except Exception:
+                logger.exception("gpt job heartbeat failed", extra={"job_id": job_id})
+
+    async def _worker(self):
+        # 순환 참조 방지를 위해 내부에서 import
+        from app.module.gpt.gpt_service import GptService
+
+        while True:
+            job_id = await self._queue.get()
+            try:
+                async with SessionLocal() as session:
+                    repo = GptRepository(session)
+                    if await repo.claim_gpt_job(job_id, self._stale_before()):
+                        heartbeat = asyncio.create_task(self._heartbeat(job_id))
+                        try:
+                            await GptService(repo).run_job(job_id)
+                        finally:
+                            heartbeat.cancel()
+            except Exception:
+                logger.exception("gpt job failed", extra={"job_id": job_id})
+            finally:
+                self._queue.task_done()
+
+
+# 전역 인스턴스 (워커 프로세스마다 하나)
+gpt_job_runner = GptJobRunner(workers=settings.gpt_job_workers)
@@ -1,8 +1,9 @@
-from sqlalchemy import select
+from sqlalchemy import and_, delete, insert, inspect, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import lazyload
 
-from app.module.gpt.gpt import GptSetting
+from app.core.database.base import now_kst
+from app.module.gpt.gpt import GptFile, GptJob, GptSetting
 
 
 class GptRepository:
@@ -12,9 +13,20 @@ class GptRepository:
     async def get_gpt_setting(self):
         result = await self.db.execute(
             select(GptSetting)
+            .order_by(GptSetting.id)
         )
         return result.scalars().first()
 
+    async def get_gpt_setting_stamp(self):
+        """활성 설정의 (id, revision)만 조회 - 캐시 재검증용"""
+        result = await self.db.execute(
+            select(GptSetting.id, GptSetting.revision)
+            .order_by(GptSetting.id)
+            .limit(1)
+        )
+        row = result.first()
+        return (row.id, row.revision) if row else None
+
     async def get_gpt_setting_by_id(self, gpt_setting_id: int):
         result = await self.db.execute(
             select(GptSetting)
@@ -35,7 +47,130 @@ class GptRepository:
             vc_file_ids=new_vc_file_ids,
             vc_file_names=new_vc_file_names,
         )
-        self.db.add(gpt_setting)
+        # id 가 있으면 기존 행 수정, 없으면 새로 추가
+        gpt_setting = await self.db.merge(gpt_setting)
+        # 기존 행이면 DB 에서 원자적으로 revision + 1 (같은 초에 두 번 저장돼도 스탬프가 바뀜)
+        if inspect(gpt_setting).persistent:
+            gpt_setting.revision = GptSetting.revision + 1
+        await self.db.flush()
+        saved_id = gpt_setting.id
+        await self.db.commit()
+        return saved_id
+
+    async def create_gpt_job(self, kind: str, payload: dict, total_files: int = 0) -> GptJob:
+        job = GptJob(kind=kind, payload=payload, total_files=total_files)
+        self.db.add(job)
+        await self.db.commit()
+        await self.db.refresh(job)
+        return job
+
+    async def get_gpt_job(self, job_id: int) -> GptJob | None:
+        result = await self.db.execute(
+            select(GptJob)
+            .where(GptJob.id == job_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def update_gpt_job(self, job: GptJob, **values) -> GptJob:
+        """진행 상황 갱신 (updated_at 도 같이 바뀌어서 하트비트 역할)"""
+        for key, value in values.items():
+            setattr(job, key, value)
+        job.updated_at = now_kst()
         await self.db.commit()
-        return True
-    
\ No newline at end of file
+        await self.db.refresh(job)
+        return job
+
+    async def fail_gpt_job(self, job_id: int, error: str) -> GptJob:
+        # 실패 지점의 트랜잭션이 깨져 있을 수 있으므로 롤백 후 다시 읽어서 기록
+        await self.db.rollback()
+        job = await self.get_gpt_job(job_id)
+        return await self.update_gpt_job(job, status="failed", error=error)
+
+    async def touch_gpt_job(self, job_id: int):
+        await self.db.execute(
+            update(GptJob)
+            .where(GptJob.id == job_id, GptJob.status == "running")
+            .values(updated_at=now_kst())
+        )
+        await self.db.commit()
+
+    @staticmethod
+    def _runnable(stale_before):
+        """실행 가능한 작업 조건: 대기 시각이 지난 pending, 또는 하트비트가 끊긴 running"""
+        now = now_kst()
+        return or_(
+            and_(
+                GptJob.status == "pending",
+                or_(GptJob.run_after.is_(None), GptJob.run_after <= now),
+            ),
+            and_(GptJob.status == "running", GptJob.updated_at < stale_before),
+        )
+
+    async def claim_gpt_job(self, job_id: int, stale_before) -> bool:
+        """실행 가능한 작업을 원자적으로 선점"""
+        result = await self.db.execute(
+            update(GptJob)
+            .where(
+                GptJob.id == job_id,
+                self._runnable(stale_before),
+            )
+            .values(status="running", updated_at=now_kst())
+        )
+        await self.db.commit()
+        return result.rowcount == 1
+
+    async def get_resumable_gpt_job_ids(self, stale_before) -> list[int]:
+        result = await self.db.execute(
+            select(GptJob.id)
+            .where(self._runnable(stale_before))
+            .order_by(GptJob.id)
+        )
+        return list(result.scalars().all())
+
+    async def get_gpt_file_ids_by_sha256(self, hashes: list[str]) -> dict[str, str]:
+        if not hashes:
+            return {}
+        result = await self.db.execute(
+            select(GptFile.sha256, GptFile.file_id)
+            .where(GptFile.sha256.in_(hashes))
+        )
+        return {row.sha256: row.file_id for row in result}
+
+    async def add_gpt_files(self, rows: list[dict]):
+        """해시 인덱스 등록 - 동시에 같은 해시가 들어오면 먼저 들어온 쪽을 유지"""
+        if not rows:
+            return
+        await self.db.execute(
+            insert(GptFile).prefix_with("IGNORE", dialect="mysql"),
+            rows,
+        )
+        await self.db.commit()
+
+    async def delete_gpt_files(self, file_ids: list[str]):
+        if not file_ids:
+            return
+        await self.db.execute(
+            delete(GptFile)
+            .where(GptFile.file_id.in_(file_ids))
+        )
+        await self.db.commit()
+
+    async def get_referenced_file_ids(
+        self,
+        exclude_setting_id: int | None = None,
+        exclude_job_id: int | None = None,
+    ) -> set[str]:
+        """설정과 진행 중인 작업이 참조하는 OpenAI 파일 id (행 수가 적으므로 전부 읽음)"""
+        setting_stmt = select(GptSetting.vc_file_ids)
+        if exclude_setting_id is not None:
+            setting_stmt = setting_stmt.where(GptSetting.id != exclude_setting_id)
+        job_stmt = select(GptJob.vc_file_ids).where(GptJob.status.in_(("pending", "running")))
+        if exclude_job_id is not None:
+            job_stmt = job_stmt.where(GptJob.id != exclude_job_id)
+
+        referenced = set()
+        for stmt in (setting_stmt, job_stmt):
+            result = await self.db.execute(stmt)
+            for file_ids in result.scalars():
+                referenced.update(fid for fid in (file_ids or []) if fid)
+        return referenced
@@ -0,0 +1,220 @@
+# app/module/gpt/gpt_resilience.py
+# 역할: OpenAI 호출 재시도(지터 포함 지수 백오프) / 조회 헤징 / 서킷 브레이커
+
+import asyncio
+import random
+import time
+from collections import deque
+
+from openai import APIConnectionError, APIStatusError, RateLimitError
+
+from app.core.config.settings import settings
+
+
+class CircuitOpen(Exception):
+    """upstream 오류율이 높아서 호출하지 않고 바로 실패"""
+
+    def __init__(self, retry_after: float):
+        super().__init__("openai circuit is open")
+        self.retry_after = retry_after
+
+
+def is_upstream_failure(e: BaseException) -> bool:
+    """upstream 이 아프다는 신호인 오류 (연결/타임아웃, 429, 5xx) - 4xx 는 요청 문제라 제외"""
+    if isinstance(e, (APIConnectionError, RateLimitError)):
+        return True
+    return isinstance(e, APIStatusError) and e.status_code >= 500
+
+
+class CircuitBreaker:
+    """최근 window 초 동안 오류율이 error_rate 이상이면 열림(open)
+
+    - open: cooldown 동안 모든 호출을 CircuitOpen 으로 바로 실패
+    - half_open: cooldown 이 지나면 호출 하나만 시험으로 통과, 성공하면 닫고 실패하면 다시 open
+    """
+
+    def __init__(self, window: float, min_calls: int, error_rate: float, cooldown: float):
+        self.window = window
+        self.min_calls = min_calls
+        self.error_rate = error_rate
+        self.cooldown = cooldown
+        self.state = "closed"
+        self.opened_at = 0.0
+        self.opened = 0
+        self._events: deque = deque()  # (time, ok)
+        self._probing = False
+
+    def _trim(self, now: float):
+        while self._events and now - self._events[0][0] > self.window:
+            self._events.popleft()
+
+    def _open(self, now: float):
+        self.state = "open"
+        self.opened_at = now
+        self.opened += 1
+        self._events.clear()
+
+    @property
+    def is_open(self) -> bool:
+        return self.state == "open" and time.monotonic() - self.opened_at < self.cooldown
+
+    def before_call(self):
+        now = time.monotonic()
+        if self.state == "open":
+            remaining = self.cooldown - (now - self.opened_at)
+            if remaining > 0:
+                raise CircuitOpen(remaining)
+            self.state = "half_open"
+        if self.state == "half_open":
+            if self._probing:
+                raise CircuitOpen(self.cooldown)
+            self._probing = True
+
+    def release(self):
+        """결과 없이 끝난 호출(취소) - 시험 호출 자리만 반환"""
+        self._probing = False
+
+    def record(self, ok: bool):
+        now = time.monotonic()
+        if self.state == "half_open":
+            self._probing = False
+            if ok:
+                self.state = "closed"
+                self._events.clear()
+            else:
+                self._open(now)
+            return
+        if self.state == "open":
+            return
+        self._events.append((now, ok))
+        self._trim(now)
+        if ok:
+            return
+        failures = sum(1 for _, event_ok in self._events if not event_ok)
+        if len(self._events) >= self.min_calls and failures / len(self._events) >= self.error_rate:
+            self._open(now)
+
+    def stats(self) -> dict:
+        self._trim(time.monotonic())
+        calls = len(self._events)
+        failures = sum(1 for _, ok in self._events if not ok)
+        return {
+            "state": "open" if self.is_open else ("half_open" if self.state != "closed" else "closed"),
+            "window_calls": calls,
+            "window_error_rate": round(failures / calls, 4) if calls else 0.0,
+            "opened": self.opened,
+        }
+
+
+class GptResilience:
+    """upstream 호출 하나를 재시도 / 헤징 / 서킷 브레이커로 감쌈
+
+    call() 의 factory 는 호출할 때마다 새 awaitable 을 만드는 함수 (재시도/헤징 때 다시 호출)
+    - idempotent=True 인 호출만 연결 오류/5xx 에서 재시도, 429 는 처리되지 않은 요청이라 항상 재시도
+    - hedge=True 인 조회는 지연이 그 작업의 최근 p95 를 넘으면 같은 요청을 하나 더 보내서 먼저 끝난 쪽 사용
+    """
+
+    # p95 를 믿을 수 있을 만큼 모인 뒤부터 헤징
+    HEDGE_MIN_SAMPLES = 20
+
+    def __init__(self):
+        self.breaker = CircuitBreaker(
+            window=settings.openai_breaker_window,
+            min_calls=settings.openai_breaker_min_calls,
+            error_rate=settings.openai_breaker_error_rate,
+            cooldown=settings.openai_breaker_cooldown,
+        )
+        self._latencies: dict[str, deque] = {}
+        self.retries = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    @staticmethod
+    def _retryable(e: BaseException, idempotent: bool) -> bool:
+        if isinstance(e, RateLimitError):
+            return True
+        return idempotent and is_upstream_failure(e)
+
+    @staticmethod
+    def _backoff(attempt: int, e: BaseException) -> float:
+        cap = min(settings.openai_retry_max_delay, settings.openai_retry_base * (2 ** (attempt - 1)))
+        delay = random.uniform(0, cap)
+        # 429 의 Retry-After 가 있으면 그보다 빨리 다시 보내지 않음
+        if isinstance(e, RateLimitError):
+            retry_after = e.response.headers.get("retry-after", "")
+            if retry_after.replace(".", "", 1).isdigit():
+                delay = max(delay, min(float(retry_after), settings.openai_retry_max_delay))
+        return delay
+
+    def _hedge_after(self, op: str) -> float | None:
+        samples = self._latencies.get(op)
+        if not samples or len(samples) < self.HEDGE_MIN_SAMPLES:
+            return None
+        ordered = sorted(samples)
+        p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+        return max(p95, settings.openai_hedge_min_delay)
+
+    async def _hedged(self, op: str, factory):
+        hedge_after = self._hedge_after(op)
+        if hedge_after is None:
+            return await factory()
+
+        first = asyncio.ensure_future(factory())
+        done, _ = await asyncio.wait({first}, timeout=hedge_after)
+        if done:
+            return first.result()
+
+        self.hedges += 1
+        second = asyncio.ensure_future(factory())
+        pending = {first, second}
+        errors = []
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is second:
+                            self.hedge_wins += 1
+                        return task.result()
+                    errors.append(task.exception())
+            raise errors[0]
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def call(self, op: str, factory, idempotent: bool = False, hedge: bool = False):
+        attempts = settings.openai_retry_attempts
+        for attempt in range(1, attempts + 1):
+            self.breaker.before_call()
+            started = time.monotonic()
+            try:
+                if hedge and settings.openai_hedge_enabled:
+                    result = await self._hedged(op, factory)
+                else:
+                    result = await factory()
+            except asyncio.CancelledError:
+                self.breaker.release()
+                raise
+            except Exception as e:
+                self.breaker.record(not is_upstream_failure(e))
+                if attempt >= attempts or not self._retryable(e, idempotent):
+                    raise
+                self.retries += 1
+                await asyncio.sleep(self._backoff(attempt, e))
+                continue
+            self.breaker.record(True)
+            self._latencies.setdefault(op, deque(maxlen=200)).append(time.monotonic() - started)
+            return result
+
+    def stats(self) -> dict:
+        return {
+            "breaker": self.breaker.stats(),
+            "retries": self.retries,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "hedge_after": {op: self._hedge_after(op) for op in self._latencies},
+        }
+
+
+# 전역 인스턴스 (워커 프로세스마다 하나)
+gpt_resilience = GptResilience()
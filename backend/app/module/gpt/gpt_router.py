@@ -14,10 +14,28 @@ router = APIRouter()
 @login
 async def get_gpt_setting_by_id(p: ServiceProvider):
     # return await p.gpt_service.get_gpt_setting_by_id(p.request)
-    return await p.gpt_service.get_gpt_setting()
+    return await p.gpt_service.get_gpt_setting(p.request)
+
+@router.get("/gpt_setting/cache_stats")
+@with_provider
+@login
+async def get_gpt_setting_cache_stats(p: ServiceProvider):
+    return await p.gpt_service.get_gpt_setting_cache_stats()
 
 @router.post("/gpt_setting/save")
 @with_provider
 @login
 async def save_gpt_setting(p: ServiceProvider):
-    return await p.gpt_service.save_gpt_setting(p.request)
\ No newline at end of file
+    return await p.gpt_service.save_gpt_setting(p.request)
+
+@router.get("/jobs/{job_id}")
+@with_provider
+@login
+async def get_gpt_job(p: ServiceProvider, job_id: int):
+    return await p.gpt_service.get_gpt_job(job_id)
+
+@router.post("/chat")
+@with_provider
+@login
+async def chat(p: ServiceProvider):
+    return await p.gpt_service.chat(p.request)
@@ -1,23 +1,56 @@
+import asyncio
+import logging
+from contextlib import ExitStack
+from datetime import timedelta
+
+from fastapi import HTTPException
 from fastapi.responses import JSONResponse
 from app.module.gpt.gpt_repository import GptRepository
-from openai import AsyncOpenAI
+from openai import AsyncOpenAI, NotFoundError
 from app.core.config.settings import settings
 from typing import List, Optional, Tuple
 from fastapi.encoders import jsonable_encoder
+from app.module.gpt.gpt_cache import gpt_answer_cache, gpt_setting_cache, invalidate_gpt_caches
+from app.core.database.base import now_kst
+from app.core.http.etag import conditional_json
+from app.core.http.sse import sse_event, sse_response
+from app.core.metrics.timing import timed
+from app.module.gpt.gpt_admission import AdmissionRejected, gpt_admission
+from app.module.gpt.gpt_chat import build_chat_request, estimate_tokens, normalize_question
+from app.module.gpt.gpt_flight import gpt_flight
+from app.module.gpt.gpt_job import gpt_job_runner
+from app.module.gpt.gpt_resilience import CircuitOpen, gpt_resilience
+from app.module.gpt.gpt_upload import open_staged, parse_upload_form, remove_staging, stage_files
+
+logger = logging.getLogger(__name__)
 
-client = AsyncOpenAI(api_key=settings.openai_api_key)
+# 재시도는 gpt_resilience 에서 하므로 SDK 자체 재시도는 끔
+client = AsyncOpenAI(
+    api_key=settings.openai_api_key,
+    base_url=settings.openai_base_url,
+    timeout=settings.openai_timeout,
+    max_retries=0,
+)
 
 class GptService:
     def __init__(self, repo: GptRepository):
         self.repo = repo
 
-    async def get_gpt_setting(self):
-        result = await self.repo.get_gpt_setting()
-        if result:
-            data = jsonable_encoder(result)
-            return JSONResponse(status_code=200, content=data)
-        else:
-            return JSONResponse(status_code=200, content=None)
+    async def get_gpt_setting(self, request):
+        data, etag = await gpt_setting_cache.get(self.repo, jsonable_encoder)
+        return conditional_json(request, etag, lambda: data)
+
+    async def get_gpt_setting_cache_stats(self):
+        return JSONResponse(
+            status_code=200,
+            content={
+                "setting": gpt_setting_cache.stats(),
+                "answer": gpt_answer_cache.stats(),
+                "flight": gpt_flight.stats(),
+                "admission": gpt_admission.stats(),
+                "resilience": gpt_resilience.stats(),
+            },
+        )
 
     async def get_gpt_setting_by_id(self,request):
         qp = request.query_params
@@ -30,8 +63,9 @@ class GptService:
             return JSONResponse(status_code=200, content=None)
 
     async def save_gpt_setting(self,request):
+        form = None
         try:
-            form = await request.form()
+            form = await parse_upload_form(request)
             gpt_setting_id = int(form.get("gpt_setting_id")) if form.get("gpt_setting_id") else None
             version = form.get("version")
             instruction = form.get("instruction")
@@ -41,54 +75,58 @@ class GptService:
             fall_back_text = form.get("fall_back_text")
             files = form.getlist("files")
 
-            print("gpt_setting_id", gpt_setting_id)
-            print("version", version)
-            print("instruction", instruction)
-            print("data_type", data_type)
-            print("learning_text", learning_text)
-            print("fall_back_type", fall_back_type)
-            print("fall_back_text", fall_back_text)
-            print("files", files)
+            # 지침/학습 텍스트 본문은 남기지 않고 크기만
+            logger.debug(
+                "save gpt setting",
+                extra={
+                    "gpt_setting_id": gpt_setting_id,
+                    "version": version,
+                    "data_type": data_type,
+                    "instruction_chars": len(instruction or ""),
+                    "learning_text_chars": len(learning_text or ""),
+                    "fall_back_type": fall_back_type,
+                    "files": len(files),
+                },
+            )
 
             new_vc_id = None
             new_vc_file_ids: list[str] = []
             new_vc_file_names: list[str] = []
+            existing_vc_id = None
+            existing_vc_file_ids: list[str] = []
 
             if data_type == "file":
                 learning_text = None
-                if gpt_setting_id:
-                    # 기존 설정이면 기존 VC 정보 가져와서 쓰고,
-                    # 필요하면 여기에 파일 추가 로직 나중에 넣으면 됨
-                    # gpt_setting = await self.repo.get_gpt_setting_by_id(gpt_setting_id)
-                    # new_vc_id = gpt_setting.vc_id
-                    # new_vc_file_ids = gpt_setting.vc_file_ids or []
-                    # new_vc_file_names = gpt_setting.vc_file_names or []
-
-                    # # 새 파일도 있다면 VC에 추가
-                    # if files:
-                    #     add_ids, add_names = await self.add_files(new_vc_id, files)
-                    #     new_vc_file_ids.extend(add_ids)
-                    #     new_vc_file_names.extend(add_names)
-                    print(gpt_setting_id)
-                else:
-                    new_vc_id = await self.create_vc()
-                    new_vc_file_ids, new_vc_file_names = await self.add_files(new_vc_id, files)
+                # 벡터 스토어 생성(수정이면 기존 파일과 diff) / 업로드 / 인덱싱은
+                # 백그라운드 작업으로 넘기고 바로 응답
+                job = await self.create_ingest_job(
+                    {
+                        "gpt_setting_id": gpt_setting_id,
+                        "version": version,
+                        "instruction": instruction,
+                        "data_type": data_type,
+                        "learning_text": learning_text,
+                        "fall_back_type": fall_back_type,
+                        "fall_back_text": fall_back_text,
+                    },
+                    files,
+                    keep_file_ids=form.getlist("keep_file_ids"),
+                )
+                return JSONResponse(
+                    status_code=202,
+                    content={"message": "gpt setting ingestion started", "job_id": job.id},
+                )
 
             elif data_type == "text":
                 if gpt_setting_id:
                     gpt_setting = await self.repo.get_gpt_setting_by_id(gpt_setting_id)
                     existing_vc_id = gpt_setting.vc_id
                     existing_vc_file_ids = gpt_setting.vc_file_ids or []
-                    await self.delete_files(existing_vc_id, existing_vc_file_ids)
 
                 new_vc_id = None
                 new_vc_file_ids = []
                 new_vc_file_names = []
 
-            print("new_vc_id", new_vc_id)
-            print("new_vc_file_ids", new_vc_file_ids)
-            print("new_vc_file_names", new_vc_file_names)
-
             result = await self.repo.save_gpt_setting(
                 gpt_setting_id,
                 version,
@@ -101,68 +139,516 @@ class GptService:
                 new_vc_file_ids,
                 new_vc_file_names,
             )
+            # 커밋 이후 캐시 무효화 (다른 워커는 TTL 재검증으로 반영)
+            invalidate_gpt_caches()
+            # 기존 파일 정리는 저장 후 백그라운드 작업으로 (요청은 기다리지 않음)
+            if result and (existing_vc_id or existing_vc_file_ids):
+                await self.release_files(existing_vc_id, existing_vc_file_ids, delete_vc=True)
             if result:
+                logger.info("gpt setting saved", extra={"gpt_setting_id": gpt_setting_id, "data_type": data_type})
                 return JSONResponse(status_code=200, content="gpt setting saved successfully")
             else:
                 return JSONResponse(status_code=500, content="gpt setting save failed")
+        except HTTPException:
+            raise
         except Exception as e:
-            print(f"[save_gpt_setting error] {e}")
+            logger.exception("save gpt setting failed")
             return JSONResponse(status_code=500, content="gpt setting save failed")
+        finally:
+            if form is not None:
+                await form.close()
+
+    # 활성 설정으로 질문에 답변 - 모델 토큰이 나오는 대로 SSE 로 전달
+    async def chat(self, request):
+        body = await request.json()
+        question = (body.get("question") or "").strip()
+        if not question:
+            raise HTTPException(status_code=422, detail="question is required")
+
+        setting, _ = await gpt_setting_cache.get(self.repo, jsonable_encoder)
+        if not setting:
+            raise HTTPException(status_code=404, detail="gpt setting not found")
+
+        # 같은 설정 + 같은 질문이면 캐시된 답변을 같은 SSE 형식으로 재생
+        cache_key = gpt_answer_cache.make_key(setting, normalize_question(question))
+        cached = gpt_answer_cache.get(cache_key)
+        if cached is not None:
+            return sse_response(self.replay_answer(cached))
+
+        # upstream 오류율이 높으면 호출하지 않고 대체 문구로 바로 응답
+        if gpt_resilience.breaker.is_open:
+            return sse_response(self.fallback_answer(setting))
+
+        # 같은 질문이 이미 생성 중이면 upstream 호출을 새로 만들지 않고 같은 스트림을 구독
+        # 새로 호출해야 하면 응답을 시작하기 전에 수락을 받아서, 밀리면 바로 503 으로 거절
+        flight_key = ("chat", *cache_key)
+        chat_request = build_chat_request(setting, question)
+        ticket = None
+        if not gpt_flight.streaming(flight_key):
+            try:
+                ticket = await gpt_admission.acquire(
+                    user=request.user_id,
+                    tokens=estimate_tokens(chat_request),
+                    timeout=settings.openai_queue_timeout,
+                )
+            except AdmissionRejected as e:
+                raise HTTPException(
+                    status_code=503,
+                    detail=e.reason,
+                    headers={"Retry-After": str(e.retry_after)},
+                )
+            # 기다리는 동안 다른 요청이 같은 질문을 시작했으면 그쪽을 구독
+            if gpt_flight.streaming(flight_key):
+                ticket.release()
+
+        deltas = gpt_flight.stream(flight_key, lambda: self.generate_answer(chat_request, cache_key, ticket))
+        return sse_response(self.stream_answer(setting, deltas))
+
+    async def replay_answer(self, answer: str):
+        yield sse_event({"delta": answer})
+        yield sse_event({"cached": True}, event="done")
+
+    async def fallback_answer(self, setting: dict):
+        if not setting.get("fall_back_text"):
+            yield sse_event({"message": "chat unavailable"}, event="error")
+            return
+        yield sse_event({"delta": setting["fall_back_text"]})
+        yield sse_event({"fallback": True}, event="done")
+
+    async def stream_answer(self, setting: dict, deltas):
+        started = False
+        try:
+            async for delta in deltas:
+                started = True
+                yield sse_event({"delta": delta})
+            yield sse_event({}, event="done")
+        except CircuitOpen:
+            if not started:
+                async for event in self.fallback_answer(setting):
+                    yield event
+            else:
+                yield sse_event({"message": "chat failed"}, event="error")
+        except Exception:
+            logger.exception("chat stream failed")
+            yield sse_event({"message": "chat failed"}, event="error")
+
+    # upstream 답변 생성 - 토큰 조각을 yield 하고 끝까지 받으면 답변 캐시에 저장
+    # 스트림이 끝날 때까지 수락 자리(ticket)를 잡고 있다가 반환
+    async def generate_answer(self, chat_request: dict, cache_key, ticket):
+        try:
+            # 첫 응답 전까지는 부작용이 없으므로 재시도 가능
+            stream = await gpt_resilience.call(
+                "chat",
+                lambda: timed("chat", client.responses.create)(**chat_request, stream=True),
+                idempotent=True,
+            )
+            parts = []
+            try:
+                async for event in stream:
+                    if event.type == "response.output_text.delta":
+                        parts.append(event.delta)
+                        yield event.delta
+                    elif event.type in ("response.failed", "error"):
+                        raise RuntimeError(f"upstream stream {event.type}")
+            except Exception:
+                # 스트리밍 도중 끊긴 것도 upstream 오류로 집계
+                gpt_resilience.breaker.record(False)
+                raise
+            # 끝까지 받은 답변만 캐시
+            gpt_answer_cache.set(cache_key, "".join(parts))
+        finally:
+            ticket.release()
+
+    async def get_gpt_job(self, job_id: int):
+        job = await self.repo.get_gpt_job(job_id)
+        if not job:
+            raise HTTPException(status_code=404, detail="job not found")
+        data = jsonable_encoder(job, exclude={"payload", "vc_file_ids"})
+        return JSONResponse(status_code=200, content=data)
+
+    # 인덱싱 작업 생성 - 파일은 요청이 끝나면 닫히므로 스테이징 디렉터리로 옮겨 둠
+    async def create_ingest_job(self, setting: dict, files, keep_file_ids=None):
+        # 이미 올라간 내용(sha256)은 스테이징 복사도 생략
+        hashes = [getattr(file, "sha256", None) for file in files if hasattr(file, "read")]
+        known = await self.repo.get_gpt_file_ids_by_sha256([h for h in hashes if h])
+        staging_key, staged = await stage_files(files, known_hashes=set(known))
+        try:
+            job = await self.repo.create_gpt_job(
+                "ingest",
+                {
+                    "setting": setting,
+                    "staging_key": staging_key,
+                    "files": staged,
+                    "keep_file_ids": list(keep_file_ids or []),
+                },
+                total_files=len(staged),
+            )
+        except BaseException:
+            remove_staging(staging_key)
+            raise
+        gpt_job_runner.enqueue(job.id)
+        return job
+
+    # 작업 실행 (GptJobRunner 워커에서 호출)
+    async def run_job(self, job_id: int):
+        job = await self.repo.get_gpt_job(job_id)
+        if not job:
+            return
+        if job.kind == "ingest":
+            await self.run_ingest_job(job)
+        elif job.kind == "cleanup":
+            await self.run_cleanup_job(job)
+
+    # vc 생성 -> 파일 업로드 -> 인덱싱 -> 설정 저장
+    # 단계마다 결과를 job 에 기록해서 재시작되면 끝난 단계는 건너뜀
+    # 기존 설정 수정이면 저장된 파일 목록과 diff 해서 새 파일만 올리고, 빠진 파일만 떼어냄
+    async def run_ingest_job(self, job):
+        job_id = job.id
+        payload = job.payload
+        setting = payload["setting"]
+        files = payload["files"]
+        finished = False
+        existing = None
+        existing_vc_id = None
+        new_file_ids: list[str] = []
+        try:
+            if setting["gpt_setting_id"]:
+                existing = await self.repo.get_gpt_setting_by_id(setting["gpt_setting_id"])
+                if not existing:
+                    raise RuntimeError(f"gpt setting {setting['gpt_setting_id']} not found")
+            # 커밋하면 ORM 객체가 만료되므로 필요한 값은 미리 꺼내 둠
+            existing_vc_id = existing.vc_id if existing else None
+            existing_ids = list(existing.vc_file_ids or []) if existing else []
+            existing_names = list(existing.vc_file_names or []) if existing else []
+
+            if not job.vc_id:
+                await self.repo.update_gpt_job(job, stage="create_vc")
+                await self.repo.update_gpt_job(job, vc_id=existing_vc_id or await self.create_vc())
+
+            vc_file_ids = list(job.vc_file_ids or [None] * len(files))
+            if not all(vc_file_ids):
+                await self.repo.update_gpt_job(job, stage="upload")
+                vc_file_ids = await self.resolve_files(payload["staging_key"], files, vc_file_ids)
+                await self.repo.update_gpt_job(job, vc_file_ids=vc_file_ids, uploaded_files=len(vc_file_ids))
+            vc_file_names = [f["name"] for f in files]
+
+            # 제출된 파일 집합 = 유지할 기존 파일(keep_file_ids) + 이번에 올린 파일
+            # 둘 다 없으면 파일은 건드리지 않고 나머지 설정만 수정
+            if existing and not files and not payload.get("keep_file_ids"):
+                vc_file_ids, vc_file_names = existing_ids, existing_names
+            elif existing:
+                keep = set(payload.get("keep_file_ids") or [])
+                kept = [(fid, name) for fid, name in zip(existing_ids, existing_names) if fid in keep]
+                vc_file_ids = [fid for fid, _ in kept] + vc_file_ids
+                vc_file_names = [name for _, name in kept] + vc_file_names
+            vc_file_ids, vc_file_names = self.dedupe_pair(vc_file_ids, vc_file_names)
+
+            # 이미 같은 vc 에 붙어 있는 파일은 다시 인덱싱하지 않음
+            attached = set(existing_ids) if job.vc_id == existing_vc_id else set()
+            new_file_ids = [fid for fid in vc_file_ids if fid not in attached]
+            removed_file_ids = [fid for fid in existing_ids if fid not in set(vc_file_ids)]
+
+            if new_file_ids:
+                await self.repo.update_gpt_job(job, stage="index")
+
+                async def on_progress(done):
+                    await self.repo.update_gpt_job(job, indexed_files=done)
+
+                await self.index_files(job.vc_id, new_file_ids, on_progress)
+
+            await self.repo.update_gpt_job(job, stage="save")
+            gpt_setting_id = await self.repo.save_gpt_setting(
+                setting["gpt_setting_id"],
+                setting["version"],
+                setting["instruction"],
+                setting["data_type"],
+                setting["learning_text"],
+                setting["fall_back_type"],
+                setting["fall_back_text"],
+                job.vc_id,
+                vc_file_ids,
+                vc_file_names,
+            )
+            invalidate_gpt_caches()
+            await self.repo.update_gpt_job(job, status="done", stage="done", gpt_setting_id=gpt_setting_id)
+            finished = True
+
+            # 설정이 저장된 뒤에 빠진 파일 정리 (실패해도 설정은 이미 반영됨)
+            if removed_file_ids:
+                try:
+                    await self.release_files(existing_vc_id, removed_file_ids)
+                except Exception:
+                    logger.warning("release files failed", extra={"job_id": job_id}, exc_info=True)
+        except Exception as e:
+            logger.exception("ingest job failed", extra={"job_id": job_id})
+            job = await self.repo.fail_gpt_job(job_id, str(e)[:500])
+            finished = True
+            # 실패한 작업이 붙인 파일과 만든 vc 정리 (다른 설정/작업이 같이 쓰는 파일은 유지)
+            if job.vc_id and job.vc_id != existing_vc_id:
+                await self.release_files(job.vc_id, [fid for fid in (job.vc_file_ids or []) if fid], delete_vc=True)
+            else:
+                await self.release_files(job.vc_id, new_file_ids)
+        finally:
+            if finished:
+                remove_staging(payload["staging_key"])
+
+    # 파일 id 채우기 - 해시 인덱스에 있으면 재사용, 없는 것만 업로드 후 인덱스에 등록
+    async def resolve_files(self, staging_key: str, files: list[dict], vc_file_ids: list) -> list[str]:
+        vc_file_ids = list(vc_file_ids)
+        pending = [i for i, fid in enumerate(vc_file_ids) if not fid]
+        known = await self.repo.get_gpt_file_ids_by_sha256(
+            [files[i]["sha256"] for i in pending if files[i]["sha256"]]
+        )
+        for i in pending:
+            vc_file_ids[i] = known.get(files[i]["sha256"])
+        pending = [i for i in pending if not vc_file_ids[i]]
+
+        # 요청 시점엔 인덱스에 있었지만 그 사이 지워져서 스테이징도 안 된 파일
+        missing = [files[i]["name"] for i in pending if not files[i]["path"]]
+        if missing:
+            raise RuntimeError(f"files no longer available, upload again: {missing}")
+
+        if pending:
+            with ExitStack() as stack:
+                handles = [
+                    (files[i]["name"], stack.enter_context(open_staged(staging_key, files[i]["path"])))
+                    for i in pending
+                ]
+                uploaded = await self.upload_files(handles)
+            for i, fid in zip(pending, uploaded):
+                vc_file_ids[i] = fid
+            await self.repo.add_gpt_files([
+                {
+                    "sha256": files[i]["sha256"],
+                    "file_id": vc_file_ids[i],
+                    "file_name": files[i]["name"],
+                    "size": files[i]["size"],
+                }
+                for i in pending
+                if files[i]["sha256"]
+            ])
+        return vc_file_ids
+
+    # 설정에서 떼어낸 파일 정리 작업 등록 - 실제 삭제는 백그라운드에서 실행하고 실패하면 재시도
+    async def release_files(self, vc_id, file_ids: list[str], delete_vc: bool = False):
+        if not file_ids and not (delete_vc and vc_id):
+            return None
+        job = await self.repo.create_gpt_job(
+            "cleanup",
+            {"vc_id": vc_id, "file_ids": list(file_ids), "delete_vc": delete_vc},
+            total_files=len(file_ids),
+        )
+        gpt_job_runner.enqueue(job.id)
+        return job
+
+    # vc 연결은 모두 해제하고, 다른 설정이나 진행 중인 작업이 참조하지 않는 파일만 실제 삭제
+    # 실패한 파일만 남겨서 지수 백오프로 재시도, 최대 횟수를 넘으면 failed
+    async def run_cleanup_job(self, job):
+        payload = job.payload
+        vc_id = payload["vc_id"]
+        attempts = (job.attempts or 0) + 1
+        await self.repo.update_gpt_job(job, stage="delete")
+
+        shared = await self.repo.get_referenced_file_ids()
+        results = await self.delete_files(vc_id, payload["file_ids"], keep_file_ids=shared)
+        await self.repo.delete_gpt_files([r["file_id"] for r in results if r["deleted"]])
+        failed_ids = [r["file_id"] for r in results if r["error"]]
+
+        vc_error = None
+        if not failed_ids and payload.get("delete_vc") and vc_id:
+            try:
+                await self.delete_vc(vc_id)
+            except NotFoundError:
+                pass
+            except Exception as e:
+                vc_error = str(e)
+
+        result = {"files": results, "vc_error": vc_error}
+        if not failed_ids and not vc_error:
+            await self.repo.update_gpt_job(job, status="done", stage="done", attempts=attempts, result=result)
+        elif attempts >= settings.gpt_cleanup_max_attempts:
+            await self.repo.update_gpt_job(
+                job, status="failed", stage="retry", attempts=attempts, result=result,
+                error=f"cleanup failed after {attempts} attempts",
+            )
+        else:
+            delay = settings.gpt_cleanup_retry_base * (2 ** (attempts - 1))
+            await self.repo.update_gpt_job(
+                job,
+                status="pending",
+                stage="retry",
+                attempts=attempts,
+                result=result,
+                payload={**payload, "file_ids": failed_ids},
+                run_after=now_kst() + timedelta(seconds=delay),
+            )
+            gpt_job_runner.enqueue_later(job.id, delay)
 
     # vc 생성
     async def create_vc(self) -> str:
-        vs = await client.vector_stores.create(name="gpt_vc")
+        # 재시도하면 vc 가 중복 생성될 수 있으므로 429 만 재시도
+        vs = await self.upstream("vc.create", client.vector_stores.create, name="gpt_vc")
         return vs.id
 
     # vc 삭제
     async def delete_vc(self, vc_id: str):
-        await client.vector_stores.delete(vector_store_id=vc_id)
+        await gpt_flight.do(
+            ("vc.delete", vc_id),
+            lambda: self.upstream(
+                "vc.delete",
+                client.vector_stores.delete,
+                vector_store_id=vc_id,
+                idempotent=True,
+            ),
+        )
         return True
 
     # vc 파일 추가
     async def add_files(self, vc_id, files):
-        vc_file_ids = []
-        vc_file_names = []
-        for file in files:
-            if hasattr(file, "read"):
-                file_name = file.filename
-                file_content = await file.read()
-            else:
-                continue
-            created = await client.files.create(
-                file=(file_name, file_content),
-                purpose="assistants",
-            )
-            vc_file_ids.append(created.id)
-            vc_file_names.append(file_name)
+        files = [file for file in files if hasattr(file, "read")]
+        vc_file_ids = await self.upload_files([(file.filename, file.file) for file in files])
+        vc_file_names = [file.filename for file in files]
 
         if vc_file_ids:
-            await client.vector_stores.file_batches.create_and_poll(
-                vector_store_id=vc_id,
-                file_ids=vc_file_ids,
-            )
+            await self.index_files(vc_id, vc_file_ids)
         return vc_file_ids, vc_file_names
 
-    # 파일 삭제
-    async def delete_files(self, vc_id: str, file_ids: list[str]):
-        for fid in file_ids:
-            try:
-                await client.vector_stores.files.delete(
+    # vc 에 파일 배치 연결 후 인덱싱 완료까지 폴링
+    async def index_files(self, vc_id: str, file_ids: list[str], on_progress=None):
+        # 같은 파일을 같은 vc 에 다시 붙이는 건 결과가 같으므로 재시도 가능
+        batch = await self.upstream(
+            "batch.create",
+            client.vector_stores.file_batches.create,
+            vector_store_id=vc_id,
+            file_ids=file_ids,
+            idempotent=True,
+        )
+        while batch.status == "in_progress":
+            if on_progress:
+                await on_progress(batch.file_counts.completed)
+            await asyncio.sleep(settings.gpt_job_poll_interval)
+            batch = await gpt_flight.do(
+                ("batch.retrieve", vc_id, batch.id),
+                lambda: self.upstream(
+                    "batch.retrieve",
+                    client.vector_stores.file_batches.retrieve,
+                    batch.id,
                     vector_store_id=vc_id,
-                    file_id=fid,
-                )
-            except Exception as e:
-                print(f"[unlink warn] vc={vc_id}, file={fid}, err={e}")
+                    idempotent=True,
+                    hedge=True,
+                ),
+            )
+        if on_progress:
+            await on_progress(batch.file_counts.completed)
+        if batch.status != "completed":
+            raise RuntimeError(f"file batch {batch.id} ended with status {batch.status}")
+        return batch
 
-        for fid in file_ids:
-            try:
-                await client.files.delete(fid)
-            except Exception as e:
-                print(f"[files.delete warn] file={fid}, err={e}")
+    # 파일 업로드 (동시 실행 수 제한, 입력 순서 유지)
+    # files 는 (파일명, 파일 객체) 목록 - 파일 객체를 그대로 넘겨서 청크 단위로 전송
+    async def upload_files(self, files) -> list[str]:
+        semaphore = asyncio.Semaphore(settings.openai_upload_concurrency)
+        uploaded: list[Optional[str]] = [None] * len(files)
+        failed = False
 
-        return True
+        async def upload(index, file_name, file_obj):
+            nonlocal failed
+            async with semaphore:
+                # 앞선 업로드가 실패했으면 대기 중이던 파일은 올리지 않음
+                if failed:
+                    return
+                async def create():
+                    # 재시도마다 처음부터 다시 보냄
+                    file_obj.seek(0)
+                    return await client.files.create(file=(file_name, file_obj), purpose="assistants")
+
+                try:
+                    created = await self.upstream("file.create", create)
+                except BaseException:
+                    failed = True
+                    raise
+                uploaded[index] = created.id
+
+        # 진행 중인 업로드는 취소하지 않고 끝까지 기다려야 원격에 고아 파일이 남지 않음
+        results = await asyncio.gather(
+            *(upload(i, file_name, file_obj) for i, (file_name, file_obj) in enumerate(files)),
+            return_exceptions=True,
+        )
+        errors = [r for r in results if isinstance(r, BaseException)]
+        if errors:
+            await self.discard_files([fid for fid in uploaded if fid])
+            raise errors[0]
+        return uploaded
+
+    # 업로드 실패 시 정리용 (vc 연결 전 파일만 삭제)
+    async def discard_files(self, file_ids: list[str]):
+        semaphore = asyncio.Semaphore(settings.openai_upload_concurrency)
+
+        async def discard(fid):
+            async with semaphore:
+                try:
+                    await self.delete_file(fid)
+                except Exception:
+                    logger.warning("file delete failed", extra={"file_id": fid}, exc_info=True)
+
+        await asyncio.gather(*(discard(fid) for fid in file_ids))
+
+    # 파일 삭제 (keep_file_ids 에 있는 파일은 vc 연결만 해제)
+    # 파일마다 연결 해제 -> 삭제를 동시 실행 수 제한 안에서 병렬로 처리하고 결과를 파일별로 반환
+    async def delete_files(self, vc_id: str, file_ids: list[str], keep_file_ids=frozenset()) -> list[dict]:
+        semaphore = asyncio.Semaphore(settings.openai_delete_concurrency)
+
+        async def delete(fid):
+            result = {"file_id": fid, "unlinked": False, "deleted": False, "error": None}
+            async with semaphore:
+                try:
+                    if vc_id:
+                        try:
+                            await gpt_flight.do(
+                                ("vc.file.delete", vc_id, fid),
+                                lambda: self.upstream(
+                                    "vc.file.delete",
+                                    client.vector_stores.files.delete,
+                                    vector_store_id=vc_id,
+                                    file_id=fid,
+                                    idempotent=True,
+                                ),
+                            )
+                        except NotFoundError:
+                            pass
+                        result["unlinked"] = True
+                    if fid not in keep_file_ids:
+                        try:
+                            await self.delete_file(fid)
+                        except NotFoundError:
+                            pass
+                        result["deleted"] = True
+                except Exception as e:
+                    result["error"] = str(e)
+            return result
+
+        return await asyncio.gather(*(delete(fid) for fid in file_ids))
+
+    # 파일 삭제 (동시에 같은 파일을 지우는 정리 작업끼리는 호출 하나를 공유)
+    async def delete_file(self, file_id: str):
+        return await gpt_flight.do(
+            ("file.delete", file_id),
+            lambda: self.upstream("file.delete", client.files.delete, file_id, idempotent=True),
+        )
+
+    # upstream 호출 공통 경로 - 재시도/헤징/서킷 브레이커 안에서 시도마다 수락 제어를 거침
+    # 시도마다 실제 호출 시간(대기열 대기 제외)을 op 별로 기록
+    @staticmethod
+    async def upstream(op: str, fn, *args, idempotent: bool = False, hedge: bool = False, **kwargs):
+        return await gpt_resilience.call(
+            op,
+            lambda: gpt_admission.call(timed(op, fn), *args, **kwargs),
+            idempotent=idempotent,
+            hedge=hedge,
+        )
 
     # 중복 제거
+    @staticmethod
     def dedupe_pair(ids: List[str], names: List[Optional[str]]) -> Tuple[List[str], List[Optional[str]]]:
         seen = set()
         out_ids, out_names = [], []
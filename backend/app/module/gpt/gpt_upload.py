@@ -0,0 +1,178 @@
+# app/module/gpt/gpt_upload.py
+# 역할: 학습 파일 업로드 폼을 크기 제한을 걸면서 스트리밍 파싱하고, 백그라운드 작업용으로 스테이징
+
+import hashlib
+import shutil
+import uuid
+from pathlib import Path
+
+from fastapi import HTTPException
+import starlette
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import FormData, Headers
+from starlette.formparsers import MultiPartException, MultiPartParser, MultipartPart
+from starlette.requests import Request
+
+from app.core.config.settings import settings
+
+CHUNK_SIZE = 1024 * 1024
+
+
+class UploadTooLarge(MultiPartException):
+    """요청/파일 크기, 파일 수 초과 (파서가 임시 파일을 닫도록 MultiPartException 상속)"""
+
+
+def _check_parser_internals():
+    """LimitedMultiPartParser 가 쓰는 Starlette 비공개 속성(_current_part.file)이 있는지 확인
+
+    starlette 버전은 requirements.txt 에 고정되어 있지만, 올리다가 구조가 바뀌면
+    업로드 제한이 조용히 빠지지 않도록 import 시점에 바로 실패시킴
+    """
+    part = getattr(MultiPartParser(Headers(), None), "_current_part", None)
+    if not isinstance(part, MultipartPart) or not hasattr(part, "file"):
+        raise ImportError(
+            f"starlette {starlette.__version__}: MultiPartParser._current_part changed, "
+            "update LimitedMultiPartParser"
+        )
+
+
+_check_parser_internals()
+
+
+class LimitedMultiPartParser(MultiPartParser):
+    """파일 파트마다 누적 크기를 세서 max_file_size 를 넘으면 즉시 중단, 파일 수는 max_upload_files 까지
+
+    파일 데이터가 들어오는 대로 SHA-256 도 같이 계산해서 UploadFile.sha256 에 기록
+    (중복 제거용, 파일을 다시 읽지 않음)
+    """
+
+    def __init__(self, *args, max_file_size: int, max_upload_files: int, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.max_file_size = max_file_size
+        self.max_upload_files = max_upload_files
+        self._upload_files = 0
+        self._current_file_size = 0
+        self._current_hash = None
+
+    def _current_upload(self):
+        """지금 파싱 중인 파트의 UploadFile (일반 필드면 None) - 비공개 속성 접근은 여기서만"""
+        return self._current_part.file
+
+    def on_part_begin(self) -> None:
+        super().on_part_begin()
+        self._current_file_size = 0
+        self._current_hash = hashlib.sha256()
+
+    def on_headers_finished(self) -> None:
+        super().on_headers_finished()
+        if self._current_upload() is not None:
+            self._upload_files += 1
+            if self._upload_files > self.max_upload_files:
+                raise UploadTooLarge(f"too many files, maximum is {self.max_upload_files}")
+
+    def on_part_data(self, data: bytes, start: int, end: int) -> None:
+        if self._current_upload() is not None:
+            self._current_file_size += end - start
+            if self._current_file_size > self.max_file_size:
+                raise UploadTooLarge(
+                    f"file exceeded maximum size of {self.max_file_size // (1024 * 1024)}MB"
+                )
+            self._current_hash.update(data[start:end])
+        super().on_part_data(data, start, end)
+
+    def on_part_end(self) -> None:
+        upload = self._current_upload()
+        if upload is not None:
+            upload.sha256 = self._current_hash.hexdigest()
+        super().on_part_end()
+
+
+async def _limited_stream(request: Request, max_request_size: int):
+    """요청 본문을 읽으면서 누적 크기가 max_request_size 를 넘으면 중단"""
+    received = 0
+    async for chunk in request.stream():
+        received += len(chunk)
+        if received > max_request_size:
+            raise UploadTooLarge(
+                f"request exceeded maximum size of {max_request_size // (1024 * 1024)}MB"
+            )
+        yield chunk
+
+
+async def parse_upload_form(request: Request) -> FormData:
+    """multipart 폼 파싱 - 파일은 SpooledTemporaryFile 로만 받고 메모리에 통째로 올리지 않음
+
+    반환된 폼은 호출한 쪽에서 form.close() 로 닫아야 함
+    """
+    max_request_size = settings.gpt_upload_max_request_size
+    max_file_size = settings.gpt_upload_max_file_size
+
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > max_request_size:
+        raise HTTPException(status_code=413, detail="request body too large")
+
+    content_type = request.headers.get("content-type", "")
+    if not content_type.startswith("multipart/form-data"):
+        return await request.form()
+
+    parser = LimitedMultiPartParser(
+        request.headers,
+        _limited_stream(request, max_request_size),
+        max_file_size=max_file_size,
+        max_upload_files=settings.gpt_upload_max_files,
+    )
+    try:
+        return await parser.parse()
+    except UploadTooLarge as e:
+        raise HTTPException(status_code=413, detail=e.message)
+    except MultiPartException as e:
+        raise HTTPException(status_code=400, detail=e.message)
+
+
+def _staging_dir(staging_key: str) -> Path:
+    return settings.GPT_STAGING_ROOT / staging_key
+
+
+def _copy_to(src, dst_path: Path):
+    src.seek(0)
+    with open(dst_path, "wb") as dst:
+        shutil.copyfileobj(src, dst, CHUNK_SIZE)
+
+
+async def stage_files(files, known_hashes=frozenset()) -> tuple[str, list[dict]]:
+    """업로드된 파일을 요청이 끝난 뒤에도 쓸 수 있도록 스테이징 디렉터리로 복사
+
+    청크 단위로 복사하고 스레드풀에서 실행해서 메모리/이벤트 루프를 붙잡지 않음
+    같은 내용(sha256)은 한 번만 남기고, known_hashes 에 있는 파일은 이미 OpenAI 에
+    올라가 있으므로 복사하지 않음 (path = None)
+    """
+    staging_key = uuid.uuid4().hex
+    directory = _staging_dir(staging_key)
+    directory.mkdir(parents=True, exist_ok=True)
+    staged = []
+    seen = set()
+    try:
+        for index, file in enumerate(files):
+            if not hasattr(file, "read"):
+                continue
+            sha256 = getattr(file, "sha256", None)
+            if sha256 and sha256 in seen:
+                continue
+            seen.add(sha256)
+            path = None
+            if sha256 not in known_hashes:
+                path = str(index)
+                await run_in_threadpool(_copy_to, file.file, directory / path)
+            staged.append({"name": file.filename, "path": path, "sha256": sha256, "size": file.size})
+    except BaseException:
+        remove_staging(staging_key)
+        raise
+    return staging_key, staged
+
+
+def open_staged(staging_key: str, path: str):
+    return open(_staging_dir(staging_key) / path, "rb")
+
+
+def remove_staging(staging_key: str):
+    shutil.rmtree(_staging_dir(staging_key), ignore_errors=True)
@@ -1,8 +1,11 @@
 # app/module/user/user_repository.py
-from sqlalchemy import select
+from sqlalchemy import func, select
+from sqlalchemy.dialects.mysql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import lazyload
 
+from app.core.database.base import now_kst
+from app.module.auth.auth_cache import Principal, principal_cache
 from app.module.user.user import User
 
 
@@ -10,11 +13,44 @@ class UserRepository:
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def get_user_by_id(self, user_id: int):
+    async def get_user_by_id(self, user_id: int) -> User | None:
         result = await self.db.execute(
             select(User)
             .options(lazyload("*"))
             .where(User.id == user_id)
         )
-        return result.scalar_one()
-    
\ No newline at end of file
+        return result.scalar_one_or_none()
+
+    async def get_or_create_user(self, email: str, name: str | None, picture: str | None) -> Principal:
+        """user_email 기준 upsert 로 가입/로그인 처리 (select 후 insert 경쟁 없음)
+
+        - 없으면 새로 insert, 있으면 last_login_at 만 갱신
+        - ON DUPLICATE KEY UPDATE 에서 id = LAST_INSERT_ID(id) 로 기존 행 id 도 lastrowid 로 받음
+        - 그 id 로 토큰 발급에 필요한 컬럼만 다시 읽음 (upsert + PK 조회, 두 번 왕복)
+        """
+        now = now_kst()
+        nickname = (name or email.split("@")[0])[: User.user_nickname.type.length]
+        stmt = insert(User).values(
+            user_nickname=nickname,
+            user_email=email,
+            user_profile_image=picture or None,
+            active=True,
+            created_at=now,
+            last_login_at=now,
+        )
+        stmt = stmt.on_duplicate_key_update(
+            id=func.LAST_INSERT_ID(User.id),
+            last_login_at=stmt.inserted.last_login_at,
+        )
+        result = await self.db.execute(stmt)
+        user_id = result.lastrowid
+        await self.db.commit()
+        # Core upsert 는 ORM 이벤트를 거치지 않으므로 직접 무효화
+        principal_cache.invalidate("user", user_id)
+
+        # 기존 행이면 닉네임/가입일은 저장된 값이어야 하므로 입력값 대신 다시 읽음
+        result = await self.db.execute(
+            select(User.user_nickname, User.created_at, User.active).where(User.id == user_id)
+        )
+        row = result.one()
+        return Principal(id=user_id, user_nickname=row.user_nickname, created_at=row.created_at, active=row.active is not False)
@@ -1,4 +1,8 @@
 # app/module/user/user_service.py
+from fastapi import HTTPException
+from fastapi.encoders import jsonable_encoder
+
+from app.core.http.etag import conditional_json, row_etag
 from app.module.user.user_repository import UserRepository
 
 class UserService:
@@ -7,4 +11,8 @@ class UserService:
 
     async def get_me(self, request):
         user_id = request.user_id
-        return await self.repo.get_user_by_id(user_id)
\ No newline at end of file
+        user = await self.repo.get_user_by_id(user_id)
+        # 삭제된 유저의 토큰이 아직 유효한 경우
+        if user is None:
+            raise HTTPException(status_code=404, detail="user not found")
+        return conditional_json(request, row_etag(user), lambda: jsonable_encoder(user))
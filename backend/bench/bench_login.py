@@ -0,0 +1,86 @@
+# bench/bench_login.py
+# 역할: 관리자 로그인 처리량과, 로그인 부하 중 다른 요청의 지연(p99) 비교
+#
+# - before: 이벤트 루프에서 바로 Argon2 해시 + 검증 (기존 구현)
+# - after: PasswordService 전용 스레드 풀에서 검증만 (현재 구현)
+# 로그인 요청을 동시에 CONCURRENCY 개 보내면서 가벼운 GET 을 10ms 간격으로 보내 지연을 잼
+#
+# 실행: python -m bench.bench_login [초]
+
+import asyncio
+import sys
+import time
+
+# 환경 변수 기본값을 채우는 모듈이라 app 보다 먼저 import
+from bench.common import access_token, app_client, summary
+
+from fastapi import HTTPException
+from passlib.context import CryptContext
+
+from app.core.database.base import SessionLocal
+from app.core.security.password import password_service
+from app.module.admin.admin import Admin
+from app.module.admin.admin_service import AdminService
+
+CONCURRENCY = 8
+EMAIL = "bench@example.com"
+PASSWORD = "bench-password"
+
+legacy_context = CryptContext(schemes=["argon2"], deprecated="auto")
+current_login = AdminService.admin_login
+
+
+async def legacy_login(self, request):
+    body = await request.json()
+    admin = await self.admin_repo.get_admin_by_email(body["admin_email"])
+    legacy_context.hash(body["admin_password"])
+    if not admin or not legacy_context.verify(body["admin_password"], admin.admin_password):
+        raise HTTPException(status_code=401, detail="invalid credentials")
+    return admin
+
+
+async def phase(client, name: str, login_impl, seconds: float):
+    AdminService.admin_login = login_impl
+    deadline = time.monotonic() + seconds
+    logins = 0
+    probe_ms: list[float] = []
+
+    async def login_loop():
+        nonlocal logins
+        while time.monotonic() < deadline:
+            response = await client.post("/api/admin/login", json={"admin_email": EMAIL, "admin_password": PASSWORD})
+            assert response.status_code == 200, response.text
+            logins += 1
+
+    async def probe_loop():
+        while time.monotonic() < deadline:
+            started = time.perf_counter()
+            await client.get("/api/gpt/gpt_setting/cache_stats")
+            probe_ms.append((time.perf_counter() - started) * 1000)
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(probe_loop(), *(login_loop() for _ in range(CONCURRENCY)))
+    print(f"{name:<8} {logins / seconds:7.1f} logins/s  probe {summary(probe_ms)}")
+
+
+async def main(seconds: float):
+    async with app_client() as client:
+        async with SessionLocal() as session:
+            session.add(Admin(admin_email=EMAIL, admin_password=await password_service.hash(PASSWORD)))
+            await session.commit()
+        client.cookies.set("access_token", access_token())
+
+        idle_ms = []
+        for _ in range(200):
+            started = time.perf_counter()
+            await client.get("/api/gpt/gpt_setting/cache_stats")
+            idle_ms.append((time.perf_counter() - started) * 1000)
+        print(f"idle     probe {summary(idle_ms)}")
+
+        await phase(client, "before", legacy_login, seconds)
+        await phase(client, "after", current_login, seconds)
+    password_service.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(float(sys.argv[1]) if len(sys.argv) > 1 else 5.0))
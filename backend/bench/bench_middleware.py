@@ -0,0 +1,138 @@
+# bench/bench_middleware.py
+# 역할: CORS + 보안 헤더 미들웨어 요청당 비용 비교 (BaseHTTPMiddleware / Starlette CORS -> 순수 ASGI)
+#
+# - none: 미들웨어 없음 (라우팅 + JSON 응답만)
+# - before: Starlette CORSMiddleware + BaseHTTPMiddleware 보안 헤더 (기존 구현)
+# - after: app.core.middleware 의 CORSMiddleware + SecureHeadersMiddleware (현재 구현)
+# ASGI 앱을 직접 호출해서 허용 origin 의 GET /ping 요청당 시간과,
+# SSE 조각이 버퍼링 없이 도착하는 시각(ms), preflight 응답 헤더를 같이 출력
+#
+# 실행: python -m bench.bench_middleware [반복 횟수]
+
+import asyncio
+import statistics
+import sys
+import time
+
+# 환경 변수 기본값을 채우는 모듈이라 app 보다 먼저 import
+import bench.common  # noqa: F401
+
+from fastapi import FastAPI, Request
+from fastapi.middleware.cors import CORSMiddleware as StarletteCORSMiddleware
+from fastapi.responses import StreamingResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.core.middleware.cors import CORSMiddleware
+from app.core.middleware.secure_headers_middleware import SecureHeadersMiddleware
+
+ORIGINS = ["http://localhost:3000", "http://127.0.0.1:3000"]
+ORIGIN = [(b"origin", b"http://localhost:3000")]
+
+
+class LegacySecureHeadersMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        response = await call_next(request)
+        response.headers["X-Content-Type-Options"] = "nosniff"
+        response.headers["X-Frame-Options"] = "DENY"
+        response.headers["X-XSS-Protection"] = "1; mode=block"
+        response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
+        return response
+
+
+def make_app(kind: str) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    @app.get("/sse")
+    async def sse():
+        async def events():
+            for i in range(3):
+                yield f"data: {i}\n\n"
+                await asyncio.sleep(0.05)
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    if kind == "before":
+        app.add_middleware(
+            StarletteCORSMiddleware,
+            allow_origins=ORIGINS,
+            allow_credentials=True,
+            allow_methods=["*"],
+            allow_headers=["*"],
+        )
+        app.add_middleware(LegacySecureHeadersMiddleware)
+    elif kind == "after":
+        app.add_middleware(CORSMiddleware, origins=ORIGINS)
+        app.add_middleware(SecureHeadersMiddleware)
+    return app
+
+
+async def call(app, path: str, headers=(), method: str = "GET"):
+    """(요청 시작부터의 초, ASGI 메시지) 목록"""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"bench"), *headers],
+        "client": ("127.0.0.1", 1),
+        "server": ("bench", 80),
+    }
+    received = False
+
+    async def receive():
+        nonlocal received
+        if not received:
+            received = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await asyncio.sleep(10)
+        return {"type": "http.disconnect"}
+
+    messages = []
+    started = time.perf_counter()
+
+    async def send(message):
+        messages.append((time.perf_counter() - started, message))
+
+    await app(scope, receive, send)
+    return messages
+
+
+async def main(iterations: int):
+    preflight = ORIGIN + [
+        (b"access-control-request-method", b"POST"),
+        (b"access-control-request-headers", b"content-type"),
+    ]
+    for kind in ("none", "before", "after"):
+        app = make_app(kind)
+        for _ in range(500):
+            await call(app, "/ping", ORIGIN)
+        runs = []
+        for _ in range(5):
+            started = time.perf_counter()
+            for _ in range(iterations):
+                await call(app, "/ping", ORIGIN)
+            runs.append((time.perf_counter() - started) / iterations * 1e6)
+
+        sse = await call(app, "/sse", ORIGIN)
+        chunks = [round(t * 1000) for t, m in sse if m["type"] == "http.response.body" and m.get("body")]
+        headers = dict(sse[0][1]["headers"])
+        answer = (await call(app, "/ping", preflight, method="OPTIONS"))[0][1]
+        print(
+            f"{kind:<6} /ping best {min(runs):6.1f}us median {statistics.median(runs):6.1f}us"
+            f" | sse chunks at {chunks}ms"
+            f" | acao={headers.get(b'access-control-allow-origin')} xfo={headers.get(b'x-frame-options')}"
+            f" | preflight {answer['status']} {sorted(name.decode() for name, _ in answer['headers'])}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000))
@@ -0,0 +1,136 @@
+# bench/bench_provider.py
+# 역할: 요청마다 만드는 ServiceProvider 비용 비교 (container 도입 전 / 후)
+#
+# - before: 프로퍼티마다 함수 안에서 import, token_util 은 auth_service(세션 + AuthToken 생성)를 거침
+# - after: 앱 시작 시 wire() 한 container 에서 클래스/싱글턴을 꺼냄 (현재 구현)
+# 쿠키만 쓰는 경로(token_util 만)와 service 세 개를 쓰는 경로를 각각 N 번 만들고 닫는 시간(요청당 us)
+#
+# 실행: python -m bench.bench_provider [반복 횟수]
+
+import asyncio
+import sys
+import time
+
+# 환경 변수 기본값을 채우는 모듈이라 app 보다 먼저 import
+from bench.common import app_client
+
+from app.core.database.base import SessionLocal
+from app.core.provider.service import ServiceProvider
+
+
+class LegacyServiceProvider:
+    """container 도입 전 ServiceProvider (벤치에 필요한 프로퍼티만)"""
+
+    def __init__(self, request, db=None):
+        self.request = request
+        self._db = db
+        self._owns_db = db is None
+        self._user_repo = None
+        self._admin_repo = None
+        self._gpt_repo = None
+        self._auth_repo = None
+        self._auth_service = None
+        self._admin_service = None
+        self._gpt_service = None
+
+    @property
+    def db(self):
+        if self._db is None:
+            self._db = SessionLocal()
+        return self._db
+
+    async def close(self):
+        if self._owns_db and self._db is not None:
+            await self._db.close()
+            self._db = None
+
+    @property
+    def user_repo(self):
+        if not self._user_repo:
+            from app.module.user.user_repository import UserRepository
+            self._user_repo = UserRepository(self.db)
+        return self._user_repo
+
+    @property
+    def admin_repo(self):
+        if not self._admin_repo:
+            from app.module.admin.admin_repository import AdminRepository
+            self._admin_repo = AdminRepository(self.db)
+        return self._admin_repo
+
+    @property
+    def gpt_repo(self):
+        if not self._gpt_repo:
+            from app.module.gpt.gpt_repository import GptRepository
+            self._gpt_repo = GptRepository(self.db)
+        return self._gpt_repo
+
+    @property
+    def auth_repo(self):
+        if not self._auth_repo:
+            from app.module.auth.auth_repository import AuthRepository
+            self._auth_repo = AuthRepository(self.db)
+        return self._auth_repo
+
+    @property
+    def auth_service(self):
+        if not self._auth_service:
+            from app.module.auth.auth_service import AuthService
+            self._auth_service = AuthService(self.user_repo, self.auth_repo)
+        return self._auth_service
+
+    @property
+    def admin_service(self):
+        if not self._admin_service:
+            from app.module.admin.admin_service import AdminService
+            self._admin_service = AdminService(self.admin_repo)
+        return self._admin_service
+
+    @property
+    def gpt_service(self):
+        if not self._gpt_service:
+            from app.module.gpt.gpt_service import GptService
+            self._gpt_service = GptService(self.gpt_repo)
+        return self._gpt_service
+
+    @property
+    def token_util(self):
+        return self.auth_service.token_util
+
+
+class FakeRequest:
+    cookies = {}
+
+
+async def per_request_us(provider_class, touch, iterations: int) -> float:
+    """5 번 돌려서 가장 빠른 회차의 요청당 시간 (us)"""
+    best = float("inf")
+    for _ in range(5):
+        started = time.perf_counter()
+        for _ in range(iterations):
+            provider = provider_class(FakeRequest())
+            touch(provider)
+            await provider.close()
+        best = min(best, (time.perf_counter() - started) / iterations * 1e6)
+    return best
+
+
+def token_only(p):
+    return p.token_util
+
+
+def three_services(p):
+    return p.gpt_service, p.admin_service, p.auth_service
+
+
+async def main(iterations: int):
+    # app import + container.wire() 까지 끝낸 상태에서 측정
+    async with app_client():
+        for label, touch in (("token_util only", token_only), ("gpt+admin+auth", three_services)):
+            before = await per_request_us(LegacyServiceProvider, touch, iterations)
+            after = await per_request_us(ServiceProvider, touch, iterations)
+            print(f"{label:<16} before {before:7.2f}us  after {after:7.2f}us")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000))
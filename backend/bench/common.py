@@ -0,0 +1,72 @@
+# bench/common.py
+# 역할: 벤치마크 공통 - 필수 환경 변수 기본값, 임시 sqlite DB 에 붙인 ASGI 클라이언트, 지연 분위수 출력
+#
+# backend 디렉터리에서 실행: python -m bench.bench_login
+
+import os
+
+# settings 는 import 시점에 환경 변수를 읽으므로 app 보다 먼저 채움 (MySQL 에는 연결하지 않음)
+for _key, _value in {
+    "LOCAL_MYSQL_USER": "bench",
+    "LOCAL_MYSQL_PASSWORD": "bench",
+    "LOCAL_MYSQL_HOST": "localhost",
+    "LOCAL_MYSQL_DB": "bench",
+    "PROD_MYSQL_USER": "bench",
+    "PROD_MYSQL_PASSWORD": "bench",
+    "PROD_MYSQL_HOST": "localhost",
+    "PROD_MYSQL_DB": "bench",
+    "JWT_SECRET": "bench-secret-bench-secret-bench-secret",
+    "HASH_KEY": "bench-hash-key",
+    "OPENAI_API_KEY": "sk-bench",
+    "LOG_LEVEL": "WARNING",
+}.items():
+    os.environ.setdefault(_key, _value)
+
+import tempfile
+from contextlib import asynccontextmanager
+from datetime import timedelta
+
+import httpx
+import jwt
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.config.settings import settings
+from app.core.database import base
+
+
+@asynccontextmanager
+async def app_client():
+    """임시 sqlite 파일 DB 로 바꾼 앱에 요청을 보내는 httpx 클라이언트"""
+    import app.module.admin.admin  # noqa: F401
+    import app.module.auth.auth  # noqa: F401
+    import app.module.gpt.gpt  # noqa: F401
+    import app.module.user.user  # noqa: F401
+    from app.main import app
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp}/bench.db")
+        async with engine.begin() as conn:
+            await conn.run_sync(base.Base.metadata.create_all)
+        base.SessionLocal.configure(bind=engine)
+        try:
+            async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+                yield client
+        finally:
+            base.SessionLocal.configure(bind=base.engine)
+            await engine.dispose()
+
+
+def access_token(user_id: int = 1) -> str:
+    payload = {"sub": str(user_id), "user": "admin", "type": "access", "exp": base.now_kst() + timedelta(hours=1)}
+    return jwt.encode(payload, settings.jwt_secret, algorithm="HS256")
+
+
+def summary(samples_ms: list[float]) -> str:
+    ordered = sorted(samples_ms)
+    if not ordered:
+        return "n=0"
+
+    def at(q):
+        return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+    return f"p50={at(0.5):.2f}ms p99={at(0.99):.2f}ms max={ordered[-1]:.2f}ms n={len(ordered)}"
@@ -0,0 +1,99 @@
+# tests/conftest.py
+# 역할: 테스트 공통 설정 - 필수 환경 변수 기본값, sqlite 엔진, ASGI 테스트 클라이언트
+
+import os
+
+# settings 는 import 시점에 환경 변수를 읽으므로 app 보다 먼저 채움 (MySQL 에는 연결하지 않음)
+for _key, _value in {
+    "LOCAL_MYSQL_USER": "test",
+    "LOCAL_MYSQL_PASSWORD": "test",
+    "LOCAL_MYSQL_HOST": "localhost",
+    "LOCAL_MYSQL_DB": "test",
+    "PROD_MYSQL_USER": "test",
+    "PROD_MYSQL_PASSWORD": "test",
+    "PROD_MYSQL_HOST": "localhost",
+    "PROD_MYSQL_DB": "test",
+    "JWT_SECRET": "test-secret-test-secret-test-secret",
+    "HASH_KEY": "test-hash-key",
+    "OPENAI_API_KEY": "sk-test",
+}.items():
+    os.environ.setdefault(_key, _value)
+
+import uuid
+from datetime import timedelta
+
+import httpx
+import jwt
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.config.settings import settings
+from app.core.database import base
+from app.core.metrics.database import TimedQueuePool, instrument_engine
+
+# 테이블 등록 (Base.metadata 에 모든 모델이 올라오도록)
+import app.module.admin.admin  # noqa: E402,F401
+import app.module.auth.auth  # noqa: E402,F401
+import app.module.gpt.gpt  # noqa: E402,F401
+import app.module.user.user  # noqa: E402,F401
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+async def engine(tmp_path):
+    """테스트마다 새 sqlite 파일 DB
+
+    SessionLocal 의 bind 만 바꾸므로 모듈에서 import 해 둔 SessionLocal 도 같은 DB 를 씀
+    운영 엔진과 같은 풀 클래스 / 쿼리 계측을 붙임
+    """
+    test_engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}", poolclass=TimedQueuePool)
+    instrument_engine(test_engine)
+    async with test_engine.begin() as conn:
+        await conn.run_sync(base.Base.metadata.create_all)
+    base.SessionLocal.configure(bind=test_engine)
+    try:
+        yield test_engine
+    finally:
+        base.SessionLocal.configure(bind=base.engine)
+        await test_engine.dispose()
+
+
+@pytest.fixture
+async def client(engine):
+    from app.main import app
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as c:
+        yield c
+
+
+def make_token(user_id: int, type: str = "access", kind: str = "user", **claims) -> str:
+    """AuthToken.create_jwt_token 과 같은 형식의 JWT"""
+    payload = {
+        "sub": str(user_id),
+        "user": kind,
+        "type": type,
+        "exp": base.now_kst() + timedelta(hours=1),
+        **claims,
+    }
+    return jwt.encode(payload, settings.jwt_secret, algorithm="HS256")
+
+
+async def create_user(active: bool = True) -> int:
+    from app.module.user.user import User
+
+    async with base.SessionLocal() as session:
+        user = User(
+            user_nickname="tester",
+            user_email=f"{uuid.uuid4().hex}@example.com",
+            active=active,
+            created_at=base.now_kst(),
+        )
+        session.add(user)
+        await session.flush()
+        user_id = user.id
+        await session.commit()
+    return user_id
@@ -0,0 +1,120 @@
+# tests/fake_openai.py
+# 역할: 테스트용 가짜 OpenAI API (ASGI 앱) - 미리 넣어 둔 응답(상태 코드/지연/헤더)을 차례로 돌려줌
+
+import asyncio
+import json
+from collections import deque
+from dataclasses import dataclass, field
+
+import httpx
+from openai import AsyncOpenAI
+
+
+@dataclass
+class Reply:
+    status: int = 200
+    delay: float = 0.0
+    headers: dict = field(default_factory=dict)
+    body: dict | None = None
+    # 주어지면 responses.create(stream=True) 용 SSE 로 이 조각들을 보냄
+    deltas: list[str] | None = None
+    # True 면 deltas 뒤에 response.completed 대신 response.failed 로 끝냄 (스트리밍 도중 실패)
+    fail_stream: bool = False
+    # 주어지면 이 경로로 온 요청에만 사용 (동시에 여러 호출이 섞이는 작업 테스트용)
+    path: str | None = None
+
+
+class FakeOpenAI:
+    """받은 요청은 requests 에 쌓고, 응답은 script 앞에서부터 하나씩 꺼내 씀
+
+    script 가 비어 있으면 바로 200 (본문은 요청 경로에 맞는 최소 객체, 업로드한 파일은 file_1, file_2 ...)
+    """
+
+    def __init__(self):
+        self.script: deque[Reply] = deque()
+        self.requests: list[tuple[str, str]] = []
+        # JSON 요청 본문 (method, path, body) - 업로드 같은 multipart 요청은 남기지 않음
+        self.json_bodies: list[tuple[str, str, dict]] = []
+        self.uploaded = 0
+
+    def reply(self, status: int = 200, times: int = 1, **kwargs):
+        for _ in range(times):
+            self.script.append(Reply(status=status, **kwargs))
+
+    def client(self) -> AsyncOpenAI:
+        """이 앱으로 요청을 보내는 AsyncOpenAI (SDK 재시도는 끔 - 운영 클라이언트와 같게)"""
+        return AsyncOpenAI(
+            api_key="sk-test",
+            base_url="http://fake-openai/v1",
+            max_retries=0,
+            http_client=httpx.AsyncClient(transport=httpx.ASGITransport(app=self)),
+        )
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return
+        received = b""
+        while True:
+            message = await receive()
+            received += message.get("body", b"")
+            if not message.get("more_body"):
+                break
+        method, path = scope["method"], scope["path"]
+        self.requests.append((method, path))
+        if received and dict(scope["headers"]).get(b"content-type", b"").startswith(b"application/json"):
+            self.json_bodies.append((method, path, json.loads(received)))
+        reply = self._next_reply(path)
+        if reply.delay:
+            await asyncio.sleep(reply.delay)
+
+        if reply.status == 200 and reply.deltas is not None:
+            await self._stream(send, reply.deltas, reply.fail_stream)
+            return
+        body = reply.body
+        if body is None:
+            body = self._default_body(method, path) if reply.status < 400 else {"error": {"message": f"fake {reply.status}"}}
+        headers = [(b"content-type", b"application/json")]
+        headers += [(k.encode(), str(v).encode()) for k, v in reply.headers.items()]
+        await send({"type": "http.response.start", "status": reply.status, "headers": headers})
+        await send({"type": "http.response.body", "body": json.dumps(body).encode()})
+
+    def _next_reply(self, path: str) -> Reply:
+        for reply in self.script:
+            if reply.path is None or reply.path == path:
+                self.script.remove(reply)
+                return reply
+        return Reply()
+
+    def _default_body(self, method: str, path: str) -> dict:
+        if "/file_batches" in path:
+            return {"id": "vsfb_fake", "object": "vector_store.file_batch", "status": "completed",
+                    "file_counts": {"completed": 0, "failed": 0, "in_progress": 0, "cancelled": 0, "total": 0}}
+        if method == "POST" and path.endswith("/files") and "/vector_stores" not in path:
+            self.uploaded += 1
+            return {"id": f"file_{self.uploaded}", "object": "file"}
+        if method == "DELETE":
+            return {"id": path.rsplit("/", 1)[-1], "object": "deleted", "deleted": True}
+        if "/vector_stores" in path:
+            return {"id": "vs_fake", "object": "vector_store", "status": "completed"}
+        if "/files" in path:
+            return {"id": "file_fake", "object": "file", "deleted": True}
+        return {"id": "fake", "object": "unknown"}
+
+    @staticmethod
+    async def _stream(send, deltas: list[str], fail: bool = False):
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"text/event-stream")],
+        })
+        events = [
+            {"type": "response.output_text.delta", "delta": delta, "item_id": "msg_fake",
+             "output_index": 0, "content_index": 0, "sequence_number": index}
+            for index, delta in enumerate(deltas)
+        ]
+        events.append({"type": "response.failed" if fail else "response.completed", "sequence_number": len(deltas),
+                       "response": {"id": "resp_fake", "object": "response", "output": []}})
+        for event in events:
+            chunk = f"event: {event['type']}\ndata: {json.dumps(event)}\n\n".encode()
+            await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        await send({"type": "http.response.body", "body": b""})
@@ -0,0 +1,103 @@
+# tests/test_auth_cache.py
+
+import uuid
+
+import pytest
+from sqlalchemy import select
+
+from app.core.database.base import SessionLocal
+from app.module.auth.auth_cache import principal_cache
+from app.module.user.user import User
+from conftest import create_user, make_token
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture(autouse=True)
+def clear_principal_cache():
+    principal_cache.invalidate("user")
+    principal_cache.invalidate("admin")
+    yield
+    principal_cache.invalidate("user")
+    principal_cache.invalidate("admin")
+
+
+class CountingLoader:
+    def __init__(self):
+        self.calls = 0
+
+    async def __call__(self, user_id):
+        self.calls += 1
+        async with SessionLocal() as session:
+            return (await session.execute(select(User).where(User.id == user_id))).scalar_one_or_none()
+
+
+async def test_cache_hit_skips_loader(engine):
+    user_id = await create_user()
+    loader = CountingLoader()
+
+    await principal_cache.get("user", user_id, loader)
+    principal = await principal_cache.get("user", user_id, loader)
+
+    assert principal.user_nickname == "tester"
+    assert loader.calls == 1
+
+
+async def test_orm_update_invalidates_cached_principal(engine):
+    user_id = await create_user()
+    loader = CountingLoader()
+    await principal_cache.get("user", user_id, loader)
+
+    async with SessionLocal() as session:
+        user = await session.get(User, user_id)
+        user.user_nickname = "renamed"
+        await session.commit()
+
+    principal = await principal_cache.get("user", user_id, loader)
+    assert loader.calls == 2
+    assert principal.user_nickname == "renamed"
+
+
+async def test_orm_delete_invalidates_cached_principal(engine):
+    user_id = await create_user()
+    loader = CountingLoader()
+    await principal_cache.get("user", user_id, loader)
+
+    async with SessionLocal() as session:
+        await session.delete(await session.get(User, user_id))
+        await session.commit()
+
+    assert await principal_cache.get("user", user_id, loader) is None
+    assert loader.calls == 2
+
+
+async def refresh(client, user_id: int):
+    client.cookies.set("refresh_token", make_token(user_id, type="refresh", jti=uuid.uuid4().hex))
+    return await client.post("/api/auth/refresh_token")
+
+
+async def test_refresh_rejects_inactive_user(client):
+    user_id = await create_user(active=False)
+
+    response = await refresh(client, user_id)
+
+    assert response.status_code == 403
+    assert response.json()["detail"] == "inactive user"
+
+
+async def test_refresh_rejects_user_deactivated_after_caching(client):
+    user_id = await create_user()
+    assert (await refresh(client, user_id)).status_code == 200
+
+    # 같은 워커에서 ORM 으로 비활성화하면 캐시가 무효화되어 바로 거절
+    async with SessionLocal() as session:
+        (await session.get(User, user_id)).active = False
+        await session.commit()
+
+    assert (await refresh(client, user_id)).status_code == 403
+
+
+async def test_refresh_for_missing_user_is_404(client):
+    response = await refresh(client, 999)
+
+    assert response.status_code == 404
@@ -0,0 +1,105 @@
+# tests/test_auth_revocation.py
+
+import time
+import uuid
+
+import pytest
+from sqlalchemy import func, select
+
+from app.core.database.base import SessionLocal
+from app.module.auth.auth import RevokedToken
+from app.module.auth.auth_repository import AuthRepository
+from app.module.auth.auth_revocation import RevocationStore, revocation_store, to_db_time
+from conftest import create_user, make_token
+
+pytestmark = pytest.mark.anyio
+
+
+def use_refresh(client, token: str):
+    client.cookies.clear()
+    client.cookies.set("refresh_token", token)
+    return client.post("/api/auth/refresh_token")
+
+
+async def test_refresh_rotates_and_rejects_reused_token(client):
+    user_id = await create_user()
+    old = make_token(user_id, type="refresh", jti=uuid.uuid4().hex)
+
+    response = await use_refresh(client, old)
+    assert response.status_code == 200
+    new = response.cookies["refresh_token"]
+    assert new != old
+
+    replay = await use_refresh(client, old)
+    assert replay.status_code == 401
+    assert replay.json()["detail"] == "refresh token revoked"
+
+    assert (await use_refresh(client, new)).status_code == 200
+
+
+async def test_reuse_is_rejected_by_db_when_mirror_missed_it(client):
+    """다른 워커가 폐기해서 미러에 아직 없어도 unique 제약으로 재사용을 막음"""
+    user_id = await create_user()
+    jti = uuid.uuid4().hex
+    old = make_token(user_id, type="refresh", jti=jti)
+    assert (await use_refresh(client, old)).status_code == 200
+
+    revocation_store._revoked.pop(jti)
+
+    assert (await use_refresh(client, old)).status_code == 401
+
+
+async def test_logout_revokes_refresh_token(client):
+    user_id = await create_user()
+    jti = uuid.uuid4().hex
+    refresh = make_token(user_id, type="refresh", jti=jti)
+    client.cookies.set("access_token", make_token(user_id))
+    client.cookies.set("refresh_token", refresh)
+
+    response = await client.post("/api/auth/logout")
+
+    assert response.status_code == 200
+    assert revocation_store.is_revoked(jti)
+    async with SessionLocal() as session:
+        count = await session.scalar(select(func.count()).select_from(RevokedToken).where(RevokedToken.jti == jti))
+    assert count == 1
+    assert (await use_refresh(client, refresh)).status_code == 401
+
+
+async def revoke(jti: str, exp: float):
+    async with SessionLocal() as session:
+        assert await AuthRepository(session).revoke_token(jti, to_db_time(exp))
+
+
+async def test_store_sync_picks_up_revocations_from_other_workers(engine):
+    store = RevocationStore(sync_interval=60, prune_interval=3600)
+    before = uuid.uuid4().hex
+    await revoke(before, time.time() + 600)
+
+    # 처음 sync 는 만료되지 않은 폐기 목록 전체
+    await store.sync()
+    assert store.is_revoked(before)
+
+    # 이후 sync 는 최근 폐기분만 읽어도 다른 워커가 방금 폐기한 jti 를 반영
+    after = uuid.uuid4().hex
+    await revoke(after, time.time() + 600)
+    assert not store.is_revoked(after)
+    await store.sync()
+    assert store.is_revoked(after)
+
+
+async def test_store_prune_drops_expired_entries(engine):
+    store = RevocationStore(sync_interval=60, prune_interval=0)
+    expired = uuid.uuid4().hex
+    live = uuid.uuid4().hex
+    await revoke(expired, time.time() - 60)
+    await revoke(live, time.time() + 600)
+    store.add(expired, time.time() - 60)
+
+    await store.sync()
+
+    assert not store.is_revoked(expired)
+    assert store.is_revoked(live)
+    async with SessionLocal() as session:
+        remaining = (await session.scalars(select(RevokedToken.jti))).all()
+    assert remaining == [live]
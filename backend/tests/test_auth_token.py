@@ -0,0 +1,113 @@
+# tests/test_auth_token.py
+
+import base64
+import json
+import time
+from types import SimpleNamespace
+
+import jwt
+import pytest
+from fastapi import HTTPException
+
+from app.core.config.settings import settings
+from app.module.auth import auth_token
+from app.module.auth.auth_token import AccessTokenVerifier
+from conftest import make_token
+
+
+def verifier() -> AccessTokenVerifier:
+    return AccessTokenVerifier(settings.jwt_secret, algorithms=("HS256",), cache_size=16)
+
+
+def rejected(verifier, token) -> str:
+    with pytest.raises(HTTPException) as exc:
+        verifier.verify(token)
+    assert exc.value.status_code == 401
+    return exc.value.detail
+
+
+def with_payload(token: str, **changes) -> str:
+    """서명은 그대로 두고 payload 만 바꾼 토큰"""
+    header, payload, signature = token.split(".")
+    claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+    claims.update(changes)
+    payload = base64.urlsafe_b64encode(json.dumps(claims).encode()).rstrip(b"=").decode()
+    return f"{header}.{payload}.{signature}"
+
+
+def test_valid_token_is_cached():
+    v = verifier()
+    token = make_token(7)
+
+    assert v.verify(token) == 7
+    assert v.verify(token) == 7
+    assert (v.hits, v.misses) == (1, 1)
+
+
+def test_tampered_token_is_rejected_even_after_original_is_cached():
+    v = verifier()
+    token = make_token(7)
+    v.verify(token)
+
+    # 서명이 같아도 토큰 전체가 다르면 캐시를 쓰지 않고 다시 검증
+    assert "Signature" in rejected(v, with_payload(token, sub="1"))
+    assert v.hits == 0
+
+
+def test_cache_hit_requires_the_same_token():
+    v = verifier()
+    v.verify(make_token(7))
+
+    assert v.verify(make_token(8, jti="other")) == 8
+    assert v.hits == 0
+
+
+def test_expired_token_is_rejected():
+    v = verifier()
+    token = jwt.encode(
+        {"sub": "7", "type": "access", "exp": int(time.time()) - 10}, settings.jwt_secret, algorithm="HS256"
+    )
+
+    assert rejected(v, token) == "access token expired"
+
+
+def test_cached_entry_expires_with_token(monkeypatch):
+    v = verifier()
+    token = jwt.encode(
+        {"sub": "7", "type": "access", "exp": int(time.time()) + 60}, settings.jwt_secret, algorithm="HS256"
+    )
+    v.verify(token)
+
+    # 캐시에 적힌 exp 가 지나면 캐시로 통과시키지 않고 다시 검증 (jwt 시계는 그대로라 검증은 성공)
+    now = time.time()
+    monkeypatch.setattr(auth_token, "time", SimpleNamespace(time=lambda: now + 120))
+
+    assert v.verify(token) == 7
+    assert (v.hits, v.misses) == (0, 2)
+
+
+def test_refresh_token_is_rejected():
+    v = verifier()
+
+    assert rejected(v, make_token(7, type="refresh")) == "invalid token type"
+    assert len(v._cache) == 0
+
+
+def test_missing_or_invalid_sub_is_rejected():
+    v = verifier()
+    no_sub = jwt.encode(
+        {"type": "access", "exp": int(time.time()) + 60}, settings.jwt_secret, algorithm="HS256"
+    )
+
+    assert "sub" in rejected(v, no_sub)
+    assert rejected(v, make_token("abc")) == "invalid access payload"
+
+
+def test_wrong_secret_and_missing_token_are_rejected():
+    v = verifier()
+    forged = jwt.encode(
+        {"sub": "7", "type": "access", "exp": int(time.time()) + 60}, "another-secret-another-secret!!", algorithm="HS256"
+    )
+
+    assert "invalid access token" in rejected(v, forged)
+    assert rejected(v, None) == "access token not found"
@@ -0,0 +1,157 @@
+# tests/test_compression.py
+
+import asyncio
+import gzip
+import zlib
+
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse, Response, StreamingResponse
+from starlette.routing import Route
+
+from app.core.middleware.compression import CompressionMiddleware, negotiate
+
+pytestmark = pytest.mark.anyio
+
+TEXT = "압축 테스트 " * 200
+EVENTS = [f"event: delta\ndata: {{\"delta\": \"{i}\"}}\n\n" for i in range(3)]
+
+
+async def sse(request):
+    async def events():
+        for event in EVENTS:
+            yield event
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
+app = CompressionMiddleware(
+    Starlette(routes=[
+        Route("/text", lambda r: PlainTextResponse(TEXT, headers={"ETag": '"abc"'}), methods=["GET", "HEAD"]),
+        Route("/small", lambda r: PlainTextResponse("tiny")),
+        Route("/no-content", lambda r: Response(status_code=204)),
+        Route("/not-modified", lambda r: Response(status_code=304, headers={"ETag": '"abc"'})),
+        Route("/encoded", lambda r: Response(TEXT.encode(), media_type="text/plain", headers={"Content-Encoding": "br"})),
+        Route("/no-transform", lambda r: PlainTextResponse(TEXT, headers={"Cache-Control": "no-transform"})),
+        Route("/image", lambda r: Response(b"\x89PNG" * 500, media_type="image/png")),
+        Route("/vary", lambda r: PlainTextResponse(TEXT, headers={"Vary": "Accept-Encoding, Cookie"})),
+        Route("/sse", sse),
+    ]),
+    min_size=100,
+    level=6,
+)
+
+
+async def request(path, accept_encoding="gzip", method="GET"):
+    """미들웨어가 보낸 ASGI 메시지를 그대로 모음 (본문 조각 단위 확인용)"""
+    scope = {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "headers": [(b"accept-encoding", accept_encoding.encode())] if accept_encoding else [],
+    }
+    messages = []
+    requests = [{"type": "http.request", "body": b"", "more_body": False}]
+
+    async def receive():
+        if requests:
+            return requests.pop()
+        # 본문을 다 보낸 뒤에는 응답이 끝날 때까지 연결 유지
+        await asyncio.Event().wait()
+
+    async def send(message):
+        messages.append(message)
+
+    await app(scope, receive, send)
+    start = messages[0]
+    headers = {}
+    for name, value in start["headers"]:
+        headers.setdefault(name.decode().lower(), []).append(value.decode())
+    chunks = [m.get("body", b"") for m in messages[1:]]
+    return start["status"], headers, chunks
+
+
+@pytest.mark.parametrize("header, expected", [
+    ("gzip, deflate", "gzip"),
+    ("deflate, gzip", "gzip"),
+    ("gzip;q=0.5, deflate;q=0.8", "deflate"),
+    ("GZIP;Q=1", "gzip"),
+    ("gzip;q=0", None),
+    ("gzip;q=0, *;q=0.1", "deflate"),
+    ("*", "gzip"),
+    ("br, identity", None),
+    ("gzip;q=bogus, deflate", "deflate"),
+])
+def test_negotiate_honours_q_values(header, expected):
+    assert negotiate(header.encode()) == expected
+
+
+@pytest.mark.parametrize("encoding, decompress", [
+    ("gzip", gzip.decompress),
+    ("deflate", zlib.decompress),
+])
+async def test_body_is_compressed_with_negotiated_encoding(encoding, decompress):
+    status, headers, chunks = await request("/text", encoding)
+    body = b"".join(chunks)
+
+    assert status == 200
+    assert headers["content-encoding"] == [encoding]
+    assert headers["vary"] == ["Accept-Encoding"]
+    assert headers["content-length"] == [str(len(body))]
+    assert decompress(body) == TEXT.encode()
+
+
+async def test_strong_etag_becomes_weak():
+    _, headers, _ = await request("/text")
+
+    assert headers["etag"] == ['W/"abc"']
+
+
+async def test_existing_vary_is_not_duplicated():
+    _, headers, _ = await request("/vary")
+
+    assert headers["vary"] == ["Accept-Encoding, Cookie"]
+
+
+@pytest.mark.parametrize("path, accept_encoding", [
+    ("/small", "gzip"),
+    ("/no-content", "gzip"),
+    ("/not-modified", "gzip"),
+    ("/encoded", "gzip"),
+    ("/no-transform", "gzip"),
+    ("/image", "gzip"),
+    ("/text", "identity"),
+    ("/text", None),
+])
+async def test_passes_through_uncompressed(path, accept_encoding):
+    status, headers, chunks = await request(path, accept_encoding)
+
+    # 이미 인코딩된 응답은 원래 Content-Encoding 그대로
+    assert headers.get("content-encoding") == (["br"] if path == "/encoded" else None)
+    assert "vary" not in headers
+    if status == 304:
+        assert headers["etag"] == ['"abc"']
+    if path == "/text":
+        assert b"".join(chunks) == TEXT.encode()
+
+
+async def test_head_is_not_compressed():
+    status, headers, _ = await request("/text", method="HEAD")
+
+    assert status == 200
+    assert "content-encoding" not in headers
+    assert headers["etag"] == ['"abc"']
+
+
+async def test_sse_events_are_flushed_one_by_one():
+    status, headers, chunks = await request("/sse")
+
+    assert headers["content-encoding"] == ["gzip"]
+    assert "content-length" not in headers
+    # 조각마다 Z_SYNC_FLUSH 되어서, 받은 만큼만 풀어도 그 이벤트가 온전히 나옴
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    decoded = [decompressor.decompress(chunk).decode() for chunk in chunks]
+    assert decoded[:len(EVENTS)] == EVENTS
+    assert "".join(decoded[len(EVENTS):]) == ""
+    assert decompressor.eof
@@ -0,0 +1,101 @@
+# tests/test_cors.py
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+
+from app.core.middleware.cors import ALLOW_METHODS, CORSMiddleware
+from app.core.middleware.secure_headers_middleware import SecureHeadersMiddleware
+
+pytestmark = pytest.mark.anyio
+
+ALLOWED = "http://localhost:3000"
+DISALLOWED = "http://evil.example"
+
+
+@pytest.fixture
+async def client():
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return JSONResponse({"ok": True}, headers={"vary": "Accept-Encoding"})
+
+    @app.post("/ping")
+    async def post_ping():
+        return {"ok": True}
+
+    app.add_middleware(CORSMiddleware, origins=[ALLOWED, "http://127.0.0.1:3000"])
+    app.add_middleware(SecureHeadersMiddleware)
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as c:
+        yield c
+
+
+def preflight(client, origin, request_headers=None):
+    headers = {"origin": origin, "access-control-request-method": "POST"}
+    if request_headers:
+        headers["access-control-request-headers"] = request_headers
+    return client.options("/ping", headers=headers)
+
+
+async def test_preflight_from_disallowed_origin_is_400(client):
+    response = await preflight(client, DISALLOWED)
+
+    assert response.status_code == 400
+    assert response.text == "Disallowed CORS origin"
+    assert "access-control-allow-origin" not in response.headers
+    assert response.headers["vary"] == "Origin"
+
+
+async def test_preflight_from_allowed_origin(client):
+    response = await preflight(client, ALLOWED, "content-type, x-request-id")
+
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == ALLOWED
+    assert response.headers["access-control-allow-credentials"] == "true"
+    assert response.headers["access-control-allow-methods"] == ALLOW_METHODS.decode()
+    assert response.headers["access-control-allow-headers"] == "content-type, x-request-id"
+    assert response.headers["access-control-max-age"] == "600"
+    assert "Origin" in response.headers.get_list("vary")
+    # preflight 응답에도 보안 헤더
+    assert response.headers["x-frame-options"] == "DENY"
+
+
+async def test_allowed_origin_gets_precomputed_headers(client):
+    response = await client.get("/ping", headers={"origin": ALLOWED})
+
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == ALLOWED
+    assert response.headers["access-control-allow-credentials"] == "true"
+    # 핸들러가 넣은 Vary 는 그대로 두고 Origin 을 추가
+    assert response.headers.get_list("vary") == ["Accept-Encoding", "Origin"]
+
+
+async def test_each_allowed_origin_is_echoed(client):
+    response = await client.post("/ping", headers={"origin": "http://127.0.0.1:3000"})
+
+    assert response.headers["access-control-allow-origin"] == "http://127.0.0.1:3000"
+
+
+async def test_disallowed_origin_passes_through_without_cors_headers(client):
+    response = await client.get("/ping", headers={"origin": DISALLOWED})
+
+    assert response.status_code == 200
+    assert "access-control-allow-origin" not in response.headers
+    assert "access-control-allow-credentials" not in response.headers
+
+
+async def test_same_origin_request_is_untouched(client):
+    response = await client.get("/ping")
+
+    assert "access-control-allow-origin" not in response.headers
+    assert response.headers.get_list("vary") == ["Accept-Encoding"]
+
+
+async def test_options_without_request_method_is_not_a_preflight(client):
+    response = await client.options("/ping", headers={"origin": ALLOWED})
+
+    # 일반 OPTIONS 요청은 라우터로 넘어감 (등록된 OPTIONS 핸들러가 없어 405)
+    assert response.status_code == 405
+    assert response.headers["access-control-allow-origin"] == ALLOWED
@@ -0,0 +1,142 @@
+# tests/test_etag.py
+
+import pytest
+from sqlalchemy import delete
+from starlette.requests import Request
+
+from app.core.database.base import SessionLocal
+from app.core.http.etag import conditional_json, etag_matches, make_etag, row_etag
+from app.module.gpt.gpt_cache import invalidate_gpt_caches
+from app.module.gpt.gpt_repository import GptRepository
+from app.module.user.user import User
+from conftest import create_user, make_token
+
+pytestmark = pytest.mark.anyio
+
+
+def make_request(if_none_match=None) -> Request:
+    headers = [] if if_none_match is None else [(b"if-none-match", if_none_match.encode())]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+def test_make_etag_is_stable_quoted_and_order_sensitive():
+    etag = make_etag(1, "a", None)
+
+    assert etag == make_etag(1, "a", None)
+    assert etag.startswith('"') and etag.endswith('"') and len(etag) == 34
+    assert etag != make_etag("a", 1, None)
+    # 구분자 덕분에 값 경계가 달라지면 다른 ETag
+    assert make_etag("ab", "c") != make_etag("a", "bc")
+
+
+def test_row_etag_changes_with_any_column():
+    user = User(id=1, user_nickname="tester", user_email="a@example.com", active=True)
+    etag = row_etag(user)
+
+    user.user_nickname = "renamed"
+
+    assert row_etag(user) != etag
+
+
+def test_etag_matches_handles_weak_lists_and_wildcard():
+    etag = make_etag("x")
+
+    assert not etag_matches(make_request(), etag)
+    assert etag_matches(make_request(etag), etag)
+    assert etag_matches(make_request(f"W/{etag}"), etag)
+    assert etag_matches(make_request(f'"other", W/{etag} , "third"'), etag)
+    assert etag_matches(make_request("*"), etag)
+    assert not etag_matches(make_request('"other", W/"another"'), etag)
+
+
+def test_conditional_json_skips_build_on_match():
+    etag = make_etag("x")
+    built = []
+
+    def build():
+        built.append(1)
+        return {"ok": True}
+
+    fresh = conditional_json(make_request(), etag, build)
+    cached = conditional_json(make_request(etag), etag, build)
+
+    assert fresh.status_code == 200
+    assert fresh.headers["etag"] == etag
+    assert fresh.headers["cache-control"] == "private, no-cache"
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == etag
+    assert cached.body == b""
+    assert built == [1]
+
+
+async def test_me_round_trip_and_new_etag_after_change(client):
+    user_id = await create_user()
+    client.cookies.set("access_token", make_token(user_id))
+
+    first = await client.get("/api/user/me")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+
+    cached = await client.get("/api/user/me", headers={"if-none-match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == etag
+
+    async with SessionLocal() as session:
+        user = await session.get(User, user_id)
+        user.user_nickname = "renamed"
+        await session.commit()
+
+    changed = await client.get("/api/user/me", headers={"if-none-match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert changed.json()["user_nickname"] == "renamed"
+
+
+async def test_me_for_deleted_user_is_404(client):
+    user_id = await create_user()
+    async with SessionLocal() as session:
+        await session.execute(delete(User).where(User.id == user_id))
+        await session.commit()
+
+    client.cookies.set("access_token", make_token(user_id))
+    response = await client.get("/api/user/me")
+
+    assert response.status_code == 404
+
+
+@pytest.fixture
+def fresh_gpt_caches():
+    invalidate_gpt_caches()
+    yield
+    invalidate_gpt_caches()
+
+
+async def save_setting(setting_id, instruction) -> int:
+    async with SessionLocal() as session:
+        saved_id = await GptRepository(session).save_gpt_setting(
+            setting_id, "gpt-4o", instruction, "text", "자료", True, "대체 문구", None, [], []
+        )
+        await session.commit()
+    return saved_id
+
+
+async def test_gpt_setting_round_trip_and_new_etag_after_save(client, fresh_gpt_caches):
+    setting_id = await save_setting(None, "v1")
+    client.cookies.set("access_token", make_token(await create_user()))
+
+    first = await client.get("/api/gpt/gpt_setting")
+    assert first.status_code == 200
+    assert first.json()["instruction"] == "v1"
+    etag = first.headers["etag"]
+
+    cached = await client.get("/api/gpt/gpt_setting", headers={"if-none-match": etag})
+    assert cached.status_code == 304
+
+    await save_setting(setting_id, "v2")
+    # 저장 API 를 거치지 않았으므로 이 워커의 캐시는 직접 비움
+    invalidate_gpt_caches()
+
+    changed = await client.get("/api/gpt/gpt_setting", headers={"if-none-match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert changed.json()["instruction"] == "v2"
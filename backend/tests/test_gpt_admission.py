@@ -0,0 +1,183 @@
+# tests/test_gpt_admission.py
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.config.settings import settings
+from app.core.database.base import SessionLocal
+from app.module.gpt import gpt_service
+from app.module.gpt.gpt import GptSetting
+from app.module.gpt.gpt_admission import AdmissionController, AdmissionRejected
+from app.module.gpt.gpt_cache import gpt_answer_cache, invalidate_gpt_caches
+from app.module.gpt.gpt_repository import GptRepository
+from app.module.gpt.gpt_resilience import GptResilience
+from app.module.gpt.gpt_service import GptService
+from conftest import make_token
+from fake_openai import FakeOpenAI
+
+pytestmark = pytest.mark.anyio
+
+
+def controller(max_concurrency=1, queue_size=10, queue_timeout=5.0) -> AdmissionController:
+    # 버킷은 넉넉하게 - 동시 실행 수와 대기열만 확인
+    return AdmissionController(
+        max_concurrency=max_concurrency,
+        requests_per_minute=60_000,
+        tokens_per_minute=10_000_000,
+        queue_size=queue_size,
+        queue_timeout=queue_timeout,
+    )
+
+
+async def test_one_user_cannot_starve_another():
+    admission = controller()
+    holder = await admission.acquire("a", timeout=5)
+    order = []
+
+    async def call(user, name):
+        ticket = await admission.acquire(user, timeout=5)
+        order.append(name)
+        await asyncio.sleep(0)
+        ticket.release()
+
+    # a 가 먼저 세 개를 몰아서 넣고 b 가 뒤에 하나
+    tasks = [asyncio.create_task(call("a", f"a{i}")) for i in range(1, 4)]
+    await asyncio.sleep(0)
+    tasks.append(asyncio.create_task(call("b", "b1")))
+    await asyncio.sleep(0)
+    assert admission.stats()["waiting_users"] == 2
+
+    holder.release()
+    await asyncio.gather(*tasks)
+
+    assert order == ["a1", "b1", "a2", "a3"]
+
+
+async def test_queue_timeout_rejects_and_leaves_queue():
+    admission = controller(queue_timeout=0.05)
+    holder = await admission.acquire("a", timeout=5)
+
+    with pytest.raises(AdmissionRejected) as exc:
+        await admission.acquire("b", timeout=0.05)
+
+    assert exc.value.reason == "openai queue wait timed out"
+    assert exc.value.retry_after >= 1
+    stats = admission.stats()
+    assert (stats["queue_depth"], stats["waiting_users"], stats["timed_out"]) == (0, 0, 1)
+    # 포기한 호출이 나중에 자리를 차지하지 않음
+    holder.release()
+    assert admission.stats()["active"] == 0
+
+
+async def test_full_queue_rejects_immediately_but_background_waits():
+    admission = controller(queue_size=1)
+    holder = await admission.acquire("a", timeout=5)
+    queued = asyncio.create_task(admission.acquire("b", timeout=5))
+    await asyncio.sleep(0)
+
+    with pytest.raises(AdmissionRejected, match="full"):
+        await admission.acquire("c", timeout=5)
+    # timeout 없는 백그라운드 호출은 대기열 길이와 상관없이 기다림
+    background = asyncio.create_task(admission.acquire())
+    await asyncio.sleep(0)
+    assert admission.stats()["queue_depth"] == 2
+
+    holder.release()
+    (await queued).release()
+    (await background).release()
+    assert admission.stats()["active"] == 0
+
+
+async def test_stats_track_admissions_and_waits():
+    admission = controller(max_concurrency=2)
+    first = await admission.acquire("a", timeout=5)
+    second = await admission.acquire("b", timeout=5)
+    waiting = asyncio.create_task(admission.acquire("c", timeout=5))
+    await asyncio.sleep(0.02)
+
+    stats = admission.stats()
+    assert (stats["active"], stats["queue_depth"], stats["max_queue_depth"]) == (2, 1, 1)
+
+    first.release()
+    first.release()  # 두 번 반환해도 한 번만 반영
+    third = await waiting
+    second.release()
+    third.release()
+
+    stats = admission.stats()
+    assert (stats["active"], stats["queue_depth"], stats["admitted"]) == (0, 0, 3)
+    assert (stats["rejected"], stats["timed_out"]) == (0, 0)
+    assert stats["wait_max"] >= 0.02
+    assert stats["wait_avg"] == pytest.approx(stats["wait_max"] / 3, abs=1e-3)
+
+
+# --- /api/gpt/chat 에서의 수락 제어 ---
+
+@pytest.fixture
+async def chat_env(engine, monkeypatch):
+    fake = FakeOpenAI()
+    admission = controller(queue_timeout=0.05)
+    monkeypatch.setattr(gpt_service, "client", fake.client())
+    monkeypatch.setattr(gpt_service, "gpt_resilience", GptResilience())
+    monkeypatch.setattr(gpt_service, "gpt_admission", admission)
+    monkeypatch.setattr(settings.raw, "openai_retry_attempts", 1)
+    monkeypatch.setattr(settings.raw, "openai_queue_timeout", 0.05)
+    invalidate_gpt_caches()
+    async with SessionLocal() as session:
+        session.add(GptSetting(version="gpt-4o", data_type="text", learning_text="자료"))
+        await session.commit()
+    yield SimpleNamespace(fake=fake, admission=admission)
+    invalidate_gpt_caches()
+
+
+async def test_chat_queue_timeout_is_503_with_retry_after(client, chat_env):
+    holder = await chat_env.admission.acquire("other", timeout=5)
+    client.cookies.set("access_token", make_token(1))
+
+    response = await client.post("/api/gpt/chat", json={"question": "질문"})
+
+    assert response.status_code == 503
+    assert int(response.headers["retry-after"]) >= 1
+    assert chat_env.fake.requests == []
+    holder.release()
+
+
+async def test_ticket_released_when_upstream_fails(client, chat_env):
+    chat_env.fake.reply(500)
+    chat_env.fake.reply(deltas=["앞부분"], fail_stream=True)
+    client.cookies.set("access_token", make_token(1))
+
+    for question in ("질문1", "질문2"):
+        response = await client.post("/api/gpt/chat", json={"question": question})
+        assert "event: error" in response.text
+        assert chat_env.admission.stats()["active"] == 0
+
+    # 끝까지 받지 못한 답변은 캐시하지 않음
+    assert gpt_answer_cache.stats()["entries"] == 0
+
+
+async def _json(value):
+    return value
+
+
+async def test_ticket_released_after_client_disconnects(chat_env):
+    chat_env.fake.reply(deltas=["첫", "둘", "셋"])
+    request = SimpleNamespace(user_id=1, json=lambda: _json({"question": "질문"}))
+
+    async with SessionLocal() as session:
+        response = await GptService(GptRepository(session)).chat(request)
+    body = response.body_iterator
+    assert "첫" in await body.__anext__()
+    # 클라이언트가 끊기면 응답 제너레이터가 닫힘
+    await body.aclose()
+
+    # upstream 스트림은 끝까지 받아서 캐시에 넣고, 그 뒤에 자리를 반환
+    for _ in range(100):
+        if chat_env.admission.stats()["active"] == 0:
+            break
+        await asyncio.sleep(0.01)
+    assert chat_env.admission.stats()["active"] == 0
+    assert gpt_answer_cache.stats()["entries"] == 1
+
@@ -0,0 +1,172 @@
+# tests/test_gpt_cache.py
+
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import update
+
+from app.core.database.base import SessionLocal
+from app.module.gpt import gpt_cache, gpt_service
+from app.module.gpt.gpt import GptSetting
+from app.module.gpt.gpt_cache import GptAnswerCache, GptSettingCache, gpt_answer_cache, invalidate_gpt_caches
+from app.module.gpt.gpt_repository import GptRepository
+from app.module.gpt.gpt_resilience import GptResilience
+from conftest import make_token
+from fake_openai import FakeOpenAI
+
+pytestmark = pytest.mark.anyio
+
+# MySQL DATETIME(초 단위)에서 같은 초에 두 번 저장된 상황을 흉내내기 위해 고정
+SAME_SECOND = datetime(2025, 1, 1, 12, 0, 0)
+
+
+async def save(setting_id, instruction) -> int:
+    async with SessionLocal() as session:
+        repo = GptRepository(session)
+        saved_id = await repo.save_gpt_setting(
+            setting_id, "gpt-4o", instruction, "text", "자료", True, "대체 문구", None, [], []
+        )
+        await session.execute(update(GptSetting).values(updated_at=SAME_SECOND))
+        await session.commit()
+    return saved_id
+
+
+async def cached(cache):
+    async with SessionLocal() as session:
+        return await cache.get(GptRepository(session), jsonable_encoder)
+
+
+async def test_other_worker_revalidates_saves_in_the_same_second(engine):
+    setting_id = await save(None, "v1")
+    # 다른 워커의 캐시 (TTL 0 -> 매번 스탬프로 재검증)
+    other = GptSettingCache(ttl=0)
+    first, first_etag = await cached(other)
+    assert first["instruction"] == "v1"
+
+    await save(setting_id, "v2")
+    second, second_etag = await cached(other)
+
+    assert second["instruction"] == "v2"
+    assert second["updated_at"] == first["updated_at"]
+    assert second["revision"] == first["revision"] + 1
+    assert second_etag != first_etag
+    assert other.misses == 2
+
+
+async def test_unchanged_setting_is_revalidated_without_reload(engine):
+    await save(None, "v1")
+    cache = GptSettingCache(ttl=0)
+    await cached(cache)
+
+    data, _ = await cached(cache)
+
+    assert data["instruction"] == "v1"
+    assert cache.misses == 1
+    assert cache.revalidations == 1
+
+
+async def test_answer_key_changes_with_each_save(engine):
+    setting_id = await save(None, "v1")
+    cache = GptSettingCache(ttl=0)
+    before, _ = await cached(cache)
+    await save(setting_id, "v2")
+    after, _ = await cached(cache)
+
+    assert GptAnswerCache.make_key(before, "질문") != GptAnswerCache.make_key(after, "질문")
+
+
+# --- 답변 캐시 ---
+
+def entry_size(question, answer):
+    return len(answer.encode("utf-8")) + len(question.encode("utf-8")) + GptAnswerCache.ENTRY_OVERHEAD
+
+
+def test_answer_cache_evicts_least_recently_used_by_bytes():
+    size = entry_size("q1", "가" * 10)
+    cache = GptAnswerCache(ttl=60, max_bytes=size * 2)
+    cache.set((1, 1, "q1"), "가" * 10)
+    cache.set((1, 1, "q2"), "가" * 10)
+    # q1 을 최근에 썼으므로 q3 가 들어오면 q2 가 밀려남
+    assert cache.get((1, 1, "q1")) == "가" * 10
+    cache.set((1, 1, "q3"), "가" * 10)
+
+    assert cache.get((1, 1, "q2")) is None
+    assert cache.get((1, 1, "q1")) is not None
+    assert cache.get((1, 1, "q3")) is not None
+    assert cache.bytes == size * 2
+    assert cache.stats()["evictions"] == 1
+
+
+def test_answer_cache_skips_oversized_and_recounts_replaced_entries():
+    cache = GptAnswerCache(ttl=60, max_bytes=500)
+    cache.set((1, 1, "big"), "x" * 500)
+    cache.set((1, 1, "q"), "short")
+    cache.set((1, 1, "q"), "longer answer")
+
+    assert cache.get((1, 1, "big")) is None
+    assert cache.get((1, 1, "q")) == "longer answer"
+    assert cache.bytes == entry_size("q", "longer answer")
+    assert cache.stats()["entries"] == 1
+
+
+def test_answer_cache_expires_after_ttl(monkeypatch):
+    clock = SimpleNamespace(now=100.0)
+    monkeypatch.setattr(gpt_cache, "time", SimpleNamespace(monotonic=lambda: clock.now))
+    cache = GptAnswerCache(ttl=30, max_bytes=10_000)
+    cache.set((1, 1, "q"), "answer")
+
+    clock.now += 29
+    assert cache.get((1, 1, "q")) == "answer"
+    clock.now += 2
+    assert cache.get((1, 1, "q")) is None
+    # 만료된 항목은 조회 시 제거되어 크기에서도 빠짐
+    assert cache.bytes == 0
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+
+@pytest.fixture
+async def chat_client(client, monkeypatch):
+    fake = FakeOpenAI()
+    monkeypatch.setattr(gpt_service, "client", fake.client())
+    monkeypatch.setattr(gpt_service, "gpt_resilience", GptResilience())
+    invalidate_gpt_caches()
+    async with SessionLocal() as session:
+        setting = GptSetting(version="gpt-4o", data_type="text", learning_text="자료")
+        session.add(setting)
+        await session.flush()
+        setting_id = setting.id
+        await session.commit()
+    client.cookies.set("access_token", make_token(1))
+    yield client, fake, setting_id
+    invalidate_gpt_caches()
+
+
+async def chat(client, question):
+    response = await client.post("/api/gpt/chat", json={"question": question})
+    assert response.status_code == 200
+    return response.text
+
+
+async def test_saving_setting_invalidates_cached_answers(chat_client):
+    client, fake, setting_id = chat_client
+    fake.reply(deltas=["첫 ", "답변"])
+    fake.reply(deltas=["새 답변"])
+
+    first = await chat(client, "질문")
+    # 공백 / 끝 문장부호만 다른 같은 질문은 upstream 없이 캐시에서 재생
+    replayed = await chat(client, "  질문? ")
+    assert '"cached": true' in replayed and '"delta": "첫 답변"' in replayed
+    assert len(fake.requests) == 1 and '"delta": "첫 "' in first
+
+    response = await client.post(
+        "/api/gpt/gpt_setting/save",
+        data={"gpt_setting_id": str(setting_id), "version": "gpt-4o", "data_type": "text", "learning_text": "새 자료"},
+    )
+    assert response.status_code == 200
+    assert gpt_answer_cache.stats()["entries"] == 0
+
+    after = await chat(client, "질문")
+    assert '"delta": "새 답변"' in after
+    assert len(fake.requests) == 2
@@ -0,0 +1,113 @@
+# tests/test_gpt_flight.py
+
+import asyncio
+
+import pytest
+
+from app.module.gpt.gpt_flight import SingleFlight
+
+pytestmark = pytest.mark.anyio
+
+
+class Upstream:
+    """호출 횟수를 세고, release 될 때까지 항목을 하나씩 흘려보내는 가짜 스트림"""
+
+    def __init__(self, items):
+        self.items = items
+        self.calls = 0
+        self.gates = [asyncio.Event() for _ in items]
+
+    def release(self, count=None):
+        for gate in self.gates[:count]:
+            gate.set()
+
+    async def stream(self):
+        self.calls += 1
+        for item, gate in zip(self.items, self.gates):
+            await gate.wait()
+            yield item
+
+
+async def collect(iterator):
+    return [item async for item in iterator]
+
+
+async def test_concurrent_callers_share_one_upstream_call():
+    flight = SingleFlight()
+    upstream = Upstream(["a", "b", "c"])
+
+    readers = [asyncio.create_task(collect(flight.stream("key", upstream.stream))) for _ in range(5)]
+    await asyncio.sleep(0)
+    upstream.release()
+
+    results = await asyncio.gather(*readers)
+    assert results == [["a", "b", "c"]] * 5
+    assert upstream.calls == 1
+    assert flight.stats() == {"started": 1, "shared": 4, "in_flight": 0}
+
+
+async def test_do_coalesces_coroutine_calls():
+    flight = SingleFlight()
+    calls = 0
+    gate = asyncio.Event()
+
+    async def factory():
+        nonlocal calls
+        calls += 1
+        await gate.wait()
+        return "result"
+
+    waiters = [asyncio.create_task(flight.do("key", factory)) for _ in range(3)]
+    await asyncio.sleep(0)
+    gate.set()
+
+    assert await asyncio.gather(*waiters) == ["result"] * 3
+    assert calls == 1
+
+
+async def test_late_joiner_replays_items_already_streamed():
+    flight = SingleFlight()
+    upstream = Upstream(["a", "b", "c"])
+
+    first = asyncio.create_task(collect(flight.stream("key", upstream.stream)))
+    upstream.release(2)
+    await asyncio.sleep(0.01)
+    assert flight.streaming("key")
+
+    late = asyncio.create_task(collect(flight.stream("key", upstream.stream)))
+    upstream.release()
+
+    assert await first == ["a", "b", "c"]
+    assert await late == ["a", "b", "c"]
+    assert upstream.calls == 1
+
+
+async def test_subscriber_cancel_does_not_cancel_others():
+    flight = SingleFlight()
+    upstream = Upstream(["a", "b", "c"])
+
+    leaving = asyncio.create_task(collect(flight.stream("key", upstream.stream)))
+    staying = asyncio.create_task(collect(flight.stream("key", upstream.stream)))
+    upstream.release(1)
+    await asyncio.sleep(0.01)
+
+    leaving.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await leaving
+
+    upstream.release()
+    assert await staying == ["a", "b", "c"]
+    assert upstream.calls == 1
+
+
+async def test_upstream_error_reaches_every_subscriber():
+    flight = SingleFlight()
+
+    async def failing():
+        yield "a"
+        raise RuntimeError("boom")
+
+    readers = [asyncio.create_task(collect(flight.stream("key", failing))) for _ in range(2)]
+    results = await asyncio.gather(*readers, return_exceptions=True)
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert not flight.streaming("key")
@@ -0,0 +1,439 @@
+# tests/test_gpt_jobs.py
+
+import asyncio
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import select, update
+
+from app.core.config.settings import settings
+from app.core.database.base import SessionLocal, now_kst
+from app.module.gpt import gpt_service
+from app.module.gpt.gpt import GptFile, GptJob, GptSetting
+from app.module.gpt.gpt_cache import invalidate_gpt_caches
+from app.module.gpt.gpt_job import GptJobRunner
+from app.module.gpt.gpt_repository import GptRepository
+from app.module.gpt.gpt_resilience import GptResilience
+from app.module.gpt.gpt_service import GptService
+from conftest import make_token
+from fake_openai import FakeOpenAI
+
+pytestmark = pytest.mark.anyio
+
+FAILED_BATCH = {
+    "id": "vsfb_fake", "object": "vector_store.file_batch", "status": "failed",
+    "file_counts": {"completed": 0, "failed": 1, "in_progress": 0, "cancelled": 0, "total": 1},
+}
+
+
+@pytest.fixture
+def fake(monkeypatch, tmp_path):
+    fake = FakeOpenAI()
+    monkeypatch.setattr(gpt_service, "client", fake.client())
+    monkeypatch.setattr(gpt_service, "gpt_resilience", GptResilience())
+    monkeypatch.setattr(settings, "GPT_STAGING_ROOT", tmp_path / "staging")
+    invalidate_gpt_caches()
+    yield fake
+    invalidate_gpt_caches()
+
+
+async def submit(client, files, setting_id=None, keep_file_ids=()) -> int:
+    data = {
+        "version": "gpt-4o",
+        "instruction": "지침",
+        "data_type": "file",
+        "fall_back_type": "true",
+        "fall_back_text": "대체 문구",
+    }
+    if setting_id:
+        data["gpt_setting_id"] = str(setting_id)
+    if keep_file_ids:
+        data["keep_file_ids"] = list(keep_file_ids)
+    client.cookies.set("access_token", make_token(1))
+    response = await client.post(
+        "/api/gpt/gpt_setting/save",
+        data=data,
+        files=[("files", (name, content)) for name, content in files],
+    )
+    assert response.status_code == 202
+    return response.json()["job_id"]
+
+
+async def run_job(job_id: int):
+    async with SessionLocal() as session:
+        await GptService(GptRepository(session)).run_job(job_id)
+
+
+async def load_job(job_id: int) -> GptJob:
+    async with SessionLocal() as session:
+        return await GptRepository(session).get_gpt_job(job_id)
+
+
+async def load_setting(setting_id: int) -> GptSetting:
+    async with SessionLocal() as session:
+        return await GptRepository(session).get_gpt_setting_by_id(setting_id)
+
+
+async def cleanup_jobs() -> list[GptJob]:
+    async with SessionLocal() as session:
+        result = await session.execute(select(GptJob).where(GptJob.kind == "cleanup").order_by(GptJob.id))
+        return list(result.scalars().all())
+
+
+async def save_file_setting(vc_id: str, file_ids: list[str]) -> int:
+    async with SessionLocal() as session:
+        setting_id = await GptRepository(session).save_gpt_setting(
+            None, "gpt-4o", "지침", "file", None, True, "대체 문구", vc_id, file_ids, [f"{f}.txt" for f in file_ids]
+        )
+        await session.commit()
+    return setting_id
+
+
+async def test_ingest_returns_202_and_job_saves_setting(client, fake):
+    job_id = await submit(client, [("a.txt", b"alpha"), ("b.txt", b"beta")])
+
+    job = await load_job(job_id)
+    assert (job.status, job.stage, job.total_files) == ("pending", "queued", 2)
+    assert (settings.GPT_STAGING_ROOT / job.payload["staging_key"]).is_dir()
+
+    await run_job(job_id)
+
+    job = await load_job(job_id)
+    assert (job.status, job.stage) == ("done", "done")
+    assert job.vc_file_ids == ["file_1", "file_2"]
+    setting = await load_setting(job.gpt_setting_id)
+    assert setting.vc_id == "vs_fake"
+    assert setting.vc_file_ids == ["file_1", "file_2"]
+    assert setting.vc_file_names == ["a.txt", "b.txt"]
+    assert fake.requests == [
+        ("POST", "/v1/vector_stores"),
+        ("POST", "/v1/files"),
+        ("POST", "/v1/files"),
+        ("POST", "/v1/vector_stores/vs_fake/file_batches"),
+    ]
+    assert not (settings.GPT_STAGING_ROOT / job.payload["staging_key"]).exists()
+
+    status = await client.get(f"/api/gpt/jobs/{job_id}")
+    assert status.json()["status"] == "done"
+
+
+async def test_failed_index_releases_new_files_and_vc(client, fake):
+    fake.reply(path="/v1/vector_stores/vs_fake/file_batches", body=FAILED_BATCH)
+    job_id = await submit(client, [("a.txt", b"alpha"), ("b.txt", b"beta")])
+
+    await run_job(job_id)
+
+    job = await load_job(job_id)
+    assert job.status == "failed"
+    assert "ended with status failed" in job.error
+    assert job.gpt_setting_id is None
+    [cleanup] = await cleanup_jobs()
+    assert cleanup.payload == {"vc_id": "vs_fake", "file_ids": ["file_1", "file_2"], "delete_vc": True}
+
+    # 정리 작업이 올린 파일과 새로 만든 vc 를 지우고 해시 인덱스에서도 뺌
+    await run_job(cleanup.id)
+
+    assert (await load_job(cleanup.id)).status == "done"
+    assert {("DELETE", "/v1/files/file_1"), ("DELETE", "/v1/files/file_2"),
+            ("DELETE", "/v1/vector_stores/vs_fake")} <= set(fake.requests)
+    async with SessionLocal() as session:
+        assert (await session.execute(select(GptFile))).scalars().all() == []
+
+
+async def test_failed_edit_releases_only_new_files(client, fake):
+    setting_id = await save_file_setting("vs_old", ["old_1"])
+    fake.reply(path="/v1/vector_stores/vs_old/file_batches", body=FAILED_BATCH)
+    job_id = await submit(client, [("new.txt", b"new")], setting_id=setting_id, keep_file_ids=["old_1"])
+
+    await run_job(job_id)
+
+    assert (await load_job(job_id)).status == "failed"
+    [cleanup] = await cleanup_jobs()
+    # 기존 vc 와 기존 파일은 그대로 두고 이번 작업이 붙인 파일만 정리
+    assert cleanup.payload == {"vc_id": "vs_old", "file_ids": ["file_1"], "delete_vc": False}
+    setting = await load_setting(setting_id)
+    assert (setting.vc_id, setting.vc_file_ids) == ("vs_old", ["old_1"])
+
+
+async def test_sweeper_resumes_stale_job_from_recorded_progress(client, fake, monkeypatch):
+    monkeypatch.setattr(settings.raw, "gpt_job_stale_after", 0.3)
+    stale_id = await submit(client, [("a.txt", b"alpha"), ("b.txt", b"beta")])
+    live_id = await submit(client, [("c.txt", b"gamma")])
+
+    # 두 작업 모두 워커가 선점해서 실행 중이었음 - stale_id 의 워커는 업로드까지 기록하고 죽음
+    async with SessionLocal() as session:
+        repo = GptRepository(session)
+        stale_before = now_kst() - timedelta(hours=1)
+        assert await repo.claim_gpt_job(stale_id, stale_before)
+        assert await repo.claim_gpt_job(live_id, stale_before)
+        assert not await repo.claim_gpt_job(stale_id, stale_before)
+        await repo.update_gpt_job(
+            await repo.get_gpt_job(stale_id),
+            stage="upload", vc_id="vs_fake", vc_file_ids=["file_a", "file_b"], uploaded_files=2,
+        )
+        await session.execute(
+            update(GptJob).where(GptJob.id == stale_id).values(updated_at=now_kst() - timedelta(hours=1))
+        )
+        await session.execute(
+            update(GptJob).where(GptJob.id == live_id).values(updated_at=now_kst() + timedelta(hours=1))
+        )
+        await session.commit()
+
+    runner = GptJobRunner(workers=1)
+    await runner.start()
+    try:
+        for _ in range(100):
+            if (await load_job(stale_id)).status == "done":
+                break
+            await asyncio.sleep(0.02)
+    finally:
+        await runner.stop()
+
+    job = await load_job(stale_id)
+    assert (job.status, job.stage) == ("done", "done")
+    # vc 생성 / 파일 업로드는 건너뛰고 기록된 id 로 인덱싱부터 이어서 실행
+    assert fake.requests == [("POST", "/v1/vector_stores/vs_fake/file_batches")]
+    setting = await load_setting(job.gpt_setting_id)
+    assert setting.vc_file_ids == ["file_a", "file_b"]
+    # 하트비트가 살아 있는 작업은 다시 가져가지 않음
+    assert (await load_job(live_id)).status == "running"
+
+
+def test_dedupe_pair_keeps_first_occurrence_and_drops_empty_ids():
+    ids, names = GptService.dedupe_pair(["f1", None, "f2", "f1", ""], ["a", "b", "c", "d"])
+
+    assert ids == ["f1", "f2"]
+    assert names == ["a", "c"]
+
+
+async def test_identical_bytes_reuse_file_without_upload(client, fake):
+    first_id = await submit(client, [("a.txt", b"alpha")])
+    await run_job(first_id)
+    fake.requests.clear()
+
+    # 이름이 달라도 내용(sha256)이 같으면 스테이징 복사도, 업로드도 하지 않음
+    second_id = await submit(client, [("renamed.txt", b"alpha")])
+    job = await load_job(second_id)
+    assert job.payload["files"][0]["path"] is None
+    await run_job(second_id)
+
+    job = await load_job(second_id)
+    assert job.status == "done"
+    assert job.vc_file_ids == ["file_1"]
+    assert ("POST", "/v1/files") not in fake.requests
+    setting = await load_setting(job.gpt_setting_id)
+    assert setting.vc_file_names == ["renamed.txt"]
+
+
+async def test_duplicates_in_one_request_collapse(client, fake):
+    job_id = await submit(client, [("a.txt", b"same"), ("b.txt", b"same"), ("c.txt", b"other")])
+
+    job = await load_job(job_id)
+    assert job.total_files == 2
+    assert [f["name"] for f in job.payload["files"]] == ["a.txt", "c.txt"]
+    await run_job(job_id)
+
+    job = await load_job(job_id)
+    assert job.vc_file_ids == ["file_1", "file_2"]
+    assert fake.requests.count(("POST", "/v1/files")) == 2
+
+
+async def test_cleanup_keeps_dedup_hit_owned_by_another_setting(client, fake):
+    owner_job = await submit(client, [("a.txt", b"alpha")])
+    await run_job(owner_job)
+    # 두 번째 설정은 새 vc 를 만들고 같은 파일(file_1)을 재사용
+    fake.reply(path="/v1/vector_stores", body={"id": "vs_other", "object": "vector_store", "status": "completed"})
+    sharer_job = await submit(client, [("a.txt", b"alpha")])
+    await run_job(sharer_job)
+    sharer_id = (await load_job(sharer_job)).gpt_setting_id
+    fake.requests.clear()
+
+    # 두 번째 설정을 텍스트로 바꾸면 vc 와 파일 정리 작업이 생김
+    response = await client.post(
+        "/api/gpt/gpt_setting/save",
+        data={"gpt_setting_id": str(sharer_id), "version": "gpt-4o", "data_type": "text", "learning_text": "자료"},
+    )
+    assert response.status_code == 200
+    [cleanup] = await cleanup_jobs()
+    await run_job(cleanup.id)
+
+    cleanup = await load_job(cleanup.id)
+    assert cleanup.status == "done"
+    assert cleanup.result["files"] == [
+        {"file_id": "file_1", "unlinked": True, "deleted": False, "error": None}
+    ]
+    # 첫 번째 설정이 쓰는 파일은 vc 연결만 해제하고 파일과 해시 인덱스는 유지
+    assert ("DELETE", "/v1/vector_stores/vs_other/files/file_1") in fake.requests
+    assert ("DELETE", "/v1/files/file_1") not in fake.requests
+    assert ("DELETE", "/v1/vector_stores/vs_other") in fake.requests
+    async with SessionLocal() as session:
+        assert (await session.execute(select(GptFile.file_id))).scalars().all() == ["file_1"]
+
+
+async def edit(client, setting_id, data_type="file", **fields):
+    client.cookies.set("access_token", make_token(1))
+    response = await client.post(
+        "/api/gpt/gpt_setting/save",
+        data={"gpt_setting_id": str(setting_id), "version": "gpt-4o", "data_type": data_type, **fields},
+    )
+    return response
+
+
+async def test_edit_indexes_only_new_files(client, fake):
+    first = await submit(client, [("a.txt", b"alpha"), ("b.txt", b"beta")])
+    await run_job(first)
+    setting_id = (await load_job(first)).gpt_setting_id
+    fake.requests.clear()
+    fake.json_bodies.clear()
+
+    job_id = await submit(client, [("c.txt", b"gamma")], setting_id=setting_id, keep_file_ids=["file_1", "file_2"])
+    await run_job(job_id)
+
+    # 같은 vc 에 이미 붙어 있는 파일은 다시 올리지도, 인덱싱하지도 않음
+    assert fake.requests == [("POST", "/v1/files"), ("POST", "/v1/vector_stores/vs_fake/file_batches")]
+    assert fake.json_bodies[0][2]["file_ids"] == ["file_3"]
+    setting = await load_setting(setting_id)
+    assert setting.vc_file_ids == ["file_1", "file_2", "file_3"]
+    assert setting.vc_file_names == ["a.txt", "b.txt", "c.txt"]
+    assert await cleanup_jobs() == []
+
+
+async def test_edit_without_files_keeps_index_untouched(client, fake):
+    first = await submit(client, [("a.txt", b"alpha")])
+    await run_job(first)
+    setting_id = (await load_job(first)).gpt_setting_id
+    fake.requests.clear()
+
+    response = await edit(client, setting_id, instruction="새 지침")
+    assert response.status_code == 202
+    await run_job(response.json()["job_id"])
+
+    assert fake.requests == []
+    setting = await load_setting(setting_id)
+    assert (setting.instruction, setting.vc_file_ids) == ("새 지침", ["file_1"])
+
+
+async def test_removed_files_are_deleted_only_when_unreferenced(client, fake):
+    first = await submit(client, [("a.txt", b"alpha"), ("b.txt", b"beta"), ("c.txt", b"gamma")])
+    await run_job(first)
+    setting_id = (await load_job(first)).gpt_setting_id
+    # 다른 설정이 file_2 를 같이 씀
+    await save_file_setting("vs_other", ["file_2"])
+    fake.requests.clear()
+
+    job_id = await submit(client, [], setting_id=setting_id, keep_file_ids=["file_1"])
+    await run_job(job_id)
+
+    assert (await load_setting(setting_id)).vc_file_ids == ["file_1"]
+    [cleanup] = await cleanup_jobs()
+    assert cleanup.payload == {"vc_id": "vs_fake", "file_ids": ["file_2", "file_3"], "delete_vc": False}
+    await run_job(cleanup.id)
+
+    results = {r["file_id"]: r for r in (await load_job(cleanup.id)).result["files"]}
+    assert (results["file_2"]["unlinked"], results["file_2"]["deleted"]) == (True, False)
+    assert (results["file_3"]["unlinked"], results["file_3"]["deleted"]) == (True, True)
+    assert ("DELETE", "/v1/files/file_2") not in fake.requests
+    assert ("DELETE", "/v1/files/file_3") in fake.requests
+    # 설정이 계속 쓰는 vc 는 지우지 않음
+    assert ("DELETE", "/v1/vector_stores/vs_fake") not in fake.requests
+
+
+async def test_switch_to_text_deletes_vector_store(client, fake):
+    first = await submit(client, [("a.txt", b"alpha"), ("b.txt", b"beta")])
+    await run_job(first)
+    setting_id = (await load_job(first)).gpt_setting_id
+    fake.requests.clear()
+
+    response = await edit(client, setting_id, data_type="text", learning_text="자료")
+    assert response.status_code == 200
+    setting = await load_setting(setting_id)
+    assert (setting.data_type, setting.vc_id, setting.vc_file_ids) == ("text", None, [])
+
+    [cleanup] = await cleanup_jobs()
+    assert cleanup.payload == {"vc_id": "vs_fake", "file_ids": ["file_1", "file_2"], "delete_vc": True}
+    await run_job(cleanup.id)
+
+    assert (await load_job(cleanup.id)).status == "done"
+    assert {("DELETE", "/v1/files/file_1"), ("DELETE", "/v1/files/file_2")} <= set(fake.requests)
+    # vc 는 파일 정리가 모두 끝난 뒤 마지막에 삭제
+    assert fake.requests[-1] == ("DELETE", "/v1/vector_stores/vs_fake")
+
+
+async def release(vc_id, file_ids, delete_vc=True) -> int:
+    async with SessionLocal() as session:
+        repo = GptRepository(session)
+        await repo.add_gpt_files(
+            [{"sha256": f"sha-{fid}", "file_id": fid, "file_name": None, "size": 1} for fid in file_ids]
+        )
+        job = await GptService(repo).release_files(vc_id, file_ids, delete_vc=delete_vc)
+        return job.id
+
+
+async def indexed_file_ids() -> list[str]:
+    async with SessionLocal() as session:
+        return sorted((await session.execute(select(GptFile.file_id))).scalars().all())
+
+
+@pytest.fixture
+def no_retry(monkeypatch):
+    # upstream 재시도 없이 바로 실패를 정리 작업으로 넘김
+    monkeypatch.setattr(settings.raw, "openai_retry_attempts", 1)
+
+
+async def test_partial_cleanup_failure_keeps_failed_ids_and_vc(fake, engine, no_retry):
+    fake.reply(500, path="/v1/files/f2")
+    job_id = await release("vs_x", ["f1", "f2", "f3"])
+
+    await run_job(job_id)
+
+    job = await load_job(job_id)
+    assert (job.status, job.stage, job.attempts) == ("pending", "retry", 1)
+    assert job.payload == {"vc_id": "vs_x", "file_ids": ["f2"], "delete_vc": True}
+    # sqlite 는 tz 정보를 버리므로 naive 로 비교
+    assert job.run_after > now_kst().replace(tzinfo=None)
+    errors = {r["file_id"]: r["error"] for r in job.result["files"]}
+    assert errors["f1"] is None and errors["f3"] is None and errors["f2"]
+    # 지우지 못한 파일이 남아 있으면 vc 는 지우지 않음 (파일 연결이 끊긴 채로 vc 만 사라지지 않도록)
+    assert ("DELETE", "/v1/vector_stores/vs_x") not in fake.requests
+    assert await indexed_file_ids() == ["f2"]
+
+    # 재시도는 실패한 파일만 다시 지우고, 모두 끝나면 vc 삭제
+    fake.requests.clear()
+    await run_job(job_id)
+
+    job = await load_job(job_id)
+    assert (job.status, job.attempts) == ("done", 2)
+    assert fake.requests == [
+        ("DELETE", "/v1/vector_stores/vs_x/files/f2"),
+        ("DELETE", "/v1/files/f2"),
+        ("DELETE", "/v1/vector_stores/vs_x"),
+    ]
+    assert await indexed_file_ids() == []
+
+
+async def test_cleanup_gives_up_after_max_attempts(fake, engine, no_retry, monkeypatch):
+    monkeypatch.setattr(settings.raw, "gpt_cleanup_max_attempts", 2)
+    fake.reply(500, times=2, path="/v1/files/f1")
+    job_id = await release("vs_x", ["f1"])
+
+    await run_job(job_id)
+    await run_job(job_id)
+
+    job = await load_job(job_id)
+    assert (job.status, job.attempts) == ("failed", 2)
+    assert "after 2 attempts" in job.error
+    assert ("DELETE", "/v1/vector_stores/vs_x") not in fake.requests
+
+
+async def test_cleanup_treats_missing_remote_objects_as_deleted(fake, engine):
+    fake.reply(404, path="/v1/vector_stores/vs_x/files/f1")
+    fake.reply(404, path="/v1/files/f1")
+    fake.reply(404, path="/v1/vector_stores/vs_x")
+    job_id = await release("vs_x", ["f1"])
+
+    await run_job(job_id)
+
+    job = await load_job(job_id)
+    assert job.status == "done"
+    assert job.result["files"] == [{"file_id": "f1", "unlinked": True, "deleted": True, "error": None}]
+    assert job.result["vc_error"] is None
@@ -0,0 +1,198 @@
+# tests/test_gpt_resilience.py
+
+import asyncio
+import time
+from collections import deque
+
+import pytest
+from openai import InternalServerError, RateLimitError
+
+from app.core.config.settings import settings
+from app.core.database.base import SessionLocal
+from app.module.gpt import gpt_service
+from app.module.gpt.gpt import GptSetting
+from app.module.gpt.gpt_cache import invalidate_gpt_caches
+from app.module.gpt.gpt_resilience import CircuitBreaker, CircuitOpen, GptResilience
+from conftest import make_token
+from fake_openai import FakeOpenAI
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def fake(monkeypatch):
+    fake = FakeOpenAI()
+    monkeypatch.setattr(gpt_service, "client", fake.client())
+    return fake
+
+
+@pytest.fixture
+def resilience(monkeypatch):
+    # 백오프는 짧게, 브레이커는 적은 호출로도 열리게
+    monkeypatch.setattr(settings.raw, "openai_retry_attempts", 3)
+    monkeypatch.setattr(settings.raw, "openai_retry_base", 0.001)
+    monkeypatch.setattr(settings.raw, "openai_retry_max_delay", 1.0)
+    monkeypatch.setattr(settings.raw, "openai_hedge_enabled", True)
+    monkeypatch.setattr(settings.raw, "openai_hedge_min_delay", 0.05)
+    resilience = GptResilience()
+    resilience.breaker = CircuitBreaker(window=60, min_calls=4, error_rate=0.5, cooldown=0.2)
+    monkeypatch.setattr(gpt_service, "gpt_resilience", resilience)
+    return resilience
+
+
+def retrieve(fake_client):
+    return lambda: fake_client.vector_stores.retrieve("vs_fake")
+
+
+async def test_idempotent_call_retries_5xx(fake, resilience):
+    fake.reply(500, times=2)
+
+    result = await resilience.call("vc.retrieve", retrieve(gpt_service.client), idempotent=True)
+
+    assert result.id == "vs_fake"
+    assert len(fake.requests) == 3
+    assert resilience.retries == 2
+
+
+async def test_non_idempotent_call_does_not_retry_5xx(fake, resilience):
+    fake.reply(500)
+
+    with pytest.raises(InternalServerError):
+        await resilience.call("vc.create", retrieve(gpt_service.client))
+
+    assert len(fake.requests) == 1
+
+
+async def test_rate_limit_waits_for_retry_after(fake, resilience):
+    fake.reply(429, headers={"retry-after": "0.3"})
+
+    started = time.monotonic()
+    result = await resilience.call("vc.create", retrieve(gpt_service.client))
+
+    # 429 는 처리되지 않은 요청이라 idempotent 가 아니어도 재시도, 대기는 Retry-After 이상
+    assert result.id == "vs_fake"
+    assert len(fake.requests) == 2
+    assert time.monotonic() - started >= 0.3
+
+
+async def test_rate_limit_gives_up_after_attempts(fake, resilience):
+    fake.reply(429, times=3, headers={"retry-after": "0"})
+
+    with pytest.raises(RateLimitError):
+        await resilience.call("vc.create", retrieve(gpt_service.client))
+
+    assert len(fake.requests) == 3
+
+
+async def test_no_hedge_until_enough_samples(fake, resilience):
+    fake.reply(delay=0.2)
+
+    await resilience.call("vc.retrieve", retrieve(gpt_service.client), hedge=True)
+
+    assert resilience.hedges == 0
+    assert len(fake.requests) == 1
+
+
+async def test_slow_call_is_hedged_after_p95(fake, resilience):
+    resilience._latencies["vc.retrieve"] = deque([0.01] * GptResilience.HEDGE_MIN_SAMPLES, maxlen=200)
+    # 첫 요청만 느리고 헤지 요청은 바로 응답
+    fake.reply(delay=2.0)
+
+    started = time.monotonic()
+    result = await resilience.call("vc.retrieve", retrieve(gpt_service.client), hedge=True)
+
+    assert result.id == "vs_fake"
+    assert time.monotonic() - started < 1.0
+    assert len(fake.requests) == 2
+    assert resilience.hedges == 1
+    assert resilience.hedge_wins == 1
+
+
+async def test_breaker_opens_then_half_open_probe_closes_it(fake, resilience):
+    fake.reply(500, times=4)
+    for _ in range(4):
+        with pytest.raises(InternalServerError):
+            await resilience.call("vc.create", retrieve(gpt_service.client))
+    assert resilience.breaker.is_open
+
+    # 열려 있는 동안은 upstream 에 보내지 않고 바로 실패
+    with pytest.raises(CircuitOpen):
+        await resilience.call("vc.create", retrieve(gpt_service.client))
+    assert len(fake.requests) == 4
+
+    await asyncio.sleep(0.25)
+    fake.reply(delay=0.1)
+    probe = asyncio.create_task(resilience.call("vc.create", retrieve(gpt_service.client)))
+    await asyncio.sleep(0.02)
+    assert resilience.breaker.state == "half_open"
+    # 시험 호출이 끝나기 전의 다른 호출은 통과시키지 않음
+    with pytest.raises(CircuitOpen):
+        await resilience.call("vc.create", retrieve(gpt_service.client))
+
+    await probe
+    assert resilience.breaker.state == "closed"
+    assert len(fake.requests) == 5
+
+
+async def test_failed_half_open_probe_reopens(fake, resilience):
+    fake.reply(500, times=5)
+    for _ in range(4):
+        with pytest.raises(InternalServerError):
+            await resilience.call("vc.create", retrieve(gpt_service.client))
+
+    await asyncio.sleep(0.25)
+    with pytest.raises(InternalServerError):
+        await resilience.call("vc.create", retrieve(gpt_service.client))
+
+    assert resilience.breaker.is_open
+    assert resilience.breaker.opened == 2
+
+
+# --- /api/gpt/chat: 브레이커가 열리면 fall_back_text 로 응답 ---
+
+@pytest.fixture
+async def chat_client(client, fake, resilience):
+    invalidate_gpt_caches()
+    async with SessionLocal() as session:
+        session.add(GptSetting(version="gpt-4o", data_type="text", fall_back_text="잠시 후 다시 시도해 주세요"))
+        await session.commit()
+    client.cookies.set("access_token", make_token(1))
+    yield client
+    invalidate_gpt_caches()
+
+
+async def chat(client, question):
+    response = await client.post("/api/gpt/chat", json={"question": question})
+    assert response.status_code == 200
+    return response.text
+
+
+async def test_chat_streams_upstream_deltas(chat_client, fake):
+    fake.reply(deltas=["안녕", "하세요"])
+
+    body = await chat(chat_client, "인사")
+
+    assert '"delta": "안녕"' in body and '"delta": "하세요"' in body
+    assert "event: done" in body
+
+
+async def test_chat_answers_fallback_text_while_breaker_open(chat_client, fake, resilience):
+    for _ in range(4):
+        resilience.breaker.record(False)
+
+    body = await chat(chat_client, "질문")
+
+    assert "잠시 후 다시 시도해 주세요" in body
+    assert '"fallback": true' in body
+    assert fake.requests == []
+
+
+async def test_chat_falls_back_when_breaker_opens_during_retries(chat_client, fake, resilience):
+    resilience.breaker = CircuitBreaker(window=60, min_calls=2, error_rate=0.5, cooldown=5)
+    fake.reply(500, times=3)
+
+    body = await chat(chat_client, "질문")
+
+    # 두 번 실패해서 열린 뒤 세 번째 시도는 보내지 않고 대체 문구로 응답
+    assert "잠시 후 다시 시도해 주세요" in body
+    assert len(fake.requests) == 2
@@ -0,0 +1,175 @@
+# tests/test_gpt_upload.py
+
+import hashlib
+import io
+import os
+
+import httpx
+import pytest
+from openai import BadRequestError
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from app.core.config.settings import settings
+from app.module.gpt import gpt_service, gpt_upload
+from app.module.gpt.gpt_resilience import GptResilience
+from app.module.gpt.gpt_service import GptService
+from app.module.gpt.gpt_upload import parse_upload_form
+from fake_openai import FakeOpenAI
+
+pytestmark = pytest.mark.anyio
+
+BOUNDARY = "test-boundary"
+
+
+async def echo_form(request):
+    form = await parse_upload_form(request)
+    try:
+        files = form.getlist("files")
+        return JSONResponse({"files": [[f.filename, f.size, f.sha256] for f in files]})
+    finally:
+        await form.close()
+
+
+upload_app = Starlette(routes=[Route("/upload", echo_form, methods=["POST"])])
+
+
+@pytest.fixture
+async def upload_client():
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=upload_app), base_url="http://test") as c:
+        yield c
+
+
+@pytest.fixture
+def limits(monkeypatch):
+    monkeypatch.setattr(settings.raw, "gpt_upload_max_file_size", 64 * 1024)
+    monkeypatch.setattr(settings.raw, "gpt_upload_max_request_size", 128 * 1024)
+    monkeypatch.setattr(settings.raw, "gpt_upload_max_files", 3)
+
+
+def multipart_body(*files: tuple[str, bytes]) -> bytes:
+    parts = [
+        f"--{BOUNDARY}\r\nContent-Disposition: form-data; name=\"version\"\r\n\r\ngpt-4o\r\n".encode()
+    ]
+    for name, data in files:
+        parts.append(
+            f"--{BOUNDARY}\r\nContent-Disposition: form-data; name=\"files\"; filename=\"{name}\"\r\n"
+            "Content-Type: application/octet-stream\r\n\r\n".encode()
+            + data
+            + b"\r\n"
+        )
+    parts.append(f"--{BOUNDARY}--\r\n".encode())
+    return b"".join(parts)
+
+
+def chunked(body: bytes, size: int = 4096):
+    """content-length 없이 조각으로 보내는 본문 (스트리밍 중 제한 확인용)"""
+    async def stream():
+        for start in range(0, len(body), size):
+            yield body[start:start + size]
+    return stream()
+
+
+HEADERS = {"content-type": f"multipart/form-data; boundary={BOUNDARY}"}
+
+
+async def test_streamed_sha256_matches_file_content(upload_client, limits):
+    first, second = os.urandom(50 * 1024), os.urandom(10)
+
+    response = await upload_client.post(
+        "/upload", content=chunked(multipart_body(("a.pdf", first), ("b.txt", second))), headers=HEADERS
+    )
+
+    assert response.status_code == 200
+    assert response.json()["files"] == [
+        ["a.pdf", len(first), hashlib.sha256(first).hexdigest()],
+        ["b.txt", len(second), hashlib.sha256(second).hexdigest()],
+    ]
+
+
+async def test_file_over_size_limit_is_413(upload_client, limits):
+    body = multipart_body(("big.pdf", b"x" * (64 * 1024 + 1)))
+
+    response = await upload_client.post("/upload", content=chunked(body), headers=HEADERS)
+
+    assert response.status_code == 413
+    assert "file exceeded" in response.text
+
+
+async def test_request_over_total_limit_is_413(upload_client, limits):
+    # 파일 하나하나는 제한 안쪽, 합계만 초과
+    body = multipart_body(*[(f"{i}.pdf", b"x" * (60 * 1024)) for i in range(3)])
+    assert len(body) > 128 * 1024
+
+    # content-length 가 있으면 본문을 읽기 전에, 없으면 읽는 도중에 중단
+    declared = await upload_client.post("/upload", content=body, headers=HEADERS)
+    streamed = await upload_client.post("/upload", content=chunked(body), headers=HEADERS)
+
+    assert declared.status_code == 413
+    assert streamed.status_code == 413
+    assert "request exceeded" in streamed.text
+
+
+async def test_too_many_files_is_413(upload_client, limits):
+    body = multipart_body(*[(f"{i}.txt", b"x") for i in range(4)])
+
+    response = await upload_client.post("/upload", content=body, headers=HEADERS)
+
+    assert response.status_code == 413
+    assert "too many files" in response.text
+
+
+def test_parser_internals_guard_fails_loudly(monkeypatch):
+    class ChangedParser(gpt_upload.MultiPartParser):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            del self._current_part
+
+    monkeypatch.setattr(gpt_upload, "MultiPartParser", ChangedParser)
+
+    with pytest.raises(ImportError, match="_current_part"):
+        gpt_upload._check_parser_internals()
+
+
+async def test_failed_upload_discards_files_already_uploaded(monkeypatch):
+    fake = FakeOpenAI()
+    monkeypatch.setattr(gpt_service, "client", fake.client())
+    monkeypatch.setattr(gpt_service, "gpt_resilience", GptResilience())
+    # 순서가 정해지도록 한 번에 하나씩 업로드
+    monkeypatch.setattr(settings.raw, "openai_upload_concurrency", 1)
+    fake.reply(body={"id": "file_a", "object": "file"})
+    fake.reply(400)
+
+    service = GptService(repo=None)
+    files = [(f"{i}.txt", io.BytesIO(b"x")) for i in range(3)]
+    with pytest.raises(BadRequestError):
+        await service.upload_files(files)
+
+    # 실패 이후 대기 중이던 세 번째 파일은 올리지 않고, 이미 올라간 파일은 삭제
+    assert fake.requests == [
+        ("POST", "/v1/files"),
+        ("POST", "/v1/files"),
+        ("DELETE", "/v1/files/file_a"),
+    ]
+
+
+
+async def test_in_flight_upload_is_discarded_after_it_finishes(monkeypatch):
+    fake = FakeOpenAI()
+    monkeypatch.setattr(gpt_service, "client", fake.client())
+    monkeypatch.setattr(gpt_service, "gpt_resilience", GptResilience())
+    monkeypatch.setattr(settings.raw, "openai_upload_concurrency", 2)
+    fake.reply(400)
+    fake.reply(delay=0.1, body={"id": "file_slow", "object": "file"})
+
+    files = [(f"{i}.txt", io.BytesIO(b"x")) for i in range(3)]
+    with pytest.raises(BadRequestError):
+        await GptService(repo=None).upload_files(files)
+
+    # 실패 시점에 올라가던 파일은 취소하지 않고 끝난 뒤 삭제 (원격에 고아 파일을 남기지 않음)
+    assert fake.requests == [
+        ("POST", "/v1/files"),
+        ("POST", "/v1/files"),
+        ("DELETE", "/v1/files/file_slow"),
+    ]
@@ -0,0 +1,150 @@
+# tests/test_logger.py
+
+import io
+import json
+import logging
+import threading
+
+import pytest
+
+from app.core.log.logger import REDACTED, AsyncQueueHandler, JsonFormatter, is_secret_key, request_id_var
+
+
+class BlockingStream(io.StringIO):
+    """첫 write 에서 release() 될 때까지 멈추는 스트림 (writer 스레드를 붙잡아 두는 용도)"""
+
+    def __init__(self):
+        super().__init__()
+        self.entered = threading.Event()
+        self.released = threading.Event()
+
+    def write(self, text):
+        self.entered.set()
+        self.released.wait(5)
+        return super().write(text)
+
+    def release(self):
+        self.released.set()
+
+
+def make_logger(handler) -> logging.Logger:
+    handler.setFormatter(JsonFormatter())
+    logger = logging.getLogger(f"test.logger.{id(handler)}")
+    logger.handlers = [handler]
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    return logger
+
+
+def lines(stream) -> list[dict]:
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+@pytest.mark.parametrize("key, secret", [
+    ("password", True),
+    ("user_password", True),
+    ("access_token", True),
+    ("accessToken", True),
+    ("Set-Cookie", True),
+    ("cookies", True),
+    ("Authorization", True),
+    ("OPENAI_API_KEY", True),
+    ("hash_key", True),
+    ("password_hash", True),
+    ("client_secret", True),
+    ("tokens", False),
+    ("max_tokens", False),
+    ("estimated_tokens", False),
+    ("token_count", False),
+    ("sha256", False),
+    ("bypass", False),
+    ("hashes", False),
+])
+def test_secret_keys_match_whole_name_or_suffix(key, secret):
+    assert is_secret_key(key) is secret
+
+
+def test_redacts_fields_nested_values_and_message():
+    stream = io.StringIO()
+    handler = AsyncQueueHandler(stream=stream)
+    logger = make_logger(handler)
+
+    logger.info(
+        "login with Bearer abc.def and password=hunter2",
+        extra={
+            "password": "hunter2",
+            "tokens": 1200,
+            "headers": {"Authorization": "Bearer abc", "X-Trace": "ok"},
+            "note": "key sk-0123456789abcdefghij",
+        },
+    )
+    handler.close()
+
+    [line] = lines(stream)
+    assert "hunter2" not in json.dumps(line) and "abc.def" not in line["msg"]
+    assert line["password"] == REDACTED
+    assert line["tokens"] == 1200
+    assert line["headers"] == {"Authorization": REDACTED, "X-Trace": "ok"}
+    assert line["note"] == f"key {REDACTED}"
+
+
+def test_record_is_formatted_when_logged():
+    stream = BlockingStream()
+    handler = AsyncQueueHandler(stream=stream)
+    logger = make_logger(handler)
+    logger.info("first")
+    assert stream.entered.wait(5)
+
+    # writer 스레드가 멈춰 있는 동안 기록 -> 나중에 바뀐 값이 아니라 기록 시점의 값이 남아야 함
+    state = {"step": 1}
+    token = request_id_var.set("req-1")
+    try:
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("second", extra={"state": state})
+    finally:
+        request_id_var.reset(token)
+    state["step"] = 2
+
+    stream.release()
+    handler.close()
+
+    second = lines(stream)[1]
+    assert second["state"] == {"step": 1}
+    assert second["request_id"] == "req-1"
+    assert "ValueError: boom" in second["exc"]
+
+
+def test_full_queue_drops_and_reports_count():
+    stream = BlockingStream()
+    handler = AsyncQueueHandler(stream=stream, queue_size=1)
+    logger = make_logger(handler)
+    logger.info("taken by writer")
+    assert stream.entered.wait(5)
+
+    logger.info("queued")
+    logger.info("dropped 1")
+    logger.info("dropped 2")
+    assert handler.dropped == 2
+
+    stream.release()
+    handler.close()
+
+    output = lines(stream)
+    assert [line["msg"] for line in output[:2]] == ["taken by writer", "queued"]
+    assert output[-1]["msg"] == "dropped 2 log records (queue full)"
+    assert handler.dropped == 0
+
+
+def test_close_flushes_pending_records():
+    stream = io.StringIO()
+    handler = AsyncQueueHandler(stream=stream, batch_size=7)
+    logger = make_logger(handler)
+
+    for i in range(100):
+        logger.info("record %d", i)
+    handler.close()
+
+    assert [line["msg"] for line in lines(stream)] == [f"record {i}" for i in range(100)]
+    assert not handler._thread.is_alive()
@@ -0,0 +1,196 @@
+# tests/test_media.py
+
+import gzip
+import os
+import zlib
+
+import httpx
+import pytest
+
+from app.core.http.media import IMMUTABLE_CACHE_CONTROL, REVALIDATE_CACHE_CONTROL, MediaFiles
+from app.core.middleware.compression import CompressionMiddleware
+
+pytestmark = pytest.mark.anyio
+
+CSS = b"body { color: red; }\n" * 100
+
+
+@pytest.fixture
+def media_dir(tmp_path):
+    (tmp_path / "style.css").write_bytes(CSS)
+    (tmp_path / "tiny.css").write_bytes(b"a{}")
+    (tmp_path / "logo.png").write_bytes(b"\x89PNG" + b"\0" * 2000)
+    (tmp_path / "app.3f2a9c1b.js").write_bytes(b"console.log(1);\n" * 100)
+    (tmp_path / "report-20240101.pdf").write_bytes(b"%PDF" + b"\0" * 100)
+    (tmp_path / "profile-1700000000.png").write_bytes(b"\x89PNG" + b"\0" * 100)
+    return tmp_path
+
+
+@pytest.fixture
+def media(media_dir):
+    return MediaFiles(media_dir, cache_max_bytes=1024 * 1024, cache_file_max_size=64 * 1024, compress_min_size=500)
+
+
+@pytest.fixture
+async def client(media):
+    # 운영과 같이 압축 미들웨어 안쪽에 둠 - 이미 압축된 응답을 다시 압축하지 않는지 같이 확인
+    app = CompressionMiddleware(media, min_size=500, level=6)
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as c:
+        yield c
+
+
+async def get_raw(client, path, **headers):
+    """Content-Encoding 을 풀지 않은 본문"""
+    async with client.stream("GET", path, headers=headers) as response:
+        return response, b"".join([chunk async for chunk in response.aiter_raw()])
+
+
+def write_gz(media_dir, name, data, mtime_offset=0):
+    target = media_dir / name
+    gz = media_dir / (name + ".gz")
+    gz.write_bytes(gzip.compress(data))
+    st = os.stat(target)
+    os.utime(gz, ns=(st.st_atime_ns, st.st_mtime_ns + mtime_offset))
+    return gz
+
+
+async def test_identity_response_has_validators_and_cache_headers(client):
+    response = await client.get("/style.css", headers={"accept-encoding": "identity"})
+
+    assert response.status_code == 200
+    assert response.content == CSS
+    assert "content-encoding" not in response.headers
+    assert response.headers["cache-control"] == REVALIDATE_CACHE_CONTROL.decode()
+    assert response.headers["accept-ranges"] == "bytes"
+    assert response.headers["vary"] == "Accept-Encoding"
+
+    again = await client.get(
+        "/style.css", headers={"accept-encoding": "identity", "if-none-match": response.headers["etag"]}
+    )
+    assert again.status_code == 304
+    assert again.headers["cache-control"] == REVALIDATE_CACHE_CONTROL.decode()
+
+
+async def test_hashed_name_is_immutable(client):
+    response = await client.get("/app.3f2a9c1b.js", headers={"accept-encoding": "gzip"})
+
+    assert response.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL.decode()
+    assert response.headers["content-encoding"] == "gzip"
+
+
+@pytest.mark.parametrize("path", ["/report-20240101.pdf", "/profile-1700000000.png"])
+async def test_numeric_suffix_is_not_treated_as_hash(client, path):
+    # 날짜 / 타임스탬프는 같은 이름으로 덮어쓸 수 있으므로 매번 재검증
+    response = await client.get(path)
+
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == REVALIDATE_CACHE_CONTROL.decode()
+
+
+async def test_precompressed_sibling_gets_same_cache_headers_and_304(client, media_dir):
+    gz = write_gz(media_dir, "style.css", CSS)
+
+    response, raw = await get_raw(client, "/style.css", **{"accept-encoding": "gzip, deflate"})
+
+    assert response.status_code == 200
+    assert raw == gz.read_bytes()
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["content-type"] == "text/css; charset=utf-8"
+    assert response.headers["cache-control"] == REVALIDATE_CACHE_CONTROL.decode()
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert "accept-ranges" not in response.headers
+    etag = response.headers["etag"]
+    assert not etag.startswith("W/")
+
+    again = await client.get("/style.css", headers={"accept-encoding": "gzip", "if-none-match": etag})
+    assert again.status_code == 304
+    assert again.headers["etag"] == etag
+    assert again.headers["cache-control"] == REVALIDATE_CACHE_CONTROL.decode()
+
+    # 원본용 ETag 로는 gzip 변형이 304 가 되지 않음
+    identity = await client.get("/style.css", headers={"accept-encoding": "identity"})
+    assert identity.headers["etag"] != etag
+    mismatch = await client.get("/style.css", headers={"accept-encoding": "gzip", "if-none-match": identity.headers["etag"]})
+    assert mismatch.status_code == 200
+
+
+async def test_stale_precompressed_sibling_is_ignored(client, media_dir):
+    write_gz(media_dir, "style.css", b"old content", mtime_offset=-10**9)
+
+    response = await client.get("/style.css", headers={"accept-encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.content == CSS
+
+
+async def test_encoded_variant_is_cached_per_encoding(client, media):
+    gzip_response, gzip_raw = await get_raw(client, "/style.css", **{"accept-encoding": "gzip"})
+    deflate_response, deflate_raw = await get_raw(client, "/style.css", **{"accept-encoding": "deflate"})
+
+    # 압축 미들웨어가 다시 압축하지 않음 (한 번만 풀면 원본)
+    assert gzip_response.headers.get_list("content-encoding") == ["gzip"]
+    assert gzip.decompress(gzip_raw) == CSS
+    assert deflate_response.headers.get_list("content-encoding") == ["deflate"]
+    assert zlib.decompress(deflate_raw) == CSS
+    assert gzip_response.headers["content-length"] == str(len(gzip_raw))
+    assert gzip_response.headers["etag"] != deflate_response.headers["etag"]
+
+    hits = media.cache.hits
+    _, again = await get_raw(client, "/style.css", **{"accept-encoding": "gzip"})
+    assert again == gzip_raw
+    assert media.cache.hits == hits + 1
+    assert media.cache.stats()["entries"] == 2
+
+    not_modified = await client.get(
+        "/style.css", headers={"accept-encoding": "gzip", "if-none-match": gzip_response.headers["etag"]}
+    )
+    assert not_modified.status_code == 304
+
+
+async def test_encoded_variant_is_rebuilt_when_file_changes(client, media_dir):
+    await client.get("/style.css", headers={"accept-encoding": "gzip"})
+    changed = b"p { margin: 0; }\n" * 100
+    (media_dir / "style.css").write_bytes(changed)
+    st = os.stat(media_dir / "style.css")
+    os.utime(media_dir / "style.css", ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+    response = await client.get("/style.css", headers={"accept-encoding": "gzip"})
+
+    assert response.content == changed
+
+
+async def test_range_request_gets_identity_bytes(client, media_dir):
+    write_gz(media_dir, "style.css", CSS)
+
+    response = await client.get("/style.css", headers={"accept-encoding": "gzip", "range": "bytes=0-9"})
+
+    assert response.status_code == 206
+    assert response.content == CSS[:10]
+    assert "content-encoding" not in response.headers
+    assert response.headers["content-range"] == f"bytes 0-9/{len(CSS)}"
+
+
+async def test_small_and_binary_files_are_not_encoded(client):
+    tiny = await client.get("/tiny.css", headers={"accept-encoding": "gzip"})
+    png = await client.get("/logo.png", headers={"accept-encoding": "gzip"})
+
+    assert "content-encoding" not in tiny.headers
+    assert "content-encoding" not in png.headers
+    assert "vary" not in png.headers
+
+
+async def test_head_reports_encoded_length_without_body(client):
+    response = await client.head("/style.css", headers={"accept-encoding": "gzip"})
+    full, raw = await get_raw(client, "/style.css", **{"accept-encoding": "gzip"})
+
+    assert response.status_code == 200
+    assert response.content == b""
+    assert response.headers["content-length"] == str(len(raw))
+    assert response.headers["etag"] == full.headers["etag"]
+
+
+async def test_paths_outside_media_are_not_found(client, media_dir):
+    (media_dir.parent / "secret.txt").write_bytes(b"secret")
+
+    assert (await client.get("/../secret.txt")).status_code == 404
+    assert (await client.get("/%2e%2e/secret.txt")).status_code == 404
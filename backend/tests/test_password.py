@@ -0,0 +1,47 @@
+# tests/test_password.py
+
+import pytest
+
+from app.core.security.password import PasswordService
+
+pytestmark = pytest.mark.anyio
+
+# 테스트가 빨리 끝나도록 작은 비용 파라미터
+PARAMS = {"time_cost": 1, "memory_cost": 1024, "parallelism": 1}
+
+
+@pytest.fixture
+def service():
+    service = PasswordService(workers=1, **PARAMS)
+    yield service
+    service.close()
+
+
+async def test_verify_and_update_keeps_hash_when_params_unchanged(service):
+    hashed = await service.hash("secret")
+
+    assert await service.verify_and_update("secret", hashed) == (True, None)
+    assert await service.verify_and_update("wrong", hashed) == (False, None)
+
+
+async def test_verify_and_update_rehashes_when_params_change(service):
+    hashed = await service.hash("secret")
+    stronger = PasswordService(workers=1, **{**PARAMS, "time_cost": 2})
+    try:
+        ok, new_hash = await stronger.verify_and_update("secret", hashed)
+        assert ok
+        assert new_hash is not None and new_hash != hashed
+        assert "t=2" in new_hash
+        # 새 해시는 새 파라미터로 다시 검증했을 때 더 바꿀 필요가 없음
+        assert await stronger.verify_and_update("secret", new_hash) == (True, None)
+    finally:
+        stronger.close()
+
+
+async def test_verify_and_update_rejects_wrong_password_with_old_params(service):
+    hashed = await service.hash("secret")
+    stronger = PasswordService(workers=1, **{**PARAMS, "memory_cost": 2048})
+    try:
+        assert await stronger.verify_and_update("wrong", hashed) == (False, None)
+    finally:
+        stronger.close()
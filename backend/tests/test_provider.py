@@ -0,0 +1,51 @@
+# tests/test_provider.py
+
+import uuid
+
+import pytest
+from sqlalchemy import event
+
+from conftest import create_user, make_token
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def checkouts(engine):
+    """풀에서 커넥션을 꺼낸 횟수"""
+    count = [0]
+
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        count[0] += 1
+
+    event.listen(engine.sync_engine, "checkout", on_checkout)
+    yield count
+    event.remove(engine.sync_engine, "checkout", on_checkout)
+
+
+@pytest.mark.parametrize(
+    "method, path",
+    [
+        ("POST", "/api/auth/logout"),
+        ("GET", "/api/gpt/gpt_setting/cache_stats"),
+    ],
+)
+async def test_db_free_requests_do_not_check_out_a_connection(client, checkouts, method, path):
+    client.cookies.set("access_token", make_token(1))
+
+    response = await client.request(method, path)
+
+    assert response.status_code == 200
+    assert checkouts[0] == 0
+
+
+async def test_request_using_db_checks_out_one_connection(client, checkouts):
+    user_id = await create_user()
+    checkouts[0] = 0
+    client.cookies.set("refresh_token", make_token(user_id, type="refresh", jti=uuid.uuid4().hex))
+
+    response = await client.post("/api/auth/refresh_token")
+
+    # 조회 + 폐기 insert 를 한 세션(커넥션 하나)에서 처리
+    assert response.status_code == 200
+    assert checkouts[0] == 1
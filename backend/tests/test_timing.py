@@ -0,0 +1,118 @@
+# tests/test_timing.py
+
+import re
+
+import pytest
+
+from app.core.config.settings import settings
+from app.core.database.base import SessionLocal
+from app.core.metrics.registry import http_request_db_queries, http_requests
+from app.core.middleware.timing_middleware import TimingMiddleware
+from app.module.gpt.gpt import GptJob
+from conftest import make_token
+
+pytestmark = pytest.mark.anyio
+
+JOB_ROUTE = "/api/gpt/jobs/{job_id}"
+
+
+def server_timing(response) -> dict:
+    """Server-Timing 헤더 -> {이름: (dur ms, desc)}"""
+    metrics = {}
+    for part in response.headers["server-timing"].split(","):
+        name, *params = [p.strip() for p in part.split(";")]
+        values = dict(p.split("=", 1) for p in params)
+        metrics[name] = (float(values["dur"]), values.get("desc", "").strip('"'))
+    return metrics
+
+
+async def create_job() -> int:
+    async with SessionLocal() as session:
+        job = GptJob(kind="ingest", status="done", stage="done")
+        session.add(job)
+        await session.flush()
+        job_id = job.id
+        await session.commit()
+    return job_id
+
+
+async def test_request_with_queries_reports_db_time(client):
+    job_id = await create_job()
+    client.cookies.set("access_token", make_token(1))
+
+    response = await client.get(f"/api/gpt/jobs/{job_id}")
+
+    assert response.status_code == 200
+    timing = server_timing(response)
+    db_ms, desc = timing["db"]
+    assert db_ms > 0
+    assert desc == "1 queries"
+    assert set(timing) == {"db", "pool", "upstream", "app"}
+
+
+async def test_request_without_queries_reports_zero_db(client):
+    response = await client.get("/metrics")
+
+    timing = server_timing(response)
+    assert timing["db"] == (0.0, "0 queries")
+    assert timing["upstream"] == (0.0, "0 calls")
+
+
+async def test_db_query_counter_uses_route_template(client):
+    client.cookies.set("access_token", make_token(1))
+    before = http_request_db_queries._values.get(("GET", JOB_ROUTE), 0)
+
+    for job_id in (101, 102, 103):
+        assert (await client.get(f"/api/gpt/jobs/{job_id}")).status_code == 404
+
+    # 실제 경로(/api/gpt/jobs/101)가 아니라 템플릿 하나로 집계
+    assert http_request_db_queries._values[("GET", JOB_ROUTE)] == before + 3
+    assert not any("/api/gpt/jobs/10" in route for _, route in http_request_db_queries._values)
+    assert http_requests._values[("GET", JOB_ROUTE, "404")] >= 3
+
+    body = (await client.get("/metrics")).text
+    line = re.search(r'^http_request_db_queries_total\{method="GET",route="/api/gpt/jobs/\{job_id\}"\} (\S+)$', body, re.M)
+    assert line is not None and float(line.group(1)) >= 3
+
+
+async def test_unmatched_route_is_labelled_unmatched(client):
+    await client.get("/no/such/path")
+
+    assert http_requests._values[("GET", "unmatched", "404")] >= 1
+
+
+async def test_server_timing_header_can_be_disabled():
+    seen = []
+
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    async def send(message):
+        seen.append(message)
+
+    scope = {"type": "http", "method": "GET", "path": "/", "root_path": "", "headers": []}
+    await TimingMiddleware(app, server_timing=False)(scope, None, send)
+
+    assert seen[0]["headers"] == []
+
+
+async def test_metrics_requires_token_when_configured(client, monkeypatch):
+    monkeypatch.setattr(settings.raw, "metrics_token", "scrape-token")
+
+    assert (await client.get("/metrics")).status_code == 401
+    assert (await client.get("/metrics", headers={"authorization": "Bearer wrong"})).status_code == 401
+    response = await client.get("/metrics", headers={"authorization": "Bearer scrape-token"})
+    assert response.status_code == 200
+    assert "http_requests_total" in response.text
+
+
+async def test_metrics_is_hidden_in_prod_without_token(client, monkeypatch):
+    monkeypatch.setattr(settings, "env", "prod")
+    monkeypatch.setattr(settings.raw, "metrics_token", None)
+
+    assert (await client.get("/metrics")).status_code == 404
+
+    monkeypatch.setattr(settings.raw, "metrics_token", "scrape-token")
+    response = await client.get("/metrics", headers={"authorization": "Bearer scrape-token"})
+    assert response.status_code == 200